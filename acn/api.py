@@ -49,6 +49,7 @@ from .infrastructure.persistence.postgres import (
     PostgresSubnetRepository,
     PostgresTaskRepository,
     get_engine,
+    get_read_session_factory,
     get_session_factory,
 )
 from .infrastructure.persistence.redis import RedisAgentRepository, RedisSubnetRepository
@@ -107,18 +108,26 @@ async def lifespan(app: FastAPI):
     _activity_repository = None
     if settings.database_url:
         logger.info("persistence_postgres", database_url=settings.database_url[:30] + "...")
-        _pg_engine = get_engine(settings.database_url)
+        _pg_engine = get_engine(
+            settings.database_url,
+            pool_size=settings.database_pool_size,
+            max_overflow=settings.database_max_overflow,
+        )
         _pg_session = get_session_factory(_pg_engine)
         agent_repository = PostgresAgentRepository(_pg_session, registry_instance.redis)
         subnet_repository = PostgresSubnetRepository(_pg_session)
         task_repository = PostgresTaskRepository(_pg_session, registry_instance.redis)
         _billing_repository = PostgresBillingRepository(_pg_session)
-        _activity_repository = PostgresActivityRepository(_pg_session)
+        _activity_repository = PostgresActivityRepository(
+            _pg_session, read_session_factory=get_read_session_factory(_pg_engine)
+        )
     else:
         logger.info("persistence_redis", reason="DATABASE_URL not set, using Redis fallback")
         agent_repository = RedisAgentRepository(registry_instance.redis)
         subnet_repository = RedisSubnetRepository(registry_instance.redis)
-        task_repository = RedisTaskRepository(registry_instance.redis)
+        task_repository = RedisTaskRepository(
+            registry_instance.redis, cache_ttl=settings.task_cache_ttl
+        )
 
     agent_service_instance = AgentService(
         agent_repository,
@@ -128,7 +137,11 @@ async def lifespan(app: FastAPI):
 
     router_instance = MessageRouter(registry_instance, registry_instance.redis)
     message_service_instance = MessageService(router_instance, agent_repository)
-    broadcast_instance = BroadcastService(router_instance, registry_instance.redis)
+    broadcast_instance = BroadcastService(
+        router_instance,
+        registry_instance.redis,
+        fanout_limit=settings.broadcast_fanout_limit,
+    )
     ws_manager_instance = WebSocketManager(
         registry_instance.redis,
         max_connections=settings.max_websocket_connections,
@@ -79,6 +79,8 @@ class Settings(BaseSettings):
 
     # PostgreSQL (for future persistent storage)
     database_url: str | None = None
+    database_pool_size: int = 20
+    database_max_overflow: int = 40
 
     # CORS
     cors_origins: list[str] = ["*"]
@@ -94,6 +96,14 @@ class Settings(BaseSettings):
     # Independent of dev_mode — operators can expose docs on staging while using prod auth
     enable_docs: bool = False  # Set to True for local development (ENABLE_DOCS=true)
 
+    # In-process TTL cache for task lookups (seconds; 0 = off). Only safe when a
+    # single ACN process writes tasks: other processes' writes are not seen until expiry.
+    task_cache_ttl: float = 0.0
+
+    # Max concurrent deliveries per parallel broadcast; keep at or below the
+    # router's shared httpx max_connections (200)
+    broadcast_fanout_limit: int = 64
+
     # WebSocket limits
     max_websocket_connections: int = 10_000
 
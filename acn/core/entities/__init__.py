@@ -13,6 +13,8 @@ from .task import (
     Task,
     TaskMode,
     TaskStatus,
+    filter_past_deadline,
+    filter_tasks_for_agent,
 )
 
 __all__ = [
@@ -26,4 +28,6 @@ __all__ = [
     "Task",
     "TaskMode",
     "TaskStatus",
+    "filter_past_deadline",
+    "filter_tasks_for_agent",
 ]
@@ -3,11 +3,18 @@
 Pure business logic for Task and Participation, independent of infrastructure.
 """
 
-from dataclasses import dataclass, field
+import sys
+from collections.abc import Callable, Collection, Iterable
+from dataclasses import MISSING, dataclass, field, fields
 from datetime import UTC, datetime
+from decimal import Decimal
 from enum import StrEnum
+from functools import lru_cache
+from typing import Any
 from uuid import uuid4
 
+import orjson
+
 
 class TaskMode(StrEnum):
     """Task mode"""
@@ -48,7 +55,88 @@ class ParticipationStatus(StrEnum):
     CANCELLED = "cancelled"  # Participant withdrew or timed out
 
 
-@dataclass
+# Statuses from which no further transition is allowed
+_PARTICIPATION_TERMINAL = frozenset({ParticipationStatus.COMPLETED, ParticipationStatus.CANCELLED})
+# Participations holding a slot against the task's active_participants_count
+_PARTICIPATION_ACTIVE = frozenset({ParticipationStatus.ACTIVE, ParticipationStatus.SUBMITTED})
+_TASK_INACTIVE = frozenset({TaskStatus.COMPLETED, TaskStatus.CANCELLED})
+
+_TASK_REQUIRED_FIELDS = ("task_id", "title", "creator_id")
+# Low-cardinality string fields, interned so loaded tasks share one copy
+_TASK_INTERNED_FIELDS = ("creator_type", "task_type", "reward_currency", "reward_unit")
+_TASK_DATETIME_FIELDS = ("assigned_at", "submitted_at", "created_at", "deadline", "completed_at")
+
+# Status transition tables: event → {current status → next status}.
+# A missing entry means the event is not allowed in that status.
+_PARTICIPATION_TRANSITIONS: dict[str, dict[ParticipationStatus, ParticipationStatus]] = {
+    "submit": {ParticipationStatus.ACTIVE: ParticipationStatus.SUBMITTED},
+    "complete": {ParticipationStatus.SUBMITTED: ParticipationStatus.COMPLETED},
+    "reject": {ParticipationStatus.SUBMITTED: ParticipationStatus.REJECTED},
+    "resubmit": {ParticipationStatus.REJECTED: ParticipationStatus.SUBMITTED},
+    "cancel": {
+        status: ParticipationStatus.CANCELLED
+        for status in ParticipationStatus
+        if status not in _PARTICIPATION_TERMINAL
+    },
+}
+
+_TASK_TRANSITIONS: dict[str, dict[TaskStatus, TaskStatus]] = {
+    "submit": {TaskStatus.IN_PROGRESS: TaskStatus.SUBMITTED},
+    "complete": {TaskStatus.SUBMITTED: TaskStatus.COMPLETED},
+    "reject": {TaskStatus.SUBMITTED: TaskStatus.REJECTED},
+    "cancel": {
+        status: TaskStatus.CANCELLED for status in TaskStatus if status != TaskStatus.COMPLETED
+    },
+    "reopen": {status: TaskStatus.OPEN for status in TaskStatus if status != TaskStatus.COMPLETED},
+}
+
+# Error messages for events whose only forbidden source status is COMPLETED
+_TASK_TRANSITION_ERRORS = {
+    "cancel": "Cannot cancel completed task",
+    "reopen": "Cannot reopen completed task",
+}
+
+
+def _artifacts_or_empty(current: list[dict], artifacts: list[dict] | None) -> list[dict]:
+    """Use the given artifacts, reusing ``current`` when it is already an empty list"""
+    if artifacts:
+        return artifacts
+    return current if not current else []
+
+
+def _isoformat(obj: Any, name: str) -> str | None:
+    """
+    ISO string for datetime attribute ``name``, memoized per instance.
+
+    The cache entry is keyed on the datetime object's identity, so assigning a
+    new value to the attribute never serves a stale string.
+    """
+    value = getattr(obj, name)
+    if value is None:
+        return None
+    cache = obj._iso_cache
+    if cache is None:
+        cache = obj._iso_cache = {}
+    hit = cache.get(name)
+    if hit is not None and hit[0] is value:
+        return hit[1]
+    iso = value.isoformat()
+    cache[name] = (value, iso)
+    return iso
+
+
+@lru_cache(maxsize=1024)
+def _money(amount: str) -> Decimal:
+    """Parse a money string to Decimal; amounts repeat heavily, so parses are cached"""
+    return Decimal(amount)
+
+
+def _budget_step(reward: Decimal, budget: Decimal, released: Decimal) -> tuple[Decimal, bool]:
+    """One reward release: (new released amount, whether the remaining budget covers it)"""
+    return released + reward, budget - released >= reward
+
+
+@dataclass(slots=True)
 class Participation:
     """
     Participation — tracks one participant's lifecycle within a multi-participant task.
@@ -56,6 +144,9 @@ class Participation:
     Each participant independently goes through:
         active → submitted → completed / rejected → (cancelled)
     The parent Task stays OPEN while participations are active.
+
+    Slotted: busy multi-participant tasks create many of these, and slots
+    drop the per-instance __dict__.
     """
 
     participation_id: str
@@ -87,113 +178,135 @@ class Participation:
     completed_at: datetime | None = None
     cancelled_at: datetime | None = None
 
+    # Memoized ISO strings for to_dict (see _isoformat)
+    _iso_cache: dict | None = field(default=None, init=False, repr=False, compare=False)
+
+    @staticmethod
+    def _clock() -> datetime:
+        """Current UTC time for lifecycle timestamps; patch for a fixed clock"""
+        return datetime.now(UTC)
+
     def submit(self, submission: str, artifacts: list[dict] | None = None) -> None:
         """Submit work for this participation"""
-        if self.status != ParticipationStatus.ACTIVE:
-            raise ValueError(f"Cannot submit in status: {self.status}")
+        target = self._next_status("submit")
         self.submission = submission
-        self.submission_artifacts = artifacts or []
-        self.submitted_at = datetime.now(UTC)
-        self.status = ParticipationStatus.SUBMITTED
+        self.submission_artifacts = _artifacts_or_empty(self.submission_artifacts, artifacts)
+        self.submitted_at = self._clock()
+        self.status = target
 
     def complete(self, reviewer_id: str | None = None, notes: str | None = None) -> None:
         """Mark participation as completed (approved)"""
-        if self.status != ParticipationStatus.SUBMITTED:
-            raise ValueError(f"Cannot complete in status: {self.status}")
+        target = self._next_status("complete")
         self.reviewed_by = reviewer_id
         self.review_notes = notes
-        self.completed_at = datetime.now(UTC)
-        self.status = ParticipationStatus.COMPLETED
+        self.completed_at = self._clock()
+        self.status = target
 
     def reject(self, reviewer_id: str | None = None, reason: str | None = None) -> None:
         """Reject this participation's submission"""
-        if self.status != ParticipationStatus.SUBMITTED:
-            raise ValueError(f"Cannot reject in status: {self.status}")
+        target = self._next_status("reject")
         self.reviewed_by = reviewer_id
         self.rejection_reason = reason
-        self.rejected_at = datetime.now(UTC)
-        self.status = ParticipationStatus.REJECTED
+        self.rejected_at = self._clock()
+        self.status = target
 
     def cancel(self) -> None:
         """Cancel this participation (withdraw)"""
-        if self.status in (ParticipationStatus.COMPLETED, ParticipationStatus.CANCELLED):
-            raise ValueError(f"Cannot cancel in status: {self.status}")
-        self.cancelled_at = datetime.now(UTC)
-        self.status = ParticipationStatus.CANCELLED
+        target = self._next_status("cancel")
+        self.cancelled_at = self._clock()
+        self.status = target
 
     def resubmit(self, submission: str, artifacts: list[dict] | None = None) -> None:
         """Resubmit after rejection"""
-        if self.status != ParticipationStatus.REJECTED:
-            raise ValueError(f"Cannot resubmit in status: {self.status}")
+        target = self._next_status("resubmit")
         self.submission = submission
-        self.submission_artifacts = artifacts or []
-        self.submitted_at = datetime.now(UTC)
+        self.submission_artifacts = _artifacts_or_empty(self.submission_artifacts, artifacts)
+        self.submitted_at = self._clock()
         self.rejection_reason = None
         self.rejected_at = None
         self.reject_response_deadline = None
         self.review_request_id = None
         self.review_notes = None
         self.reviewed_by = None
-        self.status = ParticipationStatus.SUBMITTED
+        self.status = target
+
+    def _next_status(self, event: str) -> ParticipationStatus:
+        """
+        Resolve the status ``event`` leads to from the current status
+
+        Raises:
+            ValueError: If the event is not allowed in the current status
+        """
+        target = _PARTICIPATION_TRANSITIONS[event].get(self.status)
+        if target is None:
+            raise ValueError(f"Cannot {event} in status: {self.status}")
+        return target
+
+    def is_active(self) -> bool:
+        """Check if participation counts as active (joined or awaiting review)"""
+        return self.status in _PARTICIPATION_ACTIVE
 
     # ========== Serialization ==========
 
-    def to_dict(self) -> dict:
-        """Convert to dictionary for serialization"""
-        return {
+    def to_dict(self, exclude_none: bool = False) -> dict:
+        """
+        Convert to dictionary for serialization
+
+        Args:
+            exclude_none: Omit fields whose value is None (absent keys fall back
+                to dataclass defaults in from_dict)
+        """
+        data = {
             "participation_id": self.participation_id,
             "task_id": self.task_id,
             "participant_id": self.participant_id,
             "participant_name": self.participant_name,
             "participant_type": self.participant_type,
-            "status": self.status.value,
-            "joined_at": self.joined_at.isoformat(),
+            "status": self.status,  # StrEnum is a str; serializes as its value
+            "joined_at": _isoformat(self, "joined_at"),
             "submission": self.submission,
             "submission_artifacts": self.submission_artifacts,
-            "submitted_at": self.submitted_at.isoformat() if self.submitted_at else None,
+            "submitted_at": _isoformat(self, "submitted_at"),
             "rejection_reason": self.rejection_reason,
-            "rejected_at": self.rejected_at.isoformat() if self.rejected_at else None,
-            "reject_response_deadline": (
-                self.reject_response_deadline.isoformat() if self.reject_response_deadline else None
-            ),
+            "rejected_at": _isoformat(self, "rejected_at"),
+            "reject_response_deadline": _isoformat(self, "reject_response_deadline"),
             "review_request_id": self.review_request_id,
             "review_notes": self.review_notes,
             "reviewed_by": self.reviewed_by,
-            "completed_at": self.completed_at.isoformat() if self.completed_at else None,
-            "cancelled_at": self.cancelled_at.isoformat() if self.cancelled_at else None,
+            "completed_at": _isoformat(self, "completed_at"),
+            "cancelled_at": _isoformat(self, "cancelled_at"),
         }
+        if exclude_none:
+            return {k: v for k, v in data.items() if v is not None}
+        return data
+
+    def to_bytes(self) -> bytes:
+        """Serialize to JSON-encoded bytes"""
+        return orjson.dumps(self.to_dict())
+
+    @classmethod
+    def from_bytes(cls, raw: bytes | str) -> "Participation":
+        """Create Participation from JSON-encoded bytes"""
+        return cls.from_dict(orjson.loads(raw))
 
     @classmethod
     def from_dict(cls, data: dict) -> "Participation":
-        """Create Participation from dictionary"""
-        data = data.copy()
-
-        # Parse enum
-        if isinstance(data.get("status"), str):
-            data["status"] = ParticipationStatus(data["status"])
-
-        # Parse datetime fields
-        datetime_fields = [
-            "joined_at",
-            "submitted_at",
-            "rejected_at",
-            "reject_response_deadline",
-            "completed_at",
-            "cancelled_at",
-        ]
-        for field_name in datetime_fields:
-            if data.get(field_name) and isinstance(data[field_name], str):
-                data[field_name] = datetime.fromisoformat(data[field_name])
-            elif not data.get(field_name):
-                data.pop(field_name, None)
-
-        # Parse list fields
-        if isinstance(data.get("submission_artifacts"), str):
-            import json
-
-            data["submission_artifacts"] = json.loads(data["submission_artifacts"])
-
-        return cls(**data)
+        """Create Participation from dictionary (the input dict is not copied or mutated)"""
+        obj = cls.__new__(cls)
+        _hydrate_participation(obj, data)
+        return obj
+
+    @classmethod
+    def from_dict_many(cls, rows: Iterable[dict]) -> list["Participation"]:
+        """Create Participations from many dictionaries (bulk repository loads)"""
+        new = cls.__new__
+        hydrate = _hydrate_participation
+        out = []
+        for data in rows:
+            obj = new(cls)
+            hydrate(obj, data)
+            out.append(obj)
+        return out
 
     @staticmethod
     def new_id() -> str:
@@ -201,7 +314,7 @@ class Participation:
         return str(uuid4())
 
 
-@dataclass
+@dataclass(slots=True)
 class Task:
     """
     Task Domain Entity
@@ -212,6 +325,8 @@ class Task:
     - ASSIGNED: Assigned to a specific agent
 
     Integrates with AP2 for payment handling.
+
+    Slotted like Participation: listings and matching hydrate tasks in bulk.
     """
 
     task_id: str
@@ -273,21 +388,39 @@ class Task:
     completed_at: datetime | None = None
 
     # Approval settings
-    approval_type: str = "manual"  # manual, auto, validator, webhook
+    approval_type: ApprovalType = ApprovalType.MANUAL
     validator_id: str | None = None  # For validator type: invite_agent, daily_checkin, etc.
 
     # Metadata
     metadata: dict = field(default_factory=dict)
 
+    # Memoized ISO strings for to_dict (see _isoformat)
+    _iso_cache: dict | None = field(default=None, init=False, repr=False, compare=False)
+
+    @staticmethod
+    def _clock() -> datetime:
+        """Current UTC time for lifecycle timestamps; patch for a fixed clock"""
+        return datetime.now(UTC)
+
     def __post_init__(self):
         """Validate invariants and sync backward-compat flags"""
-        if not self.task_id:
-            raise ValueError("task_id cannot be empty")
-        if not self.title:
-            raise ValueError("title cannot be empty")
-        if not self.creator_id:
-            raise ValueError("creator_id cannot be empty")
-
+        # Single branch on the happy path; find the offending field only on failure
+        if not (self.task_id and self.title and self.creator_id):
+            for name in _TASK_REQUIRED_FIELDS:
+                if not getattr(self, name):
+                    raise ValueError(f"{name} cannot be empty")
+        # Callers may still pass the plain string value
+        if type(self.approval_type) is not ApprovalType:
+            self.approval_type = _parse_approval_type(self.approval_type)
+        # Low-cardinality strings (_TASK_INTERNED_FIELDS) share one copy
+        self.creator_type = _intern(self.creator_type)
+        self.task_type = _intern(self.task_type)
+        self.reward_currency = _intern(self.reward_currency)
+        self.reward_unit = _intern(self.reward_unit)
+        self._sync_compat_flags()
+
+    def _sync_compat_flags(self) -> None:
+        """Keep is_repeatable and is_multi_participant consistent"""
         # Backward compat: is_repeatable=True from old API consumers → enable is_multi_participant
         if self.is_repeatable and not self.is_multi_participant:
             self.is_multi_participant = True
@@ -355,7 +488,7 @@ class Task:
 
         self.assignee_id = agent_id
         self.assignee_name = agent_name
-        self.assigned_at = datetime.now(UTC)
+        self.assigned_at = self._clock()
         self.status = TaskStatus.IN_PROGRESS
 
     def submit(self, submission: str, artifacts: list[dict] | None = None) -> None:
@@ -369,13 +502,12 @@ class Task:
         Raises:
             ValueError: If task is not in progress
         """
-        if self.status != TaskStatus.IN_PROGRESS:
-            raise ValueError(f"Cannot submit in status: {self.status}")
+        target = self._next_status("submit")
 
         self.submission = submission
-        self.submission_artifacts = artifacts or []
-        self.submitted_at = datetime.now(UTC)
-        self.status = TaskStatus.SUBMITTED
+        self.submission_artifacts = _artifacts_or_empty(self.submission_artifacts, artifacts)
+        self.submitted_at = self._clock()
+        self.status = target
 
     def complete(self, reviewer_id: str | None = None, notes: str | None = None) -> None:
         """
@@ -388,30 +520,38 @@ class Task:
         Raises:
             ValueError: If task is not submitted or budget insufficient
         """
-        if self.status != TaskStatus.SUBMITTED:
-            raise ValueError(f"Cannot complete in status: {self.status}")
-
-        # Check budget before releasing reward
-        if float(self.total_budget) > 0 and not self.can_release_reward():
-            raise ValueError("Insufficient budget to release reward")
-
-        self.reviewed_by = reviewer_id
-        self.review_notes = notes
-        self.completed_at = datetime.now(UTC)
+        target = self._next_status("complete")
+
+        # Check budget before releasing reward (money strings are parsed once)
+        budget = _money(self.total_budget)
+        if budget > 0:
+            new_released, covered = _budget_step(
+                _money(self.reward_amount), budget, _money(self.released_amount)
+            )
+            if not covered:
+                raise ValueError("Insufficient budget to release reward")
+
+        self.completed_at = self._clock()
         self.completed_count += 1
 
         # Release reward from budget
-        if float(self.total_budget) > 0:
-            self.release_reward()
-
-        self.status = TaskStatus.COMPLETED
+        if budget > 0:
+            self.released_amount = str(new_released)
 
         # For multi-participant tasks, reset to open after completion
         # (single-participant repeatable tasks go through this same path via is_multi_participant)
-        if self.is_multi_participant and self.mode == TaskMode.OPEN:
-            # Check max completions
-            if self.max_completions is None or self.completed_count < self.max_completions:
-                self._reset_for_next_completion()
+        if (
+            self.is_multi_participant
+            and self.mode == TaskMode.OPEN
+            and (self.max_completions is None or self.completed_count < self.max_completions)
+        ):
+            # The reset clears status and reviewer fields, so don't write them first
+            self._reset_for_next_completion()
+            return
+
+        self.reviewed_by = reviewer_id
+        self.review_notes = notes
+        self.status = target
 
     def _reset_for_next_completion(self) -> None:
         """Reset task state for next completion (repeatable tasks)"""
@@ -420,7 +560,7 @@ class Task:
         self.assignee_name = None
         self.assigned_at = None
         self.submission = None
-        self.submission_artifacts = []
+        self.submission_artifacts = _artifacts_or_empty(self.submission_artifacts, None)
         self.submitted_at = None
         self.review_notes = None
         self.reviewed_by = None
@@ -437,12 +577,11 @@ class Task:
         Raises:
             ValueError: If task is not submitted
         """
-        if self.status != TaskStatus.SUBMITTED:
-            raise ValueError(f"Cannot reject in status: {self.status}")
+        target = self._next_status("reject")
 
         self.reviewed_by = reviewer_id
         self.review_notes = notes
-        self.status = TaskStatus.REJECTED
+        self.status = target
 
     def cancel(self) -> None:
         """
@@ -451,10 +590,7 @@ class Task:
         Raises:
             ValueError: If task is already completed
         """
-        if self.status == TaskStatus.COMPLETED:
-            raise ValueError("Cannot cancel completed task")
-
-        self.status = TaskStatus.CANCELLED
+        self.status = self._next_status("cancel")
 
     def reopen(self) -> None:
         """
@@ -463,12 +599,22 @@ class Task:
         Raises:
             ValueError: If task is completed
         """
-        if self.status == TaskStatus.COMPLETED:
-            raise ValueError("Cannot reopen completed task")
-
-        self.status = TaskStatus.OPEN
+        self.status = self._next_status("reopen")
         # Don't clear assignee for ASSIGNED mode tasks
 
+    def _next_status(self, event: str) -> TaskStatus:
+        """
+        Resolve the status ``event`` leads to from the current status
+
+        Raises:
+            ValueError: If the event is not allowed in the current status
+        """
+        target = _TASK_TRANSITIONS[event].get(self.status)
+        if target is None:
+            message = _TASK_TRANSITION_ERRORS.get(event, f"Cannot {event} in status: {self.status}")
+            raise ValueError(message)
+        return target
+
     # ========== Queries ==========
 
     def is_open(self) -> bool:
@@ -481,45 +627,79 @@ class Task:
 
     def is_active(self) -> bool:
         """Check if task is active (not completed/cancelled)"""
-        return self.status not in [TaskStatus.COMPLETED, TaskStatus.CANCELLED]
+        return self.status not in _TASK_INACTIVE
 
     def has_payment(self) -> bool:
         """Check if task has associated payment"""
         return self.payment_task_id is not None
 
     def remaining_budget(self) -> float:
-        """Get remaining budget"""
-        return float(self.total_budget) - float(self.released_amount)
+        """Get remaining budget (computed exactly, returned as float for escrow APIs)"""
+        return float(_money(self.total_budget) - _money(self.released_amount))
 
     def can_release_reward(self) -> bool:
         """Check if there's enough budget to release reward"""
-        return self.remaining_budget() >= float(self.reward_amount)
+        _, covered = _budget_step(
+            _money(self.reward_amount), _money(self.total_budget), _money(self.released_amount)
+        )
+        return covered
 
     def release_reward(self) -> None:
         """Release reward for one completion, updating released_amount"""
-        reward = float(self.reward_amount)
-        released = float(self.released_amount)
-        self.released_amount = str(released + reward)
+        new_released, _ = _budget_step(
+            _money(self.reward_amount), _money(self.total_budget), _money(self.released_amount)
+        )
+        self.released_amount = str(new_released)
+
+    def is_past_deadline(self, now: datetime | None = None) -> bool:
+        """
+        Check if task is past deadline
 
-    def is_past_deadline(self) -> bool:
-        """Check if task is past deadline"""
-        if not self.deadline:
+        Args:
+            now: Reference time (UTC); pass one value when checking many tasks
+        """
+        if self.deadline is None:
             return False
-        return datetime.now(UTC) > self.deadline
+        return (now or self._clock()) > self.deadline
 
-    def matches_skills(self, agent_skills: list[str]) -> bool:
-        """Check if agent has required skills"""
-        if not self.required_skills:
-            return True
-        return all(skill in agent_skills for skill in self.required_skills)
+    def matches_skills(self, agent_skills: Collection[str]) -> bool:
+        """
+        Check if agent has required skills
+
+        Args:
+            agent_skills: Agent's skills; pass a set/frozenset when matching
+                many tasks to avoid re-hashing the list on every call
+        """
+        if not isinstance(agent_skills, set | frozenset):
+            agent_skills = set(agent_skills)
+        return self.matches_skills_set(agent_skills)
+
+    def matches_skills_set(self, agent_skills: set[str] | frozenset[str]) -> bool:
+        """Check required skills against an agent skill set the caller already built"""
+        return not self.required_skills or agent_skills.issuperset(self.required_skills)
 
     # ========== Serialization ==========
 
-    def to_dict(self) -> dict:
-        """Convert to dictionary for serialization"""
+    def to_dict(self, exclude_none: bool = False) -> dict:
+        """
+        Convert to dictionary for serialization
+
+        Args:
+            exclude_none: Omit fields whose value is None (absent keys fall back
+                to dataclass defaults in from_dict)
+        """
+        data = self.to_orjson_dict()
+        for name in _TASK_DATETIME_FIELDS:
+            data[name] = _isoformat(self, name)
+        if exclude_none:
+            return {k: v for k, v in data.items() if v is not None}
+        return data
+
+    def to_orjson_dict(self) -> dict:
+        """Same keys as to_dict(), but datetimes are left for orjson to encode"""
         return {
             "task_id": self.task_id,
-            "mode": self.mode.value,
+            "mode": self.mode,  # StrEnum is a str; serializes as its value
             "creator_type": self.creator_type,
             "creator_id": self.creator_id,
             "creator_name": self.creator_name,
@@ -527,13 +707,13 @@ class Task:
             "description": self.description,
             "task_type": self.task_type,
             "required_skills": self.required_skills,
-            "status": self.status.value,
+            "status": self.status,
             "assignee_id": self.assignee_id,
             "assignee_name": self.assignee_name,
-            "assigned_at": self.assigned_at.isoformat() if self.assigned_at else None,
+            "assigned_at": self.assigned_at,
             "submission": self.submission,
             "submission_artifacts": self.submission_artifacts,
-            "submitted_at": self.submitted_at.isoformat() if self.submitted_at else None,
+            "submitted_at": self.submitted_at,
             "review_notes": self.review_notes,
             "reviewed_by": self.reviewed_by,
             "reward_amount": self.reward_amount,
@@ -548,35 +728,177 @@ class Task:
             "completed_count": self.completed_count,
             "max_completions": self.max_completions,
             "active_participants_count": self.active_participants_count,
-            "created_at": self.created_at.isoformat(),
-            "deadline": self.deadline.isoformat() if self.deadline else None,
-            "completed_at": self.completed_at.isoformat() if self.completed_at else None,
+            "created_at": self.created_at,
+            "deadline": self.deadline,
+            "completed_at": self.completed_at,
             "approval_type": self.approval_type,
             "validator_id": self.validator_id,
             "metadata": self.metadata,
         }
 
+    def to_bytes(self) -> bytes:
+        """Serialize to JSON-encoded bytes"""
+        return orjson.dumps(self.to_orjson_dict())
+
+    @classmethod
+    def from_bytes(cls, raw: bytes | str) -> "Task":
+        """Create Task from JSON-encoded bytes"""
+        return cls.from_dict(orjson.loads(raw))
+
     @classmethod
     def from_dict(cls, data: dict) -> "Task":
-        """Create Task from dictionary"""
-        data = data.copy()
-
-        # Parse enums
-        if isinstance(data.get("mode"), str):
-            data["mode"] = TaskMode(data["mode"])
-        if isinstance(data.get("status"), str):
-            data["status"] = TaskStatus(data["status"])
-
-        # Parse datetime strings
-        datetime_fields = [
-            "assigned_at",
-            "submitted_at",
-            "created_at",
-            "deadline",
-            "completed_at",
-        ]
-        for field_name in datetime_fields:
-            if data.get(field_name) and isinstance(data[field_name], str):
-                data[field_name] = datetime.fromisoformat(data[field_name])
-
-        return cls(**data)
+        """
+        Create Task from dictionary (the input dict is not copied or mutated)
+
+        Intended for trusted, previously persisted data: invariant validation
+        from __post_init__ is skipped, only the backward-compat flags are synced.
+        Construct Task(...) directly for user-supplied input.
+        """
+        obj = cls.__new__(cls)
+        _hydrate_task(obj, data)
+        obj._sync_compat_flags()
+        return obj
+
+
+def filter_tasks_for_agent(tasks: Iterable[Task], agent_skills: Collection[str]) -> list[Task]:
+    """Return the tasks whose required skills are all covered by ``agent_skills``"""
+    skill_set = frozenset(agent_skills)
+    return [task for task in tasks if task.matches_skills_set(skill_set)]
+
+
+def filter_past_deadline(tasks: Iterable[Task], now: datetime | None = None) -> list[Task]:
+    """Return the tasks whose deadline has passed, sampling the clock once"""
+    now = now or Task._clock()
+    return [task for task in tasks if task.is_past_deadline(now)]
+
+
+# ========== Dict Hydration ==========
+#
+# from_dict builds a bare instance and assigns fields directly instead of
+# copying the input and re-packing it into ``cls(**data)`` kwargs. The
+# assignment code is generated once per class (as dataclasses does for
+# __init__), so hydration runs straight-line code with no per-field loop.
+
+
+@lru_cache(maxsize=4096)
+def _parse_iso(value: str) -> datetime:
+    """Parse an ISO timestamp; cached since reloading the same rows repeats them"""
+    return datetime.fromisoformat(value)
+
+
+def _parse_datetime(value: Any) -> Any:
+    """Parse an ISO timestamp; empty values fall back to the field default"""
+    if not value:
+        return MISSING
+    return _parse_iso(value) if isinstance(value, str) else value
+
+
+def _intern(value: Any) -> Any:
+    """Intern plain strings; other values (and str subclasses) pass through"""
+    return sys.intern(value) if type(value) is str else value
+
+
+def _parse_json(value: Any) -> Any:
+    """Decode JSON-encoded container fields (as stored in Redis hashes)"""
+    if not isinstance(value, str):
+        return value
+    # Most rows carry empty containers; skip the decoder for those
+    if value == "[]":
+        return []
+    if value == "{}":
+        return {}
+    return orjson.loads(value)
+
+
+def _enum_parser(enum_cls: type[StrEnum]) -> Callable[[Any], Any]:
+    """
+    Value → member lookup via a prebuilt dict, bypassing EnumType.__call__.
+
+    Members hash like their string values, so already-parsed members resolve too;
+    unknown values defer to the enum constructor to raise its usual ValueError.
+    """
+    by_value = {member.value: member for member in enum_cls}
+
+    def parse(value: Any) -> Any:
+        member = by_value.get(value)
+        return member if member is not None else enum_cls(value)
+
+    return parse
+
+
+_parse_approval_type = _enum_parser(ApprovalType)
+
+
+def _compile_hydrator(
+    cls: type, converters: dict[str, Callable[[Any], Any]]
+) -> Callable[[Any, dict], None]:
+    """
+    Generate ``hydrate(obj, data)`` assigning every dataclass field of ``cls``.
+
+    Unknown keys are ignored; missing keys (or values a converter maps to
+    MISSING) take the dataclass default. The generated function raises
+    TypeError if a field without a default is missing.
+    """
+    ns: dict[str, Any] = {"MISSING": MISSING}
+    lines = ["def hydrate(obj, data):", "    get = data.get"]
+    for f in fields(cls):
+        name = f.name
+        if not f.init:
+            # Internal state (e.g. caches) is never read from input
+            ns[f"default_{name}"] = f.default
+            lines.append(f"    obj.{name} = default_{name}")
+            continue
+        lines.append(f"    v = get({name!r}, MISSING)")
+        if name in converters:
+            ns[f"conv_{name}"] = converters[name]
+            lines.append(f"    if v is not MISSING: v = conv_{name}(v)")
+        if f.default is not MISSING:
+            ns[f"default_{name}"] = f.default
+            fallback = f"default_{name}"
+        elif f.default_factory is list:
+            fallback = "[]"
+        elif f.default_factory is dict:
+            fallback = "{}"
+        elif f.default_factory is not MISSING:
+            ns[f"factory_{name}"] = f.default_factory
+            fallback = f"factory_{name}()"
+        else:
+            lines.append("    if v is MISSING:")
+            message = f"{cls.__name__} missing required field: {name!r}"
+            lines.append(f"        raise TypeError({message!r})")
+            lines.append(f"    obj.{name} = v")
+            continue
+        lines.append(f"    obj.{name} = {fallback} if v is MISSING else v")
+
+    exec("\n".join(lines), ns)  # source is built from dataclass field names only
+    return ns["hydrate"]
+
+
+_hydrate_participation = _compile_hydrator(
+    Participation,
+    {
+        "status": _enum_parser(ParticipationStatus),
+        "joined_at": _parse_datetime,
+        "submitted_at": _parse_datetime,
+        "rejected_at": _parse_datetime,
+        "reject_response_deadline": _parse_datetime,
+        "completed_at": _parse_datetime,
+        "cancelled_at": _parse_datetime,
+        "submission_artifacts": _parse_json,
+    },
+)
+
+_hydrate_task = _compile_hydrator(
+    Task,
+    {
+        "mode": _enum_parser(TaskMode),
+        "status": _enum_parser(TaskStatus),
+        "approval_type": _parse_approval_type,
+        **dict.fromkeys(_TASK_INTERNED_FIELDS, _intern),
+        "assigned_at": _parse_datetime,
+        "submitted_at": _parse_datetime,
+        "created_at": _parse_datetime,
+        "deadline": _parse_datetime,
+        "completed_at": _parse_datetime,
+    },
+)
@@ -3,11 +3,11 @@
 Defines contract for activity event persistence operations.
 """
 
-from abc import ABC, abstractmethod
-from typing import Any
+from abc import abstractmethod
+from typing import Any, Protocol
 
 
-class IActivityRepository(ABC):
+class IActivityRepository(Protocol):
     """
     Abstract interface for Activity persistence.
 
@@ -31,6 +31,16 @@ class IActivityRepository(ABC):
         """Persist an activity event"""
         pass
 
+    @abstractmethod
+    async def save_many(self, events: list[dict[str, Any]]) -> None:
+        """
+        Persist several activity events in one round trip
+
+        Each event is a dict of save() keyword arguments. Events whose
+        event_id already exists are skipped, as in save().
+        """
+        pass
+
     @abstractmethod
     async def find_recent(
         self,
@@ -58,5 +68,11 @@ class IActivityRepository(ABC):
     async def find_by_agents(
         self, agent_ids: list[str], limit: int = 20
     ) -> list[dict[str, Any]]:
-        """Find activities for multiple agents (merged, deduplicated)"""
+        """
+        Find activities for multiple agents (merged, deduplicated)
+
+        Implementations must answer with a single backend query rather than
+        calling find_by_agent per id, returning at most ``limit`` events
+        across all agents, newest first.
+        """
         pass
@@ -3,12 +3,13 @@
 Defines contract for agent persistence operations.
 """
 
-from abc import ABC, abstractmethod
+from abc import abstractmethod
+from typing import Protocol
 
 from ..entities import Agent
 
 
-class IAgentRepository(ABC):
+class IAgentRepository(Protocol):
     """
     Abstract interface for Agent persistence
 
@@ -39,6 +40,19 @@ class IAgentRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def find_by_ids(self, agent_ids: list[str]) -> dict[str, Agent]:
+        """
+        Find several agents by ID in one backend round trip
+
+        Args:
+            agent_ids: Agent identifiers
+
+        Returns:
+            Mapping of agent_id to Agent for the ids that exist
+        """
+        pass
+
     @abstractmethod
     async def find_by_owner_and_endpoint(self, owner: str, endpoint: str) -> Agent | None:
         """
@@ -76,6 +90,19 @@ class IAgentRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def find_by_subnets(self, subnet_ids: list[str]) -> dict[str, list[Agent]]:
+        """
+        Find the agents of several subnets in one backend round trip
+
+        Args:
+            subnet_ids: Subnet identifiers
+
+        Returns:
+            Mapping of subnet_id to its agents (empty list for unknown subnets)
+        """
+        pass
+
     @abstractmethod
     async def find_by_skills(self, skills: list[str], status: str = "online") -> list[Agent]:
         """
@@ -129,6 +156,19 @@ class IAgentRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def exists_many(self, agent_ids: list[str]) -> set[str]:
+        """
+        Check which agents exist in one backend round trip
+
+        Args:
+            agent_ids: Agent identifiers
+
+        Returns:
+            Set of agent_ids that exist
+        """
+        pass
+
     @abstractmethod
     async def count_by_subnet(self, subnet_id: str) -> int:
         """
@@ -142,6 +182,19 @@ class IAgentRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def count_by_subnets(self, subnet_ids: list[str]) -> dict[str, int]:
+        """
+        Count agents in several subnets in one backend round trip
+
+        Args:
+            subnet_ids: Subnet identifiers
+
+        Returns:
+            Mapping of subnet_id to agent count (0 for unknown subnets)
+        """
+        pass
+
     @abstractmethod
     async def find_by_api_key(self, api_key: str) -> Agent | None:
         """
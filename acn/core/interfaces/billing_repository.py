@@ -3,12 +3,13 @@
 Defines contract for billing transaction persistence operations.
 """
 
-from abc import ABC, abstractmethod
+from abc import abstractmethod
+from typing import Protocol
 
 from ...services.billing_service import BillingTransaction, BillingTransactionStatus
 
 
-class IBillingRepository(ABC):
+class IBillingRepository(Protocol):
     """
     Abstract interface for BillingTransaction persistence.
 
@@ -46,16 +47,16 @@ class IBillingRepository(ABC):
         pass
 
     @abstractmethod
-    async def record_network_fee(self, transaction_id: str, amount: float) -> None:
-        """Record network fee for a transaction"""
+    async def record_network_fee(self, transaction_id: str, amount_micros: int) -> None:
+        """Record network fee (in integer micro-credits) for a transaction"""
         pass
 
     @abstractmethod
-    async def reverse_network_fee(self, transaction_id: str, amount: float) -> None:
+    async def reverse_network_fee(self, transaction_id: str, amount_micros: int) -> None:
         """Reverse a previously recorded network fee (for refunds)"""
         pass
 
     @abstractmethod
-    async def get_total_network_fees(self) -> float:
-        """Get total accumulated network fees"""
+    async def get_total_network_fees(self) -> int:
+        """Get total accumulated network fees in integer micro-credits"""
         pass
@@ -3,12 +3,13 @@
 Defines contract for subnet persistence operations.
 """
 
-from abc import ABC, abstractmethod
+from abc import abstractmethod
+from typing import Protocol
 
 from ..entities import Subnet
 
 
-class ISubnetRepository(ABC):
+class ISubnetRepository(Protocol):
     """
     Abstract interface for Subnet persistence
 
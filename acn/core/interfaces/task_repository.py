@@ -3,12 +3,14 @@
 Defines contract for task persistence operations.
 """
 
-from abc import ABC, abstractmethod
+from abc import abstractmethod
+from collections.abc import AsyncIterator
+from typing import Protocol
 
 from ..entities import Participation, Task, TaskMode, TaskStatus
 
 
-class ITaskRepository(ABC):
+class ITaskRepository(Protocol):
     """
     Abstract interface for Task persistence
 
@@ -22,11 +24,47 @@ class ITaskRepository(ABC):
         """Save or update a task"""
         pass
 
+    @abstractmethod
+    async def save_many(self, tasks: list[Task]) -> None:
+        """
+        Save or update several tasks
+
+        Same effect as calling save() for each task, but batched: bulk callers
+        should not await save() in a loop.
+        """
+        pass
+
+    @abstractmethod
+    async def save_if_changed(self, task: Task) -> bool:
+        """
+        Save a task only if it differs from the stored copy
+
+        For read-modify-save loops that often end up re-persisting an
+        unchanged task.
+
+        Returns:
+            True if the task was written, False if the stored copy was identical
+        """
+        pass
+
     @abstractmethod
     async def find_by_id(self, task_id: str) -> Task | None:
         """Find task by ID"""
         pass
 
+    @abstractmethod
+    async def find_by_ids(self, task_ids: list[str]) -> dict[str, Task]:
+        """
+        Find several tasks by ID in one backend round trip
+
+        Args:
+            task_ids: Task identifiers
+
+        Returns:
+            Mapping of task_id to Task for the ids that exist
+        """
+        pass
+
     @abstractmethod
     async def find_open_tasks(
         self,
@@ -36,7 +74,39 @@ class ITaskRepository(ABC):
         limit: int = 50,
         offset: int = 0,
     ) -> list[Task]:
-        """Find open tasks with optional filters"""
+        """
+        Find open tasks with optional filters
+
+        Filters mean the same as in scan_open_tasks. Deep offsets are
+        O(offset + limit) per page; prefer scan_open_tasks when walking the
+        whole open list.
+        """
+        pass
+
+    @abstractmethod
+    async def scan_open_tasks(
+        self,
+        cursor: str | None = None,
+        mode: TaskMode | None = None,
+        skills: list[str] | None = None,
+        task_type: str | None = None,
+        limit: int = 50,
+    ) -> tuple[list[Task], str | None]:
+        """
+        Page through open tasks, newest first, with an opaque cursor
+
+        Args:
+            cursor: Cursor returned by the previous call (None = first page)
+            mode: Only tasks in this mode
+            skills: Only tasks whose required skills are all in this list
+            task_type: Only tasks of this type
+            limit: Number of open tasks examined per page
+
+        Returns:
+            (tasks, next_cursor); next_cursor is None once the list is exhausted.
+            Filters are applied to the examined window, so a page may hold fewer
+            than limit tasks while next_cursor is still set.
+        """
         pass
 
     @abstractmethod
@@ -54,11 +124,34 @@ class ITaskRepository(ABC):
         """Find tasks by status"""
         pass
 
+    @abstractmethod
+    async def find_by_creator_and_status(
+        self, creator_id: str, status: TaskStatus, limit: int = 50
+    ) -> list[Task]:
+        """
+        Find tasks created by a user/agent that are in the given status
+
+        Implementations should intersect both filters in the backend in one
+        query rather than fetching either index and filtering client-side.
+        """
+        pass
+
     @abstractmethod
     async def delete(self, task_id: str) -> bool:
         """Delete a task"""
         pass
 
+    @abstractmethod
+    def subscribe_task_updates(self, task_id: str) -> AsyncIterator[Task]:
+        """
+        Push feed of a task's state, replacing find_by_id polling loops
+
+        Yields the freshly loaded task after each write to it (save, joins,
+        cancellations, completions) and ends once the task is deleted.
+        Closing the iterator releases the subscription.
+        """
+        pass
+
     @abstractmethod
     async def exists(self, task_id: str) -> bool:
         """Check if task exists"""
@@ -66,17 +159,33 @@ class ITaskRepository(ABC):
 
     @abstractmethod
     async def count_open_tasks(self) -> int:
-        """Count total open tasks"""
+        """
+        Count total open tasks
+
+        Must be answered from a maintained count or an index (never a key
+        scan or a full hydration of the open list). Redis reads the open
+        set's size in O(1); PostgreSQL counts the open rows through the
+        status index, which grows with the number of open tasks.
+        """
         pass
 
     @abstractmethod
     async def record_completion(self, task_id: str, agent_id: str) -> None:
-        """Record task completion by an agent"""
+        """
+        Record task completion by an agent
+
+        Idempotent: recording the same (task, agent) pair twice stores it once.
+        """
         pass
 
     @abstractmethod
     async def has_completed(self, task_id: str, agent_id: str) -> bool:
-        """Check if agent has already completed this task"""
+        """
+        Check if agent has already completed this task
+
+        Called on every join of a repeatable task, so implementations should
+        answer in O(1) (set membership), not by scanning a completion log.
+        """
         pass
 
     # ========== Participation CRUD ==========
@@ -91,6 +200,8 @@ class ITaskRepository(ABC):
         """
         Add an application (participation with status APPLIED) for an assigned task.
         Saves the participation and adds it to task/user indices without incrementing active_count.
+        The writes are independent, so implementations should issue them as one batch
+        (a single round trip / transaction).
         """
         pass
 
@@ -110,6 +221,27 @@ class ITaskRepository(ABC):
         """Find participations for a task, optionally filtered by status"""
         pass
 
+    @abstractmethod
+    def iter_participations_by_task(
+        self,
+        task_id: str,
+        status: str | None = None,
+        batch_size: int = 100,
+    ) -> AsyncIterator[Participation]:
+        """
+        Stream every participation of a task, oldest first
+
+        Fetches batch_size participations per backend round trip, so callers
+        that stop early never load the rest, and memory stays O(batch_size)
+        however many participants a task has.
+
+        Args:
+            task_id: Task identifier
+            status: Only yield participations in this status
+            batch_size: Participations fetched per round trip
+        """
+        pass
+
     @abstractmethod
     async def find_participation_by_user_and_task(
         self,
@@ -141,7 +273,8 @@ class ITaskRepository(ABC):
         Atomically join a multi-participant task.
 
         Checks capacity, duplicate participation, and creates the participation
-        in a single atomic operation.
+        (with all of its indexes) in a single atomic operation. Implementations
+        must not need a retry loop: one server-side call per join.
 
         Args:
             task_id: Task identifier
@@ -108,6 +108,7 @@ from .message_router import (
     create_data_message,
     create_notification_message,
     create_text_message,
+    dlq_keys,
 )
 from .subnet_manager import GatewayMessageType, SubnetManager
 from .websocket_manager import Connection, MessageType, WebSocketManager
@@ -128,6 +129,7 @@ __all__ = [
     "create_text_message",
     "create_data_message",
     "create_notification_message",
+    "dlq_keys",
     # Other types
     "BroadcastResult",
     "BroadcastStrategy",
@@ -11,23 +11,30 @@ Use cases:
 """
 
 import asyncio
+import hashlib
 import logging
+import secrets
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from enum import StrEnum
 from typing import Any
-from uuid import uuid4
 
+import orjson
 import redis.asyncio as redis
 
 # Official A2A SDK
-from a2a.types import Message  # type: ignore[import-untyped]
+from a2a.types import Message, MessageSendParams  # type: ignore[import-untyped]
 
+from ...models import AgentInfo
 from ..persistence.redis.registry import AgentRegistry
 from .message_router import MessageRouter
 
 logger = logging.getLogger(__name__)
 
+# "started" logs above this many recipients store a count + digest instead of the list;
+# the "completed" log (same key) always carries the full list
+_MAX_LOGGED_RECIPIENTS = 500
+
 
 class BroadcastStrategy(StrEnum):
     """Broadcast delivery strategy"""
@@ -96,6 +103,7 @@ class BroadcastService:
         router: MessageRouter,
         redis_client: redis.Redis,
         registry: AgentRegistry | None = None,
+        fanout_limit: int = 64,
     ):
         """
         Initialize Broadcast Service
@@ -104,10 +112,12 @@ class BroadcastService:
             router: Message Router for delivery
             redis_client: Redis for logging
             registry: ACN Registry (optional, uses router's if not provided)
+            fanout_limit: Max in-flight deliveries for parallel broadcasts
         """
         self.router = router
         self.redis = redis_client
         self.registry = registry or router.registry
+        self._fanout_limit = max(1, fanout_limit)
 
         logger.info("Broadcast Service initialized")
 
@@ -117,6 +127,7 @@ class BroadcastService:
         to_agents: list[str],
         message: Message,
         strategy: BroadcastStrategy = BroadcastStrategy.PARALLEL,
+        agent_infos: dict[str, AgentInfo] | None = None,
     ) -> BroadcastResult:
         """
         Broadcast message to multiple agents
@@ -126,17 +137,23 @@ class BroadcastService:
             to_agents: List of target agent IDs
             message: A2A message to broadcast
             strategy: Delivery strategy
+            agent_infos: Registry records already fetched for (some of) to_agents,
+                by agent ID; those targets skip the per-route registry lookup
 
         Returns:
             BroadcastResult with delivery status
         """
-        broadcast_id = uuid4().hex[:12]
+        broadcast_id = secrets.token_hex(6)
 
         logger.info(
             f"[{broadcast_id}] Broadcasting from {from_agent} "
             f"to {len(to_agents)} agents, strategy={strategy}"
         )
 
+        # Serialize and validate once; reused by both broadcast logs and every per-agent route
+        msg_data = MessageRouter.serialize_message(message)
+        params = self.router.build_params(message)
+
         # Log broadcast start
         await self._log_broadcast(
             broadcast_id=broadcast_id,
@@ -144,16 +161,23 @@ class BroadcastService:
             to_agents=to_agents,
             message=message,
             status="started",
+            msg_data=msg_data,
         )
 
         results: dict[str, Any] = {}
 
         if strategy == BroadcastStrategy.PARALLEL:
-            results = await self._send_parallel(from_agent, to_agents, message)
+            results = await self._send_parallel(
+                from_agent, to_agents, message, msg_data, params, agent_infos
+            )
         elif strategy == BroadcastStrategy.SEQUENTIAL:
-            results = await self._send_sequential(from_agent, to_agents, message)
+            results = await self._send_sequential(
+                from_agent, to_agents, message, msg_data, params, agent_infos
+            )
         else:  # BEST_EFFORT
-            results = await self._send_best_effort(from_agent, to_agents, message)
+            results = await self._send_best_effort(
+                from_agent, to_agents, message, msg_data, params, agent_infos
+            )
 
         # Calculate stats
         success = sum(1 for r in results.values() if "error" not in r)
@@ -167,6 +191,7 @@ class BroadcastService:
             message=message,
             status="completed",
             results=results,
+            msg_data=msg_data,
         )
 
         result = BroadcastResult(
@@ -211,7 +236,7 @@ class BroadcastService:
         if not agents:
             logger.warning(f"No agents found with skills: {skills}")
             return BroadcastResult(
-                broadcast_id=uuid4().hex[:12],
+                broadcast_id=secrets.token_hex(6),
                 total=0,
                 success=0,
                 failed=0,
@@ -222,11 +247,13 @@ class BroadcastService:
 
         logger.info(f"Found {len(to_agents)} agents with skills {skills}: {to_agents}")
 
+        # The search already returned each agent's record; don't re-fetch it per route
         return await self.send(
             from_agent=from_agent,
             to_agents=to_agents,
             message=message,
             strategy=strategy,
+            agent_infos={agent.agent_id: agent for agent in agents},
         )
 
     async def send_to_project(
@@ -253,12 +280,14 @@ class BroadcastService:
         # For now, use metadata search
         agents = await self.registry.search_agents(metadata={"project_id": project_id})
 
-        to_agents = [agent.agent_id for agent in agents if agent.agent_id not in (exclude or [])]
+        excluded = frozenset(exclude or ())
+        targets = [agent for agent in agents if agent.agent_id not in excluded]
 
         return await self.send(
             from_agent=from_agent,
-            to_agents=to_agents,
+            to_agents=[agent.agent_id for agent in targets],
             message=message,
+            agent_infos={agent.agent_id: agent for agent in targets},
         )
 
     async def _send_parallel(
@@ -266,22 +295,30 @@ class BroadcastService:
         from_agent: str,
         to_agents: list[str],
         message: Message,
+        msg_data: Any = None,
+        params: MessageSendParams | None = None,
+        agent_infos: dict[str, AgentInfo] | None = None,
     ) -> dict[str, Any]:
-        """Send to all agents in parallel"""
+        """Send to all agents in parallel, at most _fanout_limit in flight"""
+        sem = asyncio.Semaphore(self._fanout_limit)
 
         async def send_one(agent_id: str) -> tuple:
-            try:
-                result = await self.router.route(
-                    from_agent=from_agent,
-                    to_agent=agent_id,
-                    message=message,
-                )
-                return agent_id, result
-            except Exception as e:
-                logger.error(f"Failed to send to {agent_id}: {e}")
-                return agent_id, {"error": str(e)}
-
-        # Execute all in parallel
+            async with sem:
+                try:
+                    result = await self.router.route(
+                        from_agent=from_agent,
+                        to_agent=agent_id,
+                        message=message,
+                        msg_data=msg_data,
+                        params=params,
+                        agent_info=(agent_infos or {}).get(agent_id),
+                    )
+                    return agent_id, result
+                except Exception as e:
+                    logger.error(f"Failed to send to {agent_id}: {e}")
+                    return agent_id, {"error": str(e)}
+
+        # Execute all in parallel (bounded so the router's connection pool is not swamped)
         tasks = [send_one(agent_id) for agent_id in to_agents]
         results_list = await asyncio.gather(*tasks)
 
@@ -292,6 +329,9 @@ class BroadcastService:
         from_agent: str,
         to_agents: list[str],
         message: Message,
+        msg_data: Any = None,
+        params: MessageSendParams | None = None,
+        agent_infos: dict[str, AgentInfo] | None = None,
     ) -> dict[str, Any]:
         """Send to agents one by one"""
         results = {}
@@ -302,6 +342,9 @@ class BroadcastService:
                     from_agent=from_agent,
                     to_agent=agent_id,
                     message=message,
+                    msg_data=msg_data,
+                    params=params,
+                    agent_info=(agent_infos or {}).get(agent_id),
                 )
                 results[agent_id] = result
             except Exception as e:
@@ -317,24 +360,18 @@ class BroadcastService:
         from_agent: str,
         to_agents: list[str],
         message: Message,
+        msg_data: Any = None,
+        params: MessageSendParams | None = None,
+        agent_infos: dict[str, AgentInfo] | None = None,
     ) -> dict[str, Any]:
-        """Send to all agents, continue even on failures"""
-        results = {}
+        """Send to all agents, continue even on failures
 
-        for agent_id in to_agents:
-            try:
-                result = await self.router.route(
-                    from_agent=from_agent,
-                    to_agent=agent_id,
-                    message=message,
-                )
-                results[agent_id] = result
-            except Exception as e:
-                logger.error(f"Failed to send to {agent_id}: {e}")
-                results[agent_id] = {"error": str(e)}
-                # Continue despite failure
-
-        return results
+        Failures are already isolated per target in _send_parallel, so best effort
+        is the same bounded concurrent fan-out rather than a one-by-one loop.
+        """
+        return await self._send_parallel(
+            from_agent, to_agents, message, msg_data, params, agent_infos
+        )
 
     async def _log_broadcast(
         self,
@@ -344,41 +381,38 @@ class BroadcastService:
         message: Message,
         status: str,
         results: dict[str, Any] | None = None,
+        msg_data: Any = None,
     ):
         """Log broadcast to Redis"""
-        # Serialize message
-        if hasattr(message, "model_dump"):
-            msg_data = message.model_dump()
-        elif hasattr(message, "to_dict"):
-            msg_data = message.to_dict()
-        else:
-            msg_data = str(message)
+        if msg_data is None:
+            msg_data = MessageRouter.serialize_message(message)
 
-        log_entry = {
+        log_entry: dict[str, Any] = {
             "broadcast_id": broadcast_id,
             "from_agent": from_agent,
-            "to_agents": to_agents,
             "message": msg_data,
             "status": status,
-            "timestamp": datetime.now(UTC).isoformat(),
+            "timestamp": datetime.now(UTC),  # orjson emits ISO 8601
         }
+        if status == "started" and len(to_agents) > _MAX_LOGGED_RECIPIENTS:
+            log_entry["to_agents_count"] = len(to_agents)
+            log_entry["to_agents_digest"] = hashlib.blake2b(
+                "\n".join(to_agents).encode(), digest_size=8
+            ).hexdigest()
+        else:
+            log_entry["to_agents"] = to_agents
 
         if results:
             # Serialize results (may contain Message objects)
-            serialized_results = {}
-            for agent_id, result in results.items():
-                if hasattr(result, "model_dump"):
-                    serialized_results[agent_id] = result.model_dump()
-                elif isinstance(result, dict):
-                    serialized_results[agent_id] = result
-                else:
-                    serialized_results[agent_id] = str(result)
-            log_entry["results"] = serialized_results
+            log_entry["results"] = {
+                agent_id: MessageRouter.serialize_message(result)
+                for agent_id, result in results.items()
+            }
 
         await self.redis.setex(
             f"acn:broadcast:{broadcast_id}",
             24 * 60 * 60,  # 24 hours
-            __import__("json").dumps(log_entry),
+            orjson.dumps(log_entry, default=str),
         )
 
     async def get_broadcast_status(
@@ -396,5 +430,5 @@ class BroadcastService:
         """
         data = await self.redis.get(f"acn:broadcast:{broadcast_id}")
         if data:
-            return __import__("json").loads(data)
+            return orjson.loads(data)
         return None
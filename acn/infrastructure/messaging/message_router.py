@@ -9,14 +9,19 @@ Routes messages between agents using:
 Based on: https://github.com/a2aproject/A2A
 """
 
-import json
+import asyncio
+import contextlib
+import functools
 import logging
-from collections.abc import AsyncGenerator, Callable
+import secrets
+import zlib
+from collections import OrderedDict
+from collections.abc import AsyncGenerator, Callable, Coroutine
 from datetime import UTC, datetime
 from typing import Any
-from uuid import uuid4
 
 import httpx
+import orjson
 import redis.asyncio as redis
 
 # Official A2A SDK
@@ -30,11 +35,105 @@ from a2a.types import (  # type: ignore[import-untyped]
     SendMessageRequest,
     TextPart,
 )
+from pydantic import BaseModel
 
+from ...models import AgentInfo
 from ..persistence.redis.registry import AgentRegistry
 
 logger = logging.getLogger(__name__)
 
+# Shared A2A connection pool across all agent endpoints. Idle connections are kept
+# for a minute so bursts to the same agents (broadcasts, DLQ retries) reuse them.
+_HTTP_LIMITS = httpx.Limits(
+    max_connections=200,
+    max_keepalive_connections=100,
+    keepalive_expiry=60.0,
+)
+# A2AClient wrappers cached per endpoint (LRU). They own no connections, so the cap
+# only bounds memory for registries with endpoint churn.
+_A2A_CLIENT_CACHE_SIZE = 512
+
+# Message log: entries are queued in-process and written by a background flusher
+_LOG_STREAM_KEY = "acn:messages:stream"
+_LOG_STREAM_MAXLEN = 100_000  # approximate (MAXLEN ~)
+_LOG_QUEUE_SIZE = 10_000  # entries beyond this are dropped, never block routing
+_LOG_BATCH_SIZE = 500
+_LOG_FLUSH_INTERVAL = 0.05  # seconds to wait for a batch to fill
+_MAX_AGENT_HISTORY = 1000  # keep newest N messages per agent (MAXLEN ~)
+# Per-agent history is a Stream; the plain key is the legacy sorted set, read until it ages out
+_AGENT_HISTORY_KEY = "acn:messages:agent:{agent_id}:stream"
+_LEGACY_AGENT_HISTORY_KEY = "acn:messages:agent:{agent_id}"
+_LOG_ENTRY_KEY = "acn:messages:log:{route_id}"
+_LOG_ENTRY_TTL = 7 * 24 * 60 * 60  # 7 days
+
+# Write one log entry atomically: global stream, both agents' history (once for
+# self-sends) and the per-route key.
+# KEYS: stream, from history, to history, route key
+# ARGV: payload, stream maxlen, history maxlen, route key ttl
+_LUA_LOG_MESSAGE = """
+redis.call('XADD', KEYS[1], 'MAXLEN', '~', ARGV[2], '*', 'entry', ARGV[1])
+redis.call('XADD', KEYS[2], 'MAXLEN', '~', ARGV[3], '*', 'entry', ARGV[1])
+if KEYS[3] ~= KEYS[2] then
+    redis.call('XADD', KEYS[3], 'MAXLEN', '~', ARGV[3], '*', 'entry', ARGV[1])
+end
+redis.call('SETEX', KEYS[4], ARGV[4], ARGV[1])
+return 1
+"""
+
+# Dead letter queue: sharded lists, shard = crc32(route_id) % _DLQ_SHARDS.
+# "acn:dlq" is the pre-sharding list, still drained by retry_dlq.
+# Every DLQ command touches a single key, so shards may live in different
+# Redis Cluster slots.
+_DLQ_SHARDS = 16
+_DLQ_SHARD_KEYS = tuple(f"acn:dlq:{shard}" for shard in range(_DLQ_SHARDS))
+_LEGACY_DLQ_KEY = "acn:dlq"
+_DLQ_MAX_PER_SHARD = 10_000 // _DLQ_SHARDS  # ~10,000 entries overall
+_DLQ_TRIM_EVERY = 32  # LTRIM a shard once per this many pushes to it
+# Shard lists hold compact {route_id, retry_count} headers; the message itself is
+# stored once per route_id so retries never re-send it
+_DLQ_PAYLOAD_KEY = "acn:dlq:msg:{route_id}"
+_DLQ_PAYLOAD_TTL = 7 * 24 * 60 * 60  # 7 days
+_DLQ_RETRY_CONCURRENCY = 16  # retry_dlq deliveries in flight at once
+
+
+@functools.lru_cache(maxsize=4096)
+def _agent_history_key(agent_id: str) -> bytes:
+    """Per-agent history Stream key, built and encoded once per agent"""
+    return _AGENT_HISTORY_KEY.format(agent_id=agent_id).encode()
+
+
+def _dlq_shard(route_id: str) -> int:
+    return zlib.crc32(route_id.encode()) % _DLQ_SHARDS
+
+
+def dlq_keys() -> tuple[str, ...]:
+    """Every list holding DLQ entries: the pre-sharding list, then each shard"""
+    return (_LEGACY_DLQ_KEY, *_DLQ_SHARD_KEYS)
+
+
+@functools.singledispatch
+def _serialize(obj: Any) -> Any:
+    """JSON-serializable form of a message or delivery result (dispatch on type)"""
+    if hasattr(obj, "to_dict"):
+        return obj.to_dict()
+    return str(obj)
+
+
+@_serialize.register
+def _(obj: BaseModel) -> Any:
+    # pydantic-core emits the JSON; orjson embeds it verbatim, no dict round trip
+    return orjson.Fragment(obj.model_dump_json())
+
+
+@_serialize.register
+def _(obj: dict) -> Any:
+    return obj
+
+
+def _dumps(value: Any) -> bytes:
+    """Encode a log/DLQ entry; bytes go to Redis as-is. Unknown types fall back to str()"""
+    return orjson.dumps(value, default=str)
+
 
 class MessageRouter:
     """
@@ -67,6 +166,7 @@ class MessageRouter:
         self,
         registry: AgentRegistry,
         redis_client: redis.Redis,
+        trust_inputs: bool = True,
     ):
         """
         Initialize Message Router
@@ -74,16 +174,40 @@ class MessageRouter:
         Args:
             registry: ACN Registry for agent discovery
             redis_client: Redis for logging and DLQ
+            trust_inputs: Wrap Message instances in request models without
+                re-running Pydantic validation on them
         """
         self.registry = registry
         self.redis = redis_client
+        self._trust_inputs = trust_inputs
+
+        # One pooled httpx client shared by every endpoint: created on first use,
+        # closed by close() (the app lifespan calls it on shutdown)
+        self._http: httpx.AsyncClient | None = None
 
-        # Cache of A2A clients by endpoint (capped to prevent unbounded growth)
-        self._clients: dict[str, A2AClient] = {}
-        self._clients_max: int = 256
+        # LRU cache of A2A clients by endpoint (capped to prevent unbounded growth).
+        # They are thin wrappers over self._http, so eviction closes no connections.
+        self._clients: OrderedDict[str, A2AClient] = OrderedDict()
+        self._clients_max: int = _A2A_CLIENT_CACHE_SIZE
 
-        # Message handlers for incoming messages
-        self._handlers: dict[str, list[Callable]] = {}
+        # Message handlers for incoming messages (tuples: rebuilt on register, read per message)
+        self._handlers: dict[str, tuple[Callable, ...]] = {}
+        # Type-specific + wildcard handlers per message type, cleared on register
+        self._dispatch: dict[str, tuple[Callable, ...]] = {}
+
+        # Message log buffer, flushed in batches off the routing path
+        self._log_queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue(maxsize=_LOG_QUEUE_SIZE)
+        self._log_flusher: asyncio.Task | None = None
+        self._log_dropped = 0
+        self._log_script = redis_client.register_script(_LUA_LOG_MESSAGE)
+
+        # Fire-and-forget Redis writes (DLQ), awaited by close()
+        self._bg_tasks: set[asyncio.Task] = set()
+
+        # DLQ pushes per shard since start (drives periodic LTRIM) and the shard
+        # retry_dlq starts from (rotated so no shard is starved)
+        self._dlq_pushes = [0] * _DLQ_SHARDS
+        self._dlq_cursor = 0
 
         logger.info("Message Router initialized (using official A2A SDK)")
 
@@ -97,44 +221,69 @@ class MessageRouter:
         Returns:
             A2AClient instance
         """
-        if endpoint not in self._clients:
-            if len(self._clients) >= self._clients_max:
-                # Evict the oldest entry to keep memory bounded
-                oldest = next(iter(self._clients))
-                try:
-                    old_client = self._clients.pop(oldest)
-                    if hasattr(old_client, "httpx_client") and old_client.httpx_client:
-                        await old_client.httpx_client.aclose()
-                except Exception:
-                    pass
-            httpx_client = httpx.AsyncClient(
+        client = self._clients.get(endpoint)
+        if client is not None:
+            self._clients.move_to_end(endpoint)
+            return client
+
+        if len(self._clients) >= self._clients_max:
+            # Evict the least recently used entry to keep memory bounded
+            self._clients.popitem(last=False)
+        if self._http is None:
+            self._http = httpx.AsyncClient(
                 timeout=30.0,
-                limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
-            )
-            self._clients[endpoint] = A2AClient(
-                httpx_client=httpx_client,
-                url=endpoint,
+                limits=_HTTP_LIMITS,
             )
-            logger.debug(f"Created A2A client for {endpoint}")
+        client = A2AClient(httpx_client=self._http, url=endpoint)
+        self._clients[endpoint] = client
+        logger.debug(f"Created A2A client for {endpoint}")
 
-        return self._clients[endpoint]
+        return client
+
+    def _spawn_background(self, coro: Coroutine[Any, Any, Any]) -> None:
+        """Run a Redis write off the request path; keeps a reference until it finishes"""
+        task = asyncio.create_task(coro)
+        self._bg_tasks.add(task)
+        task.add_done_callback(self._on_background_done)
+
+    def _on_background_done(self, task: asyncio.Task) -> None:
+        self._bg_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"Background write failed: {task.exception()}")
 
     async def close(self) -> None:
-        """Close all cached A2A clients and their underlying httpx connections"""
-        for endpoint, client in self._clients.items():
+        """Flush pending message logs and DLQ writes, then close the shared A2A HTTP client"""
+        if self._bg_tasks:
+            await asyncio.gather(*self._bg_tasks, return_exceptions=True)
+
+        if self._log_flusher is not None:
             try:
-                if hasattr(client, "httpx_client") and client.httpx_client:
-                    await client.httpx_client.aclose()
-            except Exception as e:
-                logger.warning("failed_to_close_a2a_client", endpoint=endpoint, error=str(e))
+                await asyncio.wait_for(self._log_queue.join(), timeout=5.0)
+            except TimeoutError:
+                logger.warning(f"Dropping {self._log_queue.qsize()} unflushed message logs")
+            self._log_flusher.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._log_flusher
+            self._log_flusher = None
+
         self._clients.clear()
-        logger.info("message_router_closed", clients_cleared=True)
+        if self._http is not None:
+            try:
+                await self._http.aclose()
+            except Exception as e:
+                logger.warning(f"Failed to close A2A HTTP client: {e}")
+            self._http = None
+        logger.info("Message Router closed")
 
     async def route(
         self,
         from_agent: str,
         to_agent: str,
         message: Message,
+        msg_data: Any = None,
+        params: MessageSendParams | None = None,
+        agent_info: AgentInfo | None = None,
+        store_dlq: bool = True,
     ) -> Any:
         """
         Route an A2A message to a specific agent
@@ -143,6 +292,14 @@ class MessageRouter:
             from_agent: Source agent/service ID
             to_agent: Target agent ID
             message: A2A Message object (from a2a.types)
+            msg_data: Pre-serialized message for the log (see serialize_message);
+                lets broadcasts dump the message once instead of per recipient
+            params: Pre-validated MessageSendParams wrapping ``message``; lets
+                broadcasts validate once instead of per recipient
+            agent_info: Registry record for ``to_agent`` when the caller already
+                has it (e.g. from search_agents); skips the registry lookup
+            store_dlq: Queue the message in the dead letter queue on delivery
+                failure. retry_dlq passes False: it requeues the entry itself
 
         Returns:
             A2A response (Message or Task)
@@ -151,36 +308,37 @@ class MessageRouter:
             ValueError: If target agent not found
             Exception: On delivery failure
         """
-        route_id = uuid4().hex[:8]
+        route_id = secrets.token_hex(4)
 
         logger.info(f"[{route_id}] Routing: {from_agent} -> {to_agent}")
 
-        # 1. Discover agent endpoint via ACN Registry
-        agent_info = await self.registry.get_agent(to_agent)
+        # 1. Discover agent endpoint via ACN Registry (unless prefetched)
+        if agent_info is None:
+            agent_info = await self.registry.get_agent(to_agent)
         if not agent_info:
             raise ValueError(f"Agent not found in ACN Registry: {to_agent}")
 
         endpoint = agent_info.endpoint
         logger.debug(f"[{route_id}] Discovered endpoint: {endpoint}")
 
-        # 2. Log outbound message
-        await self._log_message(
+        # 2. Log outbound message (queued; written by the background flusher)
+        self._log_message(
             route_id=route_id,
             from_agent=from_agent,
             to_agent=to_agent,
             message=message,
             direction="outbound",
+            msg_data=msg_data,
         )
 
         try:
             # 3. Get A2A client and send message
             client = await self._get_client(endpoint)
 
-            # Create SendMessageRequest
-            request = SendMessageRequest(
-                id=route_id,
-                params=MessageSendParams(message=message),
-            )
+            # Create SendMessageRequest (params are already validated; skip re-validation)
+            if params is None:
+                params = self.build_params(message)
+            request = SendMessageRequest.model_construct(id=route_id, params=params)
             response = await client.send_message(request)
 
             # 4. Log response
@@ -191,14 +349,19 @@ class MessageRouter:
 
         except Exception as e:
             logger.error(f"[{route_id}] Delivery failed: {e}")
-
-            # Store in dead letter queue for retry
-            await self._store_dlq(
-                route_id=route_id,
-                from_agent=from_agent,
-                to_agent=to_agent,
-                message=message,
-                error=str(e),
+            if not store_dlq:
+                raise
+
+            # Store in dead letter queue for retry (in the background: the caller
+            # gets the delivery error without waiting on Redis)
+            self._spawn_background(
+                self._store_dlq(
+                    route_id=route_id,
+                    from_agent=from_agent,
+                    to_agent=to_agent,
+                    message=message,
+                    error=str(e),
+                )
             )
             raise
 
@@ -249,6 +412,7 @@ class MessageRouter:
             from_agent=from_agent,
             to_agent=target_agent.agent_id,
             message=message,
+            agent_info=target_agent,
         )
 
     async def route_stream(
@@ -294,10 +458,8 @@ class MessageRouter:
             message_type: Type of message to handle
             handler: Async handler function
         """
-        if message_type not in self._handlers:
-            self._handlers[message_type] = []
-
-        self._handlers[message_type].append(handler)
+        self._handlers[message_type] = (*self._handlers.get(message_type, ()), handler)
+        self._dispatch.clear()
         logger.info(f"Registered handler for: {message_type}")
 
     async def handle_incoming(
@@ -312,34 +474,35 @@ class MessageRouter:
             from_agent: Source agent ID
             message: A2A Message object
         """
-        # Determine message type from data part
+        # Determine message type from the first data part. Parts arrive wrapped in
+        # a2a's Part root model, so compare the inner part's kind.
         message_type = "unknown"
-        for part in message.parts:
-            if isinstance(part, DataPart):
-                data = part.data
-                if "notification_type" in data:
-                    message_type = data["notification_type"]
-                elif "type" in data:
-                    message_type = data["type"]
-                break
+        data_part = next(
+            (p for p in message.parts if getattr(getattr(p, "root", p), "kind", None) == "data"),
+            None,
+        )
+        if data_part is not None:
+            data = getattr(data_part, "root", data_part).data
+            message_type = data.get("notification_type") or data.get("type") or "unknown"
 
         logger.info(f"Handling incoming message type: {message_type}")
 
-        # Call registered handlers
-        if message_type in self._handlers:
-            for handler in self._handlers[message_type]:
-                try:
-                    await handler(from_agent, message)
-                except Exception as e:
-                    logger.error(f"Handler error: {e}")
+        # Registered handlers for this type, then wildcard handlers
+        handlers = self._dispatch.get(message_type)
+        if handlers is None:
+            handlers = self._handlers.get(message_type, ()) + self._handlers.get("*", ())
+            self._dispatch[message_type] = handlers
+        if not handlers:
+            return
 
-        # Also call wildcard handlers
-        if "*" in self._handlers:
-            for handler in self._handlers["*"]:
-                try:
-                    await handler(from_agent, message)
-                except Exception as e:
-                    logger.error(f"Wildcard handler error: {e}")
+        # Run concurrently; a failing handler is logged and never affects the others
+        async def run(handler: Callable) -> None:
+            try:
+                await handler(from_agent, message)
+            except Exception as e:
+                logger.error(f"Handler error: {e}")
+
+        await asyncio.gather(*(run(handler) for handler in handlers))
 
     async def get_message_history(
         self,
@@ -356,32 +519,49 @@ class MessageRouter:
         Returns:
             List of message records
         """
-        messages = await self.redis.zrevrange(
-            f"acn:messages:agent:{agent_id}",
-            0,
-            limit - 1,
+        entries = await self.redis.xrevrange(
+            _agent_history_key(agent_id),
+            count=limit,
         )
+        history = [orjson.loads(fields["entry"]) for _, fields in entries]
+
+        # Older entries written before the Stream migration
+        if len(history) < limit:
+            legacy = await self.redis.zrevrange(
+                _LEGACY_AGENT_HISTORY_KEY.format(agent_id=agent_id),
+                0,
+                limit - len(history) - 1,
+            )
+            history.extend(orjson.loads(m) for m in legacy)
+
+        return history
+
+    def build_params(self, message: Any) -> MessageSendParams:
+        """Wrap a message in MessageSendParams, skipping validation for trusted Messages"""
+        if self._trust_inputs and isinstance(message, Message):
+            return MessageSendParams.model_construct(message=message)
+        return MessageSendParams(message=message)
 
-        return [json.loads(m) for m in messages]
+    @staticmethod
+    def serialize_message(message: Any) -> Any:
+        """Convert a message or delivery result into JSON-serializable data for logging"""
+        return _serialize(message)
 
-    async def _log_message(
+    def _log_message(
         self,
         route_id: str,
         from_agent: str,
         to_agent: str,
         message: Any,
         direction: str,
+        msg_data: Any = None,
     ):
-        """Log message to Redis"""
-        timestamp = datetime.now(UTC).isoformat()
+        """Queue a message log entry for the background flusher (never blocks)"""
+        # datetime, not isoformat(): orjson writes the same ISO string in C, in the flusher
+        timestamp = datetime.now(UTC)
 
-        # Serialize message
-        if hasattr(message, "model_dump"):
-            msg_data = message.model_dump()
-        elif hasattr(message, "to_dict"):
-            msg_data = message.to_dict()
-        else:
-            msg_data = str(message)
+        if msg_data is None:
+            msg_data = self.serialize_message(message)
 
         log_entry = {
             "route_id": route_id,
@@ -392,20 +572,58 @@ class MessageRouter:
             "message": msg_data,
         }
 
-        score = datetime.now(UTC).timestamp()
-        _MAX_AGENT_HISTORY = 1000  # keep newest N messages per agent
-
-        # Store in both agents' history, then trim to cap (oldest removed first)
-        for agent_key in (f"acn:messages:agent:{from_agent}", f"acn:messages:agent:{to_agent}"):
-            await self.redis.zadd(agent_key, {json.dumps(log_entry): score})
-            await self.redis.zremrangebyrank(agent_key, 0, -(_MAX_AGENT_HISTORY + 1))
-
-        # Global log with TTL
-        await self.redis.setex(
-            f"acn:messages:log:{route_id}",
-            7 * 24 * 60 * 60,  # 7 days
-            json.dumps(log_entry),
-        )
+        # Hand off to the background flusher; routing never waits on log writes
+        if self._log_flusher is None or self._log_flusher.done():
+            self._log_flusher = asyncio.create_task(self._run_log_flusher())
+        try:
+            self._log_queue.put_nowait(log_entry)
+        except asyncio.QueueFull:
+            self._log_dropped += 1
+            if self._log_dropped % 1000 == 1:
+                logger.warning(f"Message log queue full, {self._log_dropped} entries dropped")
+
+    async def _run_log_flusher(self) -> None:
+        """Drain the log queue in batches of up to _LOG_BATCH_SIZE or _LOG_FLUSH_INTERVAL"""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._log_queue.get()]
+            deadline = loop.time() + _LOG_FLUSH_INTERVAL
+            while len(batch) < _LOG_BATCH_SIZE:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._log_queue.get(), timeout))
+                except TimeoutError:
+                    break
+            try:
+                await self._flush_log_batch(batch)
+            except Exception as e:
+                logger.error(f"Failed to flush {len(batch)} message logs: {e}")
+            finally:
+                for _ in batch:
+                    self._log_queue.task_done()
+
+    async def _flush_log_batch(self, batch: list[dict[str, Any]]) -> None:
+        """Write a batch of log entries in one pipeline, one script call per entry"""
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for log_entry in batch:
+                await self._log_script(
+                    keys=[
+                        _LOG_STREAM_KEY,
+                        _agent_history_key(log_entry["from_agent"]),
+                        _agent_history_key(log_entry["to_agent"]),
+                        _LOG_ENTRY_KEY.format(route_id=log_entry["route_id"]),
+                    ],
+                    args=[
+                        _dumps(log_entry),
+                        _LOG_STREAM_MAXLEN,
+                        _MAX_AGENT_HISTORY,
+                        _LOG_ENTRY_TTL,
+                    ],
+                    client=pipe,
+                )
+            await pipe.execute()
 
     async def _store_dlq(
         self,
@@ -416,27 +634,49 @@ class MessageRouter:
         error: str,
     ):
         """Store failed message in dead letter queue"""
-        # Serialize message
-        if hasattr(message, "model_dump"):
-            msg_data = message.model_dump()
-        else:
-            msg_data = str(message)
+        msg_data = self.serialize_message(message)
 
-        dlq_entry = {
+        payload = {
             "route_id": route_id,
             "from_agent": from_agent,
             "to_agent": to_agent,
             "message": msg_data,
             "error": error,
-            "timestamp": datetime.now(UTC).isoformat(),
-            "retry_count": 0,
+            "timestamp": datetime.now(UTC),  # orjson emits ISO 8601
         }
 
-        await self.redis.lpush("acn:dlq", json.dumps(dlq_entry))
-        # Cap DLQ to prevent unbounded Redis memory growth (keep newest 10,000 entries)
-        await self.redis.ltrim("acn:dlq", 0, 9999)
+        await self._push_dlq([{"route_id": route_id, "retry_count": 0}], {route_id: payload})
         logger.warning(f"Message {route_id} added to DLQ")
 
+    async def _push_dlq(
+        self,
+        headers: list[dict[str, Any]],
+        payloads: dict[str, dict[str, Any]] | None = None,
+    ) -> None:
+        """SET new payloads and LPUSH compact headers onto their shards in one pipeline"""
+        by_shard: dict[int, list[bytes]] = {}
+        for header in headers:
+            by_shard.setdefault(_dlq_shard(header["route_id"]), []).append(_dumps(header))
+
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for route_id, payload in (payloads or {}).items():
+                pipe.set(
+                    _DLQ_PAYLOAD_KEY.format(route_id=route_id),
+                    _dumps(payload),
+                    ex=_DLQ_PAYLOAD_TTL,
+                )
+            for shard, encoded in by_shard.items():
+                key = _DLQ_SHARD_KEYS[shard]
+                pipe.lpush(key, *encoded)
+                # Cap DLQ to prevent unbounded Redis memory growth; trimming only every
+                # _DLQ_TRIM_EVERY pushes lets a shard overshoot its cap by that much.
+                # Payloads of trimmed headers expire with their TTL.
+                before = self._dlq_pushes[shard]
+                self._dlq_pushes[shard] += len(encoded)
+                if before // _DLQ_TRIM_EVERY != self._dlq_pushes[shard] // _DLQ_TRIM_EVERY:
+                    pipe.ltrim(key, 0, _DLQ_MAX_PER_SHARD - 1)
+            await pipe.execute()
+
     async def retry_dlq(self, max_retries: int = 3, batch_limit: int = 100) -> int:
         """
         Retry messages in dead letter queue
@@ -449,51 +689,120 @@ class MessageRouter:
             Number of successfully retried messages
         """
         success_count = 0
-        processed = 0
-
-        while processed < batch_limit:
-            entry_json = await self.redis.rpop("acn:dlq")
-            if not entry_json:
-                break
-
-            processed += 1
-            entry = json.loads(entry_json)
-
-            if entry["retry_count"] >= max_retries:
-                logger.error(f"Message {entry['route_id']} exceeded max retries, discarding")
+        if batch_limit <= 0:
+            return success_count
+
+        # Drain lists in order (legacy first, then shards from a rotating start so
+        # none is starved): size every list, then pop each one's share with RPOP
+        # count (Redis >= 6.2). Two round trips, and no multi-key command, which
+        # Redis Cluster would reject when the shards hash to different slots.
+        start = self._dlq_cursor
+        self._dlq_cursor = (start + 1) % _DLQ_SHARDS
+        keys = (_LEGACY_DLQ_KEY, *_DLQ_SHARD_KEYS[start:], *_DLQ_SHARD_KEYS[:start])
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for key in keys:
+                pipe.llen(key)
+            lengths = await pipe.execute()
+
+        entries: list[Any] = []
+        remaining = batch_limit
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for key, length in zip(keys, lengths, strict=True):
+                if remaining <= 0:
+                    break
+                if length:
+                    pipe.rpop(key, min(length, remaining))
+                    remaining -= length
+            # A list drained concurrently since LLEN pops as None
+            for popped in await pipe.execute():
+                entries.extend(popped or ())
+
+        headers = [orjson.loads(entry_json) for entry_json in entries]
+
+        # Fetch payloads in one pipeline; pre-split entries carry theirs inline
+        payloads: dict[str, Any] = {}
+        stored = [h["route_id"] for h in headers if "message" not in h]
+        if stored:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for route_id in stored:
+                    pipe.get(_DLQ_PAYLOAD_KEY.format(route_id=route_id))
+                for route_id, raw in zip(stored, await pipe.execute(), strict=True):
+                    if raw is not None:
+                        payloads[route_id] = orjson.loads(raw)
+
+        to_requeue: list[dict[str, Any]] = []
+        new_payloads: dict[str, dict[str, Any]] = {}
+        finished: list[str] = []
+        pending: list[tuple[dict[str, Any], dict[str, Any]]] = []
+
+        for header in headers:
+            route_id = header["route_id"]
+            entry = header if "message" in header else payloads.get(route_id)
+            if entry is None:
+                logger.error(f"Message {route_id} payload expired, discarding")
                 continue
 
-            entry["retry_count"] += 1
+            if header["retry_count"] >= max_retries:
+                logger.error(f"Message {route_id} exceeded max retries, discarding")
+                finished.append(route_id)
+                continue
 
-            try:
-                # Reconstruct message from stored data
-                msg_data = entry["message"]
-                parts = []
-
-                for part in msg_data.get("parts", []):
-                    if part.get("kind") == "text":
-                        parts.append(TextPart(text=part.get("text", "")))
-                    elif part.get("kind") == "data":
-                        parts.append(DataPart(data=part.get("data", {})))
-
-                message = Message(
-                    role=msg_data.get("role", "user"),
-                    parts=parts,
-                )
+            pending.append((header, entry))
 
-                await self.route(
-                    from_agent=entry["from_agent"],
-                    to_agent=entry["to_agent"],
-                    message=message,
-                )
+        # Retry concurrently, bounded so a backed-up DLQ doesn't swamp the HTTP pool
+        sem = asyncio.Semaphore(_DLQ_RETRY_CONCURRENCY)
 
-                success_count += 1
+        async def retry_one(entry: dict[str, Any]) -> bool:
+            async with sem:
+                try:
+                    # Reconstruct message from stored data
+                    msg_data = entry["message"]
+                    parts = []
+
+                    for part in msg_data.get("parts", []):
+                        if part.get("kind") == "text":
+                            parts.append(TextPart(text=part.get("text", "")))
+                        elif part.get("kind") == "data":
+                            parts.append(DataPart(data=part.get("data", {})))
+
+                    message = Message(
+                        role=msg_data.get("role", "user"),
+                        parts=parts,
+                        message_id=msg_data.get("message_id") or f"msg-{secrets.token_hex(6)}",
+                    )
+
+                    await self.route(
+                        from_agent=entry["from_agent"],
+                        to_agent=entry["to_agent"],
+                        message=message,
+                        store_dlq=False,
+                    )
+                except Exception as e:
+                    logger.error(f"DLQ retry failed: {e}")
+                    return False
                 logger.info(f"DLQ message {entry['route_id']} delivered")
+                return True
 
-            except Exception as e:
-                logger.error(f"DLQ retry failed: {e}")
-                await self.redis.lpush("acn:dlq", json.dumps(entry))
-                await self.redis.ltrim("acn:dlq", 0, 9999)
+        delivered = await asyncio.gather(*(retry_one(entry) for _, entry in pending))
+
+        for (header, entry), ok in zip(pending, delivered, strict=True):
+            route_id = header["route_id"]
+            if ok:
+                success_count += 1
+                finished.append(route_id)
+                continue
+            # Only the header goes back; the payload stays where it is
+            to_requeue.append({"route_id": route_id, "retry_count": header["retry_count"] + 1})
+            if entry is header:
+                new_payloads[route_id] = {k: v for k, v in entry.items() if k != "retry_count"}
+
+        if finished:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for route_id in finished:
+                    pipe.delete(_DLQ_PAYLOAD_KEY.format(route_id=route_id))
+                await pipe.execute()
+        if to_requeue:
+            await self._push_dlq(to_requeue, new_payloads)
 
         return success_count
 
@@ -518,7 +827,7 @@ def create_text_message(text: str, role: Role = Role.user) -> Message:
     return Message(
         role=role,
         parts=parts,
-        message_id=f"msg-{uuid4().hex[:12]}",
+        message_id=f"msg-{secrets.token_hex(6)}",
     )
 
 
@@ -545,7 +854,7 @@ def create_data_message(
     return Message(
         role=role,
         parts=parts,
-        message_id=f"msg-{uuid4().hex[:12]}",
+        message_id=f"msg-{secrets.token_hex(6)}",
     )
 
 
@@ -577,5 +886,5 @@ def create_notification_message(
     return Message(
         role=Role.user,
         parts=parts,
-        message_id=f"msg-{uuid4().hex[:12]}",
+        message_id=f"msg-{secrets.token_hex(6)}",
     )
@@ -35,6 +35,7 @@ Usage:
 """
 
 import asyncio
+import json
 import logging
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
@@ -46,7 +47,7 @@ import redis.asyncio as redis
 from a2a.types import Message  # type: ignore[import-untyped]
 from fastapi import WebSocket, WebSocketDisconnect
 
-from ...models import AgentInfo, SubnetInfo
+from ...models import AgentInfo, SecurityScheme, SubnetInfo
 from ..persistence.redis.registry import AgentRegistry
 
 logger = logging.getLogger(__name__)
@@ -242,8 +243,6 @@ class SubnetManager:
         # Parse and validate security schemes
         parsed_schemes = None
         if security_schemes:
-            from ..models import SecurityScheme
-
             parsed_schemes = {
                 name: SecurityScheme(**scheme) for name, scheme in security_schemes.items()
             }
@@ -782,8 +781,6 @@ class SubnetManager:
 
     async def _persist_subnet(self, info: SubnetInfo, generated_token: str | None = None):
         """Persist subnet info to Redis"""
-        import json
-
         key = f"acn:subnet:{info.subnet_id}"
         await self.redis.set(key, json.dumps(info.model_dump(), default=str))
 
@@ -799,8 +796,6 @@ class SubnetManager:
 
     async def load_subnets_from_redis(self):
         """Load persisted subnets from Redis on startup"""
-        import json
-
         pattern = "acn:subnet:*"
         cursor = 0
 
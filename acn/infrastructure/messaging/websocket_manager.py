@@ -12,21 +12,26 @@ Responsibilities:
 """
 
 import asyncio
-import json
 import logging
+import secrets
 from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from enum import StrEnum
 from typing import Any
-from uuid import uuid4
 
+import orjson
 import redis.asyncio as redis
 from fastapi import WebSocket
 
 logger = logging.getLogger(__name__)
 
 
+def _encode(message: dict[str, Any]) -> bytes:
+    """Encode an outgoing message once; str() for values JSON can't represent"""
+    return orjson.dumps(message, default=str, option=orjson.OPT_NON_STR_KEYS)
+
+
 class MessageType(StrEnum):
     """WebSocket message types"""
 
@@ -181,7 +186,7 @@ class WebSocketManager:
 
         await websocket.accept()
 
-        connection_id = uuid4().hex[:16]
+        connection_id = secrets.token_hex(8)
 
         connection = Connection(
             connection_id=connection_id,
@@ -306,25 +311,25 @@ class WebSocketManager:
             exclude: Connection IDs to exclude
         """
         # Publish to Redis for horizontal scaling
-        await self.redis.publish(
-            f"acn:ws:{channel}",
-            json.dumps(message),
-        )
+        encoded = _encode(message)
+        await self.redis.publish(f"acn:ws:{channel}", encoded)
 
         # Also send locally
-        await self._broadcast_local(channel, message, exclude)
+        await self._broadcast_local(channel, message, exclude, encoded)
 
     async def _broadcast_local(
         self,
         channel: str,
         message: dict[str, Any],
         exclude: set[str] | None = None,
+        encoded: bytes | None = None,
     ):
-        """Broadcast to local connections only"""
+        """Broadcast to local connections only (message encoded once for all of them)"""
         if channel not in self._channels:
             return
 
         exclude = exclude or set()
+        text = (encoded or _encode(message)).decode()
 
         for connection_id in self._channels[channel]:
             if connection_id in exclude:
@@ -332,7 +337,7 @@ class WebSocketManager:
 
             if connection_id in self._connections:
                 connection = self._connections[connection_id]
-                await self._send(connection, message)
+                await self._send_text(connection, text)
 
     async def send_to_user(
         self,
@@ -346,9 +351,10 @@ class WebSocketManager:
             user_id: User ID
             message: Message dict
         """
+        text = _encode(message).decode()
         for connection in self._connections.values():
             if connection.user_id == user_id:
-                await self._send(connection, message)
+                await self._send_text(connection, text)
 
     async def send_to_connection(
         self,
@@ -443,8 +449,12 @@ class WebSocketManager:
         message: dict[str, Any],
     ):
         """Send message to connection"""
+        await self._send_text(connection, _encode(message).decode())
+
+    async def _send_text(self, connection: Connection, text: str):
+        """Send an already-encoded JSON message to connection"""
         try:
-            await connection.websocket.send_json(message)
+            await connection.websocket.send_text(text)
         except Exception as e:
             logger.error(f"Failed to send to {connection.connection_id}: {e}")
 
@@ -473,14 +483,10 @@ class WebSocketManager:
                 if channel.startswith("acn:ws:"):
                     channel = channel[7:]  # Remove prefix
 
-                # Parse data
-                data = message["data"]
-                if isinstance(data, bytes):
-                    data = data.decode()
-
+                # Parse data (orjson takes bytes or str)
                 try:
-                    data = json.loads(data)
-                except json.JSONDecodeError:
+                    data = orjson.loads(message["data"])
+                except orjson.JSONDecodeError:
                     continue
 
                 # Broadcast to local connections
@@ -3,7 +3,7 @@
 from .activity_repository import PostgresActivityRepository
 from .agent_repository import PostgresAgentRepository
 from .billing_repository import PostgresBillingRepository
-from .database import get_engine, get_session_factory
+from .database import get_engine, get_read_session_factory, get_session_factory
 from .subnet_repository import PostgresSubnetRepository
 from .task_repository import PostgresTaskRepository
 
@@ -14,5 +14,6 @@ __all__ = [
     "PostgresSubnetRepository",
     "PostgresTaskRepository",
     "get_engine",
+    "get_read_session_factory",
     "get_session_factory",
 ]
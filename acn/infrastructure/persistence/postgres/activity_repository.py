@@ -6,37 +6,112 @@ Full persistent activity storage — no row limit, no TTL.
 from datetime import UTC, datetime
 from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import Integer, RowMapping, Select, bindparam, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from ....core.interfaces.activity_repository import IActivityRepository
 from .models import ActivityModel
 
+# Feed queries select plain columns: rows come back as tuples, with no ORM
+# instances to build or track in the session identity map
+_FEED_COLUMNS = (
+    ActivityModel.event_id,
+    ActivityModel.type,
+    ActivityModel.actor_type,
+    ActivityModel.actor_id,
+    ActivityModel.actor_name,
+    ActivityModel.description,
+    ActivityModel.timestamp,
+    ActivityModel.points,
+    ActivityModel.task_id,
+    ActivityModel.event_metadata.label("metadata"),
+)
+
+
+def _feed(*where: Any) -> Select[Any]:
+    """Newest-first feed query with a bound :limit"""
+    return (
+        select(*_FEED_COLUMNS)
+        .where(*where)
+        .order_by(ActivityModel.timestamp.desc())
+        .limit(bindparam("limit", type_=Integer))
+    )
+
+
+# Built once at import; callers bind values per execute (compiled form is cached)
+_FIND_RECENT = _feed()
+_FIND_BY_USER = _feed(ActivityModel.actor_id == bindparam("actor_id"))
+_FIND_BY_TASK = _feed(ActivityModel.task_id == bindparam("task_id"))
+_FIND_BY_AGENT = _feed(
+    ActivityModel.actor_type == "agent",
+    ActivityModel.actor_id == bindparam("actor_id"),
+)
+_FIND_BY_AGENTS = _feed(
+    ActivityModel.actor_type == "agent",
+    ActivityModel.actor_id.in_(bindparam("actor_ids", expanding=True)),
+)
+
+# Events are immutable: a duplicate event_id is skipped in the same statement
+_INSERT_IGNORE = pg_insert(ActivityModel).on_conflict_do_nothing(index_elements=["event_id"])
+
+
+def _insert_values(
+    event_id: str,
+    event_type: str,
+    actor_type: str,
+    actor_id: str,
+    actor_name: str,
+    description: str,
+    timestamp: str,
+    points: int | None = None,
+    task_id: str | None = None,
+    metadata: dict | None = None,
+) -> dict[str, Any]:
+    """Map save() arguments to ActivityModel attributes (one row of an INSERT)"""
+    ts = datetime.fromisoformat(timestamp)
+    if not ts.tzinfo:
+        ts = ts.replace(tzinfo=UTC)
+    return {
+        "event_id": event_id,
+        "type": event_type,
+        "actor_type": actor_type,
+        "actor_id": actor_id,
+        "actor_name": actor_name,
+        "description": description,
+        "points": points,
+        "task_id": task_id,
+        "event_metadata": metadata,
+        "timestamp": ts,
+    }
+
 
 class PostgresActivityRepository(IActivityRepository):
-    def __init__(self, session_factory: async_sessionmaker[AsyncSession]) -> None:
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        read_session_factory: async_sessionmaker[AsyncSession] | None = None,
+    ) -> None:
         self._session_factory = session_factory
+        # find_* are single SELECTs: an AUTOCOMMIT factory (get_read_session_factory)
+        # skips BEGIN/COMMIT around them
+        self._read_session_factory = read_session_factory or session_factory
 
     # =========================================================================
     # Mapping
     # =========================================================================
 
-    def _model_to_dict(self, row: ActivityModel) -> dict[str, Any]:
-        d: dict[str, Any] = {
-            "event_id": row.event_id,
-            "type": row.type,
-            "actor_type": row.actor_type,
-            "actor_id": row.actor_id,
-            "actor_name": row.actor_name,
-            "description": row.description,
-            "timestamp": row.timestamp.isoformat(),
-        }
-        if row.points is not None:
-            d["points"] = row.points
-        if row.task_id:
-            d["task_id"] = row.task_id
-        if row.event_metadata:
-            d["metadata"] = row.event_metadata
+    def _row_to_dict(self, row: RowMapping) -> dict[str, Any]:
+        # Keys are already the API names (metadata is labelled in _FEED_COLUMNS);
+        # optional fields are dropped when empty, as the feed has always returned them
+        d = dict(row)
+        d["timestamp"] = d["timestamp"].isoformat()
+        if d["points"] is None:
+            del d["points"]
+        if not d["task_id"]:
+            del d["task_id"]
+        if not d["metadata"]:
+            del d["metadata"]
         return d
 
     # =========================================================================
@@ -56,83 +131,56 @@ class PostgresActivityRepository(IActivityRepository):
         task_id: str | None = None,
         metadata: dict | None = None,
     ) -> None:
-        ts = datetime.fromisoformat(timestamp)
-        if not ts.tzinfo:
-            ts = ts.replace(tzinfo=UTC)
-
-        model = ActivityModel(
-            event_id=event_id,
-            type=event_type,
-            actor_type=actor_type,
-            actor_id=actor_id,
-            actor_name=actor_name,
-            description=description,
-            points=points,
-            task_id=task_id,
-            event_metadata=metadata,
-            timestamp=ts,
-        )
         async with self._session_factory() as session:
-            existing = await session.get(ActivityModel, event_id)
-            if not existing:
-                session.add(model)
-                await session.commit()
+            await session.execute(
+                _INSERT_IGNORE,
+                _insert_values(
+                    event_id=event_id,
+                    event_type=event_type,
+                    actor_type=actor_type,
+                    actor_id=actor_id,
+                    actor_name=actor_name,
+                    description=description,
+                    timestamp=timestamp,
+                    points=points,
+                    task_id=task_id,
+                    metadata=metadata,
+                ),
+            )
+            await session.commit()
 
-    async def find_recent(self, limit: int = 20) -> list[dict[str, Any]]:
+    async def save_many(self, events: list[dict[str, Any]]) -> None:
+        if not events:
+            return
         async with self._session_factory() as session:
-            result = await session.execute(
-                select(ActivityModel)
-                .order_by(ActivityModel.timestamp.desc())
-                .limit(limit)
-            )
-            return [self._model_to_dict(r) for r in result.scalars().all()]
+            await session.execute(_INSERT_IGNORE, [_insert_values(**event) for event in events])
+            await session.commit()
+
+    async def find_recent(self, limit: int = 20) -> list[dict[str, Any]]:
+        async with self._read_session_factory() as session:
+            result = await session.execute(_FIND_RECENT, {"limit": limit})
+            return [self._row_to_dict(r) for r in result.mappings()]
 
     async def find_by_user(self, user_id: str, limit: int = 20) -> list[dict[str, Any]]:
-        async with self._session_factory() as session:
-            result = await session.execute(
-                select(ActivityModel)
-                .where(ActivityModel.actor_id == user_id)
-                .order_by(ActivityModel.timestamp.desc())
-                .limit(limit)
-            )
-            return [self._model_to_dict(r) for r in result.scalars().all()]
+        async with self._read_session_factory() as session:
+            result = await session.execute(_FIND_BY_USER, {"actor_id": user_id, "limit": limit})
+            return [self._row_to_dict(r) for r in result.mappings()]
 
     async def find_by_task(self, task_id: str, limit: int = 50) -> list[dict[str, Any]]:
-        async with self._session_factory() as session:
-            result = await session.execute(
-                select(ActivityModel)
-                .where(ActivityModel.task_id == task_id)
-                .order_by(ActivityModel.timestamp.desc())
-                .limit(limit)
-            )
-            return [self._model_to_dict(r) for r in result.scalars().all()]
+        async with self._read_session_factory() as session:
+            result = await session.execute(_FIND_BY_TASK, {"task_id": task_id, "limit": limit})
+            return [self._row_to_dict(r) for r in result.mappings()]
 
     async def find_by_agent(self, agent_id: str, limit: int = 20) -> list[dict[str, Any]]:
-        async with self._session_factory() as session:
-            result = await session.execute(
-                select(ActivityModel)
-                .where(
-                    ActivityModel.actor_type == "agent",
-                    ActivityModel.actor_id == agent_id,
-                )
-                .order_by(ActivityModel.timestamp.desc())
-                .limit(limit)
-            )
-            return [self._model_to_dict(r) for r in result.scalars().all()]
+        async with self._read_session_factory() as session:
+            result = await session.execute(_FIND_BY_AGENT, {"actor_id": agent_id, "limit": limit})
+            return [self._row_to_dict(r) for r in result.mappings()]
 
-    async def find_by_agents(
-        self, agent_ids: list[str], limit: int = 20
-    ) -> list[dict[str, Any]]:
+    async def find_by_agents(self, agent_ids: list[str], limit: int = 20) -> list[dict[str, Any]]:
         if not agent_ids:
             return []
-        async with self._session_factory() as session:
+        async with self._read_session_factory() as session:
             result = await session.execute(
-                select(ActivityModel)
-                .where(
-                    ActivityModel.actor_type == "agent",
-                    ActivityModel.actor_id.in_(agent_ids),
-                )
-                .order_by(ActivityModel.timestamp.desc())
-                .limit(limit)
+                _FIND_BY_AGENTS, {"actor_ids": agent_ids, "limit": limit}
             )
-            return [self._model_to_dict(r) for r in result.scalars().all()]
+            return [self._row_to_dict(r) for r in result.mappings()]
@@ -167,6 +167,15 @@ class PostgresAgentRepository(IAgentRepository):
             row = await session.get(AgentModel, agent_id)
             return self._model_to_agent(row) if row else None
 
+    async def find_by_ids(self, agent_ids: list[str]) -> dict[str, Agent]:
+        if not agent_ids:
+            return {}
+        async with self._session_factory() as session:
+            result = await session.execute(
+                select(AgentModel).where(AgentModel.agent_id.in_(agent_ids))
+            )
+            return {r.agent_id: self._model_to_agent(r) for r in result.scalars().all()}
+
     async def find_by_owner_and_endpoint(self, owner: str, endpoint: str) -> Agent | None:
         async with self._session_factory() as session:
             result = await session.execute(
@@ -193,6 +202,24 @@ class PostgresAgentRepository(IAgentRepository):
             )
             return [self._model_to_agent(r) for r in result.scalars().all()]
 
+    async def find_by_subnets(self, subnet_ids: list[str]) -> dict[str, list[Agent]]:
+        """Agents of any of the given subnets, grouped per subnet (one query)."""
+        grouped: dict[str, list[Agent]] = {subnet_id: [] for subnet_id in subnet_ids}
+        if not subnet_ids:
+            return grouped
+        async with self._session_factory() as session:
+            result = await session.execute(
+                select(AgentModel).where(
+                    AgentModel.subnet_ids.op("&&")(cast(subnet_ids, ARRAY(String)))
+                )
+            )
+            for row in result.scalars().all():
+                agent = self._model_to_agent(row)
+                for subnet_id in row.subnet_ids or ():
+                    if subnet_id in grouped:
+                        grouped[subnet_id].append(agent)
+        return grouped
+
     async def find_by_skills(self, skills: list[str], status: str = "online") -> list[Agent]:
         async with self._session_factory() as session:
             stmt = select(AgentModel).where(AgentModel.status == status)
@@ -225,6 +252,15 @@ class PostgresAgentRepository(IAgentRepository):
             )
             return result.scalar() is not None
 
+    async def exists_many(self, agent_ids: list[str]) -> set[str]:
+        if not agent_ids:
+            return set()
+        async with self._session_factory() as session:
+            result = await session.execute(
+                select(AgentModel.agent_id).where(AgentModel.agent_id.in_(agent_ids))
+            )
+            return set(result.scalars().all())
+
     async def count_by_subnet(self, subnet_id: str) -> int:
         async with self._session_factory() as session:
             result = await session.execute(
@@ -234,6 +270,21 @@ class PostgresAgentRepository(IAgentRepository):
             )
             return result.scalar() or 0
 
+    async def count_by_subnets(self, subnet_ids: list[str]) -> dict[str, int]:
+        """Agent counts for several subnets via unnest + GROUP BY (one query)."""
+        counts = dict.fromkeys(subnet_ids, 0)
+        if not subnet_ids:
+            return counts
+        member = select(func.unnest(AgentModel.subnet_ids).label("subnet_id")).subquery()
+        async with self._session_factory() as session:
+            result = await session.execute(
+                select(member.c.subnet_id, func.count())
+                .where(member.c.subnet_id.in_(subnet_ids))
+                .group_by(member.c.subnet_id)
+            )
+            counts.update(result.tuples().all())
+        return counts
+
     async def find_by_api_key(self, api_key: str) -> Agent | None:
         async with self._session_factory() as session:
             result = await session.execute(
@@ -11,6 +11,7 @@ from ....services.billing_service import (
     BillingTransactionStatus,
     BillingTransactionType,
     CostBreakdown,
+    to_micros,
 )
 from .models import BillingTransactionModel
 
@@ -158,19 +159,19 @@ class PostgresBillingRepository(IBillingRepository):
             row = result.scalar_one_or_none()
             return self._model_to_tx(row) if row else None
 
-    async def record_network_fee(self, transaction_id: str, amount: float) -> None:
+    async def record_network_fee(self, transaction_id: str, amount_micros: int) -> None:
         """No-op in PG: fee is already embedded in the transaction row."""
         pass
 
-    async def reverse_network_fee(self, transaction_id: str, amount: float) -> None:
+    async def reverse_network_fee(self, transaction_id: str, amount_micros: int) -> None:
         """No-op in PG: refund status is tracked on the transaction row."""
         pass
 
-    async def get_total_network_fees(self) -> float:
+    async def get_total_network_fees(self) -> int:
         from sqlalchemy import func
         async with self._session_factory() as session:
             result = await session.execute(
                 select(func.coalesce(func.sum(BillingTransactionModel.network_fee_credits), 0.0))
                 .where(BillingTransactionModel.status == BillingTransactionStatus.COMPLETED.value)
             )
-            return float(result.scalar() or 0.0)
+            return to_micros(result.scalar() or 0)
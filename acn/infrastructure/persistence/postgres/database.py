@@ -5,6 +5,7 @@ Usage:
 
     engine = get_engine(database_url)
     async_session = get_session_factory(engine)
+    read_session = get_read_session_factory(engine)
 
     async with async_session() as session:
         ...
@@ -18,7 +19,7 @@ from sqlalchemy.ext.asyncio import (
 )
 
 
-def get_engine(database_url: str) -> AsyncEngine:
+def get_engine(database_url: str, pool_size: int = 20, max_overflow: int = 40) -> AsyncEngine:
     """Create an async SQLAlchemy engine from DATABASE_URL.
 
     Accepts both postgres:// and postgresql+asyncpg:// URL formats.
@@ -32,8 +33,8 @@ def get_engine(database_url: str) -> AsyncEngine:
 
     return create_async_engine(
         url,
-        pool_size=5,
-        max_overflow=10,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
         pool_pre_ping=True,
         echo=False,
     )
@@ -42,3 +43,12 @@ def get_engine(database_url: str) -> AsyncEngine:
 def get_session_factory(engine: AsyncEngine) -> async_sessionmaker[AsyncSession]:
     """Return a session factory bound to the given engine."""
     return async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
+
+
+def get_read_session_factory(engine: AsyncEngine) -> async_sessionmaker[AsyncSession]:
+    """Return a session factory for single-statement reads.
+
+    Sessions run in AUTOCOMMIT on the same connection pool, so a lookup is one
+    round trip with no BEGIN/COMMIT around it. Do not write through them.
+    """
+    return get_session_factory(engine.execution_options(isolation_level="AUTOCOMMIT"))
@@ -202,15 +202,26 @@ class BillingTransactionModel(Base):
 class ActivityModel(Base):
     __tablename__ = "activities"
 
+    # Feed queries filter, then ORDER BY timestamp DESC LIMIT n: each composite index
+    # serves one filter as a backward index scan, with no sort of the matching rows
+    __table_args__ = (
+        Index("ix_activities_actor_id_timestamp", "actor_id", "timestamp"),
+        Index("ix_activities_actor_type_actor_id_timestamp", "actor_type", "actor_id", "timestamp"),
+        Index("ix_activities_task_id_timestamp", "task_id", "timestamp"),
+    )
+
     event_id: Mapped[str] = mapped_column(String, primary_key=True)
     type: Mapped[str] = mapped_column(String(64), nullable=False, index=True)
     actor_type: Mapped[str] = mapped_column(String(32), nullable=False)
-    actor_id: Mapped[str] = mapped_column(String, nullable=False, index=True)
+    actor_id: Mapped[str] = mapped_column(String, nullable=False)
     actor_name: Mapped[str] = mapped_column(Text, nullable=False)
     description: Mapped[str] = mapped_column(Text, nullable=False)
     points: Mapped[int | None] = mapped_column(Integer, nullable=True)
-    task_id: Mapped[str | None] = mapped_column(String, nullable=True, index=True)
-    event_metadata: Mapped[dict | None] = mapped_column("metadata", JSONB, nullable=True)
+    task_id: Mapped[str | None] = mapped_column(String, nullable=True)
+    # none_as_null: bulk INSERTs write SQL NULL for missing metadata, not JSON null
+    event_metadata: Mapped[dict | None] = mapped_column(
+        "metadata", JSONB(none_as_null=True), nullable=True
+    )
     timestamp: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), nullable=False, default=lambda: datetime.now(UTC), index=True
     )
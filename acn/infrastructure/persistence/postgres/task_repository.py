@@ -4,11 +4,12 @@ Persistent task storage backed by Railway PostgreSQL.
 active_participants_count is NOT stored here — Redis Counter is authoritative.
 """
 
+from collections.abc import AsyncIterator
 from datetime import UTC, datetime
 
 import redis.asyncio as aioredis
 import structlog
-from sqlalchemy import String, cast, delete, func, select, update
+from sqlalchemy import String, cast, delete, func, or_, select, tuple_, update
 from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
@@ -21,8 +22,19 @@ logger = structlog.get_logger()
 
 # Redis key helpers (mirrors RedisTaskRepository conventions)
 _ACTIVE_COUNT_KEY = "acn:task:{task_id}:active_count"
+_UPDATES_CHANNEL = "acn:task:{task_id}:updates"
 _COMPLETIONS_KEY = "acn:task:completions:{task_id}"
 
+# DECR floored at 0 in one atomic round trip; returns the new value
+_LUA_FLOORED_DECR = """
+local v = redis.call('DECR', KEYS[1])
+if v < 0 then
+    redis.call('SET', KEYS[1], '0')
+    return 0
+end
+return v
+"""
+
 
 def _tz(dt: datetime | None) -> datetime | None:
     """Ensure a datetime is timezone-aware (UTC). asyncpg rejects naive datetimes."""
@@ -47,6 +59,7 @@ class PostgresTaskRepository(ITaskRepository):
     ) -> None:
         self._session_factory = session_factory
         self._redis = redis_client
+        self._floored_decr = redis_client.register_script(_LUA_FLOORED_DECR)
 
     # =========================================================================
     # Internal helpers
@@ -55,6 +68,14 @@ class PostgresTaskRepository(ITaskRepository):
     def _active_count_key(self, task_id: str) -> str:
         return _ACTIVE_COUNT_KEY.format(task_id=task_id)
 
+    async def _decr_active_count(self, task_id: str) -> int:
+        """Decrement the Redis active counter, floored at 0, in one EVALSHA."""
+        return int(await self._floored_decr(keys=[self._active_count_key(task_id)]))
+
+    async def _publish_update(self, task_id: str, event: str) -> None:
+        """Notify change-feed subscribers (same channel as the Redis repository)."""
+        await self._redis.publish(_UPDATES_CHANNEL.format(task_id=task_id), event)
+
     def _completions_key(self, task_id: str) -> str:
         return _COMPLETIONS_KEY.format(task_id=task_id)
 
@@ -202,31 +223,73 @@ class PostgresTaskRepository(ITaskRepository):
         async with self._session_factory() as session:
             existing = await session.get(TaskModel, task.task_id)
             if existing:
-                # Update all mutable columns
-                await session.execute(
-                    update(TaskModel)
-                    .where(TaskModel.task_id == task.task_id)
-                    .values(
-                        mode=model.mode,
-                        status=model.status,
-                        creator_id=model.creator_id,
-                        creator_type=model.creator_type,
-                        title=model.title,
-                        description=model.description,
-                        reward_amount=model.reward_amount,
-                        reward_currency=model.reward_currency,
-                        assignee_id=model.assignee_id,
-                        is_multi_participant=model.is_multi_participant,
-                        max_completions=model.max_completions,
-                        completed_count=model.completed_count,
-                        required_skills=model.required_skills,
-                        deadline=model.deadline,
-                        task_metadata=model.task_metadata,
-                    )
-                )
+                await session.execute(self._update_stmt(model))
+            else:
+                session.add(model)
+            await session.commit()
+        await self._publish_update(task.task_id, "save")
+
+    async def save_if_changed(self, task: Task) -> bool:
+        """Skip the UPDATE when the stored row already maps back to an equal Task."""
+        model = self._task_to_model(task)
+        async with self._session_factory() as session:
+            existing = await session.get(TaskModel, task.task_id)
+            if existing:
+                # active_participants_count lives in Redis, not in the row
+                if self._model_to_task(existing, task.active_participants_count) == task:
+                    return False
+                await session.execute(self._update_stmt(model))
             else:
                 session.add(model)
             await session.commit()
+        await self._publish_update(task.task_id, "save")
+        return True
+
+    async def save_many(self, tasks: list[Task]) -> None:
+        """One transaction: a single lookup of existing ids, then update/insert each."""
+        if not tasks:
+            return
+        models = [self._task_to_model(task) for task in tasks]
+        async with self._session_factory() as session:
+            result = await session.execute(
+                select(TaskModel.task_id).where(TaskModel.task_id.in_([m.task_id for m in models]))
+            )
+            existing_ids = set(result.scalars().all())
+            for model in models:
+                if model.task_id in existing_ids:
+                    await session.execute(self._update_stmt(model))
+                else:
+                    session.add(model)
+            await session.commit()
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for model in models:
+                pipe.publish(_UPDATES_CHANNEL.format(task_id=model.task_id), "save")
+            await pipe.execute()
+
+    @staticmethod
+    def _update_stmt(model: TaskModel):
+        """UPDATE of all mutable columns of an existing task row."""
+        return (
+            update(TaskModel)
+            .where(TaskModel.task_id == model.task_id)
+            .values(
+                mode=model.mode,
+                status=model.status,
+                creator_id=model.creator_id,
+                creator_type=model.creator_type,
+                title=model.title,
+                description=model.description,
+                reward_amount=model.reward_amount,
+                reward_currency=model.reward_currency,
+                assignee_id=model.assignee_id,
+                is_multi_participant=model.is_multi_participant,
+                max_completions=model.max_completions,
+                completed_count=model.completed_count,
+                required_skills=model.required_skills,
+                deadline=model.deadline,
+                task_metadata=model.task_metadata,
+            )
+        )
 
     async def find_by_id(self, task_id: str) -> Task | None:
         async with self._session_factory() as session:
@@ -236,6 +299,14 @@ class PostgresTaskRepository(ITaskRepository):
             active = int(await self._redis.get(self._active_count_key(task_id)) or 0)
             return self._model_to_task(row, active)
 
+    async def find_by_ids(self, task_ids: list[str]) -> dict[str, Task]:
+        if not task_ids:
+            return {}
+        async with self._session_factory() as session:
+            result = await session.execute(select(TaskModel).where(TaskModel.task_id.in_(task_ids)))
+            rows = result.scalars().all()
+        return {task.task_id: task for task in await self._rows_to_tasks(rows)}
+
     async def find_open_tasks(
         self,
         mode: TaskMode | None = None,
@@ -245,25 +316,61 @@ class PostgresTaskRepository(ITaskRepository):
         offset: int = 0,
     ) -> list[Task]:
         async with self._session_factory() as session:
-            stmt = select(TaskModel).where(TaskModel.status == TaskStatus.OPEN.value)
-            if mode:
-                stmt = stmt.where(TaskModel.mode == mode.value)
-            if skills:
-                # PostgreSQL ARRAY containment: required_skills @> ARRAY[skill1, skill2]
-                stmt = stmt.where(
-                    TaskModel.required_skills.contains(cast(skills, ARRAY(String)))
-                )
-            if task_type:
-                # task_type is stored in JSONB metadata column
-                stmt = stmt.where(
-                    TaskModel.task_metadata["task_type"].astext == task_type
-                )
+            stmt = self._open_tasks_stmt(mode, skills, task_type)
             stmt = stmt.order_by(TaskModel.created_at.desc()).limit(limit).offset(offset)
             result = await session.execute(stmt)
             rows = result.scalars().all()
 
         return await self._rows_to_tasks(rows)
 
+    async def scan_open_tasks(
+        self,
+        cursor: str | None = None,
+        mode: TaskMode | None = None,
+        skills: list[str] | None = None,
+        task_type: str | None = None,
+        limit: int = 50,
+    ) -> tuple[list[Task], str | None]:
+        """Keyset pagination on (created_at, task_id); cursor is "{created_at}|{task_id}"."""
+        async with self._session_factory() as session:
+            stmt = self._open_tasks_stmt(mode, skills, task_type)
+            if cursor:
+                created_at, _, task_id = cursor.partition("|")
+                stmt = stmt.where(
+                    tuple_(TaskModel.created_at, TaskModel.task_id)
+                    < tuple_(datetime.fromisoformat(created_at), task_id)
+                )
+            stmt = stmt.order_by(TaskModel.created_at.desc(), TaskModel.task_id.desc()).limit(limit)
+            result = await session.execute(stmt)
+            rows = result.scalars().all()
+
+        next_cursor = None
+        if len(rows) == limit:
+            next_cursor = f"{rows[-1].created_at.isoformat()}|{rows[-1].task_id}"
+        return await self._rows_to_tasks(rows), next_cursor
+
+    @staticmethod
+    def _open_tasks_stmt(mode: TaskMode | None, skills: list[str] | None, task_type: str | None):
+        """SELECT of open tasks with the find_open_tasks filters applied."""
+        stmt = select(TaskModel).where(TaskModel.status == TaskStatus.OPEN.value)
+        if mode:
+            stmt = stmt.where(TaskModel.mode == mode.value)
+        if skills:
+            # Tasks the given skills cover, as in the Redis backend (required ⊆ skills):
+            # required_skills <@ ARRAY[skill1, skill2]; NULL means no skills required
+            stmt = stmt.where(
+                or_(
+                    TaskModel.required_skills.is_(None),
+                    TaskModel.required_skills.bool_op("<@")(cast(skills, ARRAY(String))),
+                )
+            )
+        if task_type:
+            # task_type is stored in JSONB metadata column
+            stmt = stmt.where(
+                TaskModel.task_metadata["task_type"].astext == task_type
+            )
+        return stmt
+
     async def _rows_to_tasks(self, rows: list[TaskModel]) -> list[Task]:
         """Convert ORM rows to Task entities, batch-fetching active counts via pipeline."""
         if not rows:
@@ -310,13 +417,46 @@ class PostgresTaskRepository(ITaskRepository):
             rows = result.scalars().all()
         return await self._rows_to_tasks(rows)
 
+    async def find_by_creator_and_status(
+        self, creator_id: str, status: TaskStatus, limit: int = 50
+    ) -> list[Task]:
+        async with self._session_factory() as session:
+            result = await session.execute(
+                select(TaskModel)
+                .where(TaskModel.creator_id == creator_id, TaskModel.status == status.value)
+                .order_by(TaskModel.created_at.desc())
+                .limit(limit)
+            )
+            rows = result.scalars().all()
+        return await self._rows_to_tasks(rows)
+
     async def delete(self, task_id: str) -> bool:
         async with self._session_factory() as session:
             result = await session.execute(
                 delete(TaskModel).where(TaskModel.task_id == task_id)
             )
             await session.commit()
-            return result.rowcount > 0
+        if result.rowcount > 0:
+            await self._publish_update(task_id, "delete")
+            return True
+        return False
+
+    async def subscribe_task_updates(self, task_id: str) -> AsyncIterator[Task]:
+        """Yield the task after every write to it; ends when the task is deleted."""
+        channel = _UPDATES_CHANNEL.format(task_id=task_id)
+        pubsub = self._redis.pubsub()
+        await pubsub.subscribe(channel)
+        try:
+            async for message in pubsub.listen():
+                if message["type"] != "message":
+                    continue
+                task = await self.find_by_id(task_id)
+                if task is None:
+                    return
+                yield task
+        finally:
+            await pubsub.unsubscribe(channel)
+            await pubsub.aclose()
 
     async def exists(self, task_id: str) -> bool:
         async with self._session_factory() as session:
@@ -326,6 +466,7 @@ class PostgresTaskRepository(ITaskRepository):
             return result.scalar() is not None
 
     async def count_open_tasks(self) -> int:
+        """Count open tasks through the status index (O(open tasks), not O(1))"""
         async with self._session_factory() as session:
             result = await session.execute(
                 select(func.count()).where(TaskModel.status == TaskStatus.OPEN.value)
@@ -399,6 +540,34 @@ class PostgresTaskRepository(ITaskRepository):
             result = await session.execute(stmt)
             return [self._model_to_participation(r) for r in result.scalars().all()]
 
+    async def iter_participations_by_task(
+        self,
+        task_id: str,
+        status: str | None = None,
+        batch_size: int = 100,
+    ) -> AsyncIterator[Participation]:
+        """Keyset-paginated on (joined_at, participation_id), one query per batch."""
+        after: tuple[datetime, str] | None = None
+        while True:
+            stmt = select(ParticipationModel).where(ParticipationModel.task_id == task_id)
+            if status:
+                stmt = stmt.where(ParticipationModel.status == status)
+            if after:
+                stmt = stmt.where(
+                    tuple_(ParticipationModel.joined_at, ParticipationModel.participation_id)
+                    > tuple_(*after)
+                )
+            stmt = stmt.order_by(
+                ParticipationModel.joined_at.asc(), ParticipationModel.participation_id.asc()
+            ).limit(batch_size)
+            async with self._session_factory() as session:
+                rows = (await session.execute(stmt)).scalars().all()
+            for row in rows:
+                yield self._model_to_participation(row)
+            if len(rows) < batch_size:
+                return
+            after = (rows[-1].joined_at, rows[-1].participation_id)
+
     async def find_participation_by_user_and_task(
         self,
         task_id: str,
@@ -505,6 +674,7 @@ class PostgresTaskRepository(ITaskRepository):
 
         # Sync Redis counter after commit (best-effort, for display performance)
         await self._redis.incr(self._active_count_key(task_id))
+        await self._publish_update(task_id, "join")
         return participation.participation_id
 
     async def atomic_cancel_participation(
@@ -533,11 +703,8 @@ class PostgresTaskRepository(ITaskRepository):
                 row.cancelled_at = datetime.fromisoformat(now_iso)
 
         if was_active:
-            # Decrement Redis counter, floor at 0
-            key = self._active_count_key(task_id)
-            new_val = await self._redis.decr(key)
-            if new_val < 0:
-                await self._redis.set(key, 0)
+            await self._decr_active_count(task_id)
+        await self._publish_update(task_id, "cancel")
 
     async def atomic_complete_participation(
         self,
@@ -571,11 +738,8 @@ class PostgresTaskRepository(ITaskRepository):
                 )
                 new_count = count_result.scalar() or 1
 
-        # Decrement Redis active counter
-        key = self._active_count_key(task_id)
-        new_val = await self._redis.decr(key)
-        if new_val < 0:
-            await self._redis.set(key, 0)
+        await self._decr_active_count(task_id)
+        await self._publish_update(task_id, "complete")
 
         return new_count
 
@@ -602,12 +766,10 @@ class PostgresTaskRepository(ITaskRepository):
         count = len(rows)
         if count:
             await self._redis.set(self._active_count_key(task_id), 0)
+            await self._publish_update(task_id, "cancel")
         return count
 
     async def decrement_active_count(self, task_id: str) -> int:
-        key = self._active_count_key(task_id)
-        new_val = await self._redis.decr(key)
-        if new_val < 0:
-            await self._redis.set(key, 0)
-            return 0
-        return new_val
+        count = await self._decr_active_count(task_id)
+        await self._publish_update(task_id, "decrement")
+        return count
@@ -132,6 +132,20 @@ class RedisAgentRepository(IAgentRepository):
 
         return self._dict_to_agent(agent_dict)
 
+    async def find_by_ids(self, agent_ids: list[str]) -> dict[str, Agent]:
+        """Find several agents by ID (PIPELINE)."""
+        if not agent_ids:
+            return {}
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for agent_id in agent_ids:
+                pipe.hgetall(f"acn:agents:{agent_id}")
+            rows = await pipe.execute()
+        return {
+            agent_id: self._dict_to_agent(row)
+            for agent_id, row in zip(agent_ids, rows, strict=True)
+            if row
+        }
+
     async def find_by_owner_and_endpoint(self, owner: str, endpoint: str) -> Agent | None:
         """Find agent by owner and endpoint"""
         endpoint_key = f"acn:agents:by_endpoint:{owner}:{endpoint}"
@@ -164,12 +178,21 @@ class RedisAgentRepository(IAgentRepository):
     async def find_by_subnet(self, subnet_id: str) -> list[Agent]:
         """Find all agents in a subnet"""
         agent_ids = await self.redis.smembers(f"acn:subnets:{subnet_id}:agents")
-        agents = []
-        for agent_id in agent_ids:
-            agent = await self.find_by_id(agent_id)
-            if agent:
-                agents.append(agent)
-        return agents
+        return list((await self.find_by_ids(list(agent_ids))).values())
+
+    async def find_by_subnets(self, subnet_ids: list[str]) -> dict[str, list[Agent]]:
+        """Find agents of several subnets (PIPELINE for members, one batch load)."""
+        if not subnet_ids:
+            return {}
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for subnet_id in subnet_ids:
+                pipe.smembers(f"acn:subnets:{subnet_id}:agents")
+            members = await pipe.execute()
+        agents = await self.find_by_ids(list(set().union(*members)))
+        return {
+            subnet_id: [agents[aid] for aid in agent_ids if aid in agents]
+            for subnet_id, agent_ids in zip(subnet_ids, members, strict=True)
+        }
 
     async def find_by_skills(self, skills: list[str], status: str = "online") -> list[Agent]:
         """Find agents by skills. status='all' returns agents with skills regardless of status."""
@@ -231,10 +254,30 @@ class RedisAgentRepository(IAgentRepository):
         """Check if agent exists"""
         return await self.redis.exists(f"acn:agents:{agent_id}") > 0
 
+    async def exists_many(self, agent_ids: list[str]) -> set[str]:
+        """Return subset of agent_ids that exist (PIPELINE)."""
+        if not agent_ids:
+            return set()
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for agent_id in agent_ids:
+                pipe.exists(f"acn:agents:{agent_id}")
+            results = await pipe.execute()
+        return {aid for aid, found in zip(agent_ids, results, strict=True) if found}
+
     async def count_by_subnet(self, subnet_id: str) -> int:
         """Count agents in a subnet"""
         return await self.redis.scard(f"acn:subnets:{subnet_id}:agents")
 
+    async def count_by_subnets(self, subnet_ids: list[str]) -> dict[str, int]:
+        """Count agents in several subnets (PIPELINE)."""
+        if not subnet_ids:
+            return {}
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for subnet_id in subnet_ids:
+                pipe.scard(f"acn:subnets:{subnet_id}:agents")
+            counts = await pipe.execute()
+        return dict(zip(subnet_ids, counts, strict=True))
+
     async def find_by_api_key(self, api_key: str) -> Agent | None:
         """Find agent by API key (for autonomous agent authentication)"""
         api_key_index = f"acn:agents:by_api_key:{api_key}"
@@ -3,15 +3,38 @@
 Concrete implementation using Redis for task persistence.
 """
 
-import json
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator
 from datetime import UTC, datetime
 from typing import Any
 
+import orjson
 import redis.asyncio as redis  # type: ignore[import-untyped]
 
 from ....core.entities import Participation, ParticipationStatus, Task, TaskMode, TaskStatus
 from ....core.interfaces import ITaskRepository
 
+# Participation statuses treated as "still in progress" for per-user lookups
+_UNSETTLED_PARTICIPATION_STATUSES = frozenset(
+    {ParticipationStatus.APPLIED, ParticipationStatus.ACTIVE, ParticipationStatus.SUBMITTED}
+)
+
+
+def _to_hash_value(value: Any) -> Any:
+    """Encode one entity field for a Redis hash: JSON containers, 'true'/'false' booleans"""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, list | dict):
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+    return value
+
+
+def _to_hash_fields(data: dict) -> dict:
+    """Encode an entity's to_dict() output as hash fields in one pass, dropping None"""
+    return {k: _to_hash_value(v) for k, v in data.items() if v is not None}
+
+
 # ============================================================================
 # Lua Scripts for Atomic Operations
 # ============================================================================
@@ -23,6 +46,7 @@ local active_count_key = KEYS[2]
 local participations_key = KEYS[3]
 local user_task_key = KEYS[4]
 local participation_key = KEYS[5]
+local user_index_key = KEYS[6]
 
 local max_completions = tonumber(ARGV[1])  -- -1 means unlimited
 local allow_repeat = ARGV[2] == "true"
@@ -55,21 +79,27 @@ if not allow_repeat then
     end
 end
 
--- Create participation
+-- Create participation (single HSET with every field)
 local data = cjson.decode(participation_data)
+local fields = {}
 for k, v in pairs(data) do
-    redis.call('HSET', participation_key, k, tostring(v))
+    fields[#fields + 1] = k
+    fields[#fields + 1] = tostring(v)
 end
+redis.call('HSET', participation_key, unpack(fields))
 
 -- Update indices
-redis.call('INCR', active_count_key)
+local new_active = redis.call('INCR', active_count_key)
 redis.call('ZADD', participations_key, joined_at_score, participation_id)
 redis.call('SADD', user_task_key, participation_id)
+redis.call('LPUSH', user_index_key, participation_id)
 
 -- Sync active_participants_count on task hash
-local new_active = tonumber(redis.call('GET', active_count_key) or '0')
 redis.call('HSET', task_key, 'active_participants_count', tostring(new_active))
 
+-- Notify change-feed subscribers
+redis.call('PUBLISH', task_key .. ':updates', 'join')
+
 return participation_id
 """
 
@@ -89,20 +119,27 @@ end
 
 local was_active = (current_status == 'active' or current_status == 'submitted')
 
-redis.call('HSET', participation_key, 'status', 'cancelled')
-redis.call('HSET', participation_key, 'cancelled_at', ARGV[1])
+-- Touch only the changed fields
+redis.call('HSET', participation_key, 'status', 'cancelled', 'cancelled_at', ARGV[1])
 
+local new_active
 if was_active then
-    redis.call('DECR', active_count_key)
     -- Ensure non-negative
-    local cnt = tonumber(redis.call('GET', active_count_key) or '0')
-    if cnt < 0 then redis.call('SET', active_count_key, '0') end
+    new_active = redis.call('DECR', active_count_key)
+    if new_active < 0 then
+        redis.call('SET', active_count_key, '0')
+        new_active = 0
+    end
+else
+    new_active = tonumber(redis.call('GET', active_count_key) or '0')
 end
 
 -- Sync to task hash
-local new_active = tonumber(redis.call('GET', active_count_key) or '0')
 redis.call('HSET', task_key, 'active_participants_count', tostring(new_active))
 
+-- Notify change-feed subscribers
+redis.call('PUBLISH', task_key .. ':updates', 'cancel')
+
 return 'OK'
 """
 
@@ -117,30 +154,82 @@ if current_status ~= 'submitted' then
     return redis.error_reply('NOT_SUBMITTED')
 end
 
--- Update participation
-redis.call('HSET', participation_key, 'status', 'completed')
-redis.call('HSET', participation_key, 'completed_at', ARGV[1])
+-- Update participation (single HSET)
+local fields = {'status', 'completed', 'completed_at', ARGV[1]}
 if ARGV[2] ~= '' then
-    redis.call('HSET', participation_key, 'reviewed_by', ARGV[2])
+    fields[#fields + 1] = 'reviewed_by'
+    fields[#fields + 1] = ARGV[2]
 end
 if ARGV[3] ~= '' then
-    redis.call('HSET', participation_key, 'review_notes', ARGV[3])
+    fields[#fields + 1] = 'review_notes'
+    fields[#fields + 1] = ARGV[3]
 end
+redis.call('HSET', participation_key, unpack(fields))
 
--- Decrement active, increment completed
-redis.call('DECR', active_count_key)
-local cnt = tonumber(redis.call('GET', active_count_key) or '0')
-if cnt < 0 then redis.call('SET', active_count_key, '0') end
+-- Decrement active (floored at 0), increment completed
+local new_active = redis.call('DECR', active_count_key)
+if new_active < 0 then
+    redis.call('SET', active_count_key, '0')
+    new_active = 0
+end
 
+-- Bump completed_count and mirror the active count on the task hash
 local new_completed = redis.call('HINCRBY', task_key, 'completed_count', 1)
-
--- Sync active to task hash
-local new_active = tonumber(redis.call('GET', active_count_key) or '0')
 redis.call('HSET', task_key, 'active_participants_count', tostring(new_active))
 
+-- Notify change-feed subscribers
+redis.call('PUBLISH', task_key .. ':updates', 'complete')
+
 return new_completed
 """
 
+# Batch cancel: cancel every active/submitted participation of a task
+LUA_BATCH_CANCEL_PARTICIPATIONS = """
+local participations_key = KEYS[1]
+local active_count_key = KEYS[2]
+local task_key = KEYS[3]
+
+local cancelled = 0
+for _, pid in ipairs(redis.call('ZRANGE', participations_key, 0, -1)) do
+    local participation_key = 'acn:participation:' .. pid
+    local status = redis.call('HGET', participation_key, 'status')
+    if status == 'active' or status == 'submitted' then
+        redis.call('HSET', participation_key, 'status', 'cancelled', 'cancelled_at', ARGV[1])
+        cancelled = cancelled + 1
+    end
+end
+
+if cancelled > 0 then
+    local new_active = redis.call('DECRBY', active_count_key, cancelled)
+    if new_active < 0 then
+        redis.call('SET', active_count_key, '0')
+        new_active = 0
+    end
+    redis.call('HSET', task_key, 'active_participants_count', tostring(new_active))
+    redis.call('PUBLISH', task_key .. ':updates', 'cancel')
+end
+
+return cancelled
+"""
+
+# Atomic decrement: floor active count at 0 + sync to task hash
+LUA_DECREMENT_ACTIVE = """
+local active_count_key = KEYS[1]
+local task_key = KEYS[2]
+
+local new_active = redis.call('DECR', active_count_key)
+if new_active < 0 then
+    redis.call('SET', active_count_key, '0')
+    new_active = 0
+end
+redis.call('HSET', task_key, 'active_participants_count', tostring(new_active))
+
+-- Notify change-feed subscribers
+redis.call('PUBLISH', task_key .. ':updates', 'decrement')
+
+return new_active
+"""
+
 
 class RedisTaskRepository(ITaskRepository):
     """
@@ -158,6 +247,7 @@ class RedisTaskRepository(ITaskRepository):
     - acn:tasks:by_assignee:{assignee_id} → Set (task_ids)
     - acn:task:completions:{task_id} → Set (agent_ids who completed)
     - acn:task:{task_id}:active_count → Counter (active participations)
+    - acn:task:{task_id}:updates → Pub/Sub channel (one message per write to the task)
 
     Key Structure — Participations:
     - acn:participation:{participation_id} → Hash (participation data)
@@ -165,19 +255,40 @@ class RedisTaskRepository(ITaskRepository):
     - acn:user:{user_id}:task:{task_id}:participations → Set (participation_ids for this user+task)
     """
 
-    def __init__(self, redis_client: redis.Redis):
+    def __init__(
+        self,
+        redis_client: redis.Redis,
+        cache_ttl: float = 0.0,
+        cache_size: int = 10_000,
+    ):
         """
         Initialize Redis Task Repository
 
         Args:
             redis_client: Redis async client instance
+            cache_ttl: Seconds a find_by_id result may be served from process
+                memory (0 disables the cache). Writes made through this
+                repository invalidate it, writes from other processes do not,
+                so only enable it where one process owns the task keyspace.
+            cache_size: Maximum number of cached tasks (LRU eviction)
         """
         self.redis = redis_client
 
+        # find_by_id cache: task_id -> (expires_at, raw hash reply). The raw
+        # reply is cached, not the Task, so every hit hydrates a fresh entity
+        # that callers are free to mutate.
+        self._cache_ttl = cache_ttl
+        self._cache_size = cache_size
+        self._cache: OrderedDict[str, tuple[float, dict]] = OrderedDict()
+        self._cache_hits = 0
+        self._cache_misses = 0
+
         # Register Lua scripts (will be loaded on first use)
         self._join_script: Any | None = None
         self._cancel_script: Any | None = None
         self._complete_script: Any | None = None
+        self._decrement_script: Any | None = None
+        self._batch_cancel_script: Any | None = None
 
     def _get_join_script(self) -> Any:
         if self._join_script is None:
@@ -194,82 +305,144 @@ class RedisTaskRepository(ITaskRepository):
             self._complete_script = self.redis.register_script(LUA_COMPLETE_PARTICIPATION)
         return self._complete_script
 
+    def _get_decrement_script(self) -> Any:
+        if self._decrement_script is None:
+            self._decrement_script = self.redis.register_script(LUA_DECREMENT_ACTIVE)
+        return self._decrement_script
+
+    def _get_batch_cancel_script(self) -> Any:
+        if self._batch_cancel_script is None:
+            self._batch_cancel_script = self.redis.register_script(LUA_BATCH_CANCEL_PARTICIPATIONS)
+        return self._batch_cancel_script
+
     async def save(self, task: Task) -> None:
         """Save or update a task in Redis"""
-        task_key = f"acn:task:{task.task_id}"
+        # Check for existing task to clean up old indices (never from cache)
+        existing = await self._fetch_task(task.task_id)
 
-        # Check for existing task to clean up old indices
-        existing = await self.find_by_id(task.task_id)
+        # Hash write + index updates in one round trip
+        async with self.redis.pipeline(transaction=False) as pipe:
+            self._queue_save(pipe, task, existing)
+            await pipe.execute()
 
-        # Serialize task to dict
-        task_dict = task.to_dict()
+        self._invalidate(task.task_id)
 
-        # Convert lists/dicts to JSON strings for Redis
-        task_dict["required_skills"] = json.dumps(task_dict.get("required_skills", []))
-        task_dict["submission_artifacts"] = json.dumps(task_dict.get("submission_artifacts", []))
-        task_dict["metadata"] = json.dumps(task_dict.get("metadata", {}))
+    async def save_if_changed(self, task: Task) -> bool:
+        """Save unless the stored hash already hydrates to an equal Task"""
+        existing = await self._fetch_task(task.task_id)
+        if existing == task:
+            return False
 
-        # Filter out None values and convert booleans
-        clean_dict = {}
-        for k, v in task_dict.items():
-            if v is None:
-                continue
-            elif isinstance(v, bool):
-                clean_dict[k] = "true" if v else "false"
-            else:
-                clean_dict[k] = v
+        async with self.redis.pipeline(transaction=False) as pipe:
+            self._queue_save(pipe, task, existing)
+            await pipe.execute()
 
-        # Save to Redis hash
-        await self.redis.hset(task_key, mapping=clean_dict)  # type: ignore[arg-type]
+        self._invalidate(task.task_id)
+        return True
 
-        # ===== Update Indices (batched via pipeline to reduce round-trips) =====
-        async with self.redis.pipeline(transaction=False) as pipe:
-            # 1. Open tasks index (sorted by created_at)
-            if task.status == TaskStatus.OPEN:
-                timestamp = task.created_at.timestamp()
-                pipe.zadd("acn:tasks:open", {task.task_id: timestamp})
-            else:
-                pipe.zrem("acn:tasks:open", task.task_id)
-
-            # 2. Mode index
-            pipe.sadd(f"acn:tasks:by_mode:{task.mode.value}", task.task_id)
-            if existing and existing.mode != task.mode:
-                pipe.srem(f"acn:tasks:by_mode:{existing.mode.value}", task.task_id)
-
-            # 3. Status index
-            pipe.sadd(f"acn:tasks:by_status:{task.status.value}", task.task_id)
-            if existing and existing.status != task.status:
-                pipe.srem(f"acn:tasks:by_status:{existing.status.value}", task.task_id)
-
-            # 4. Skill indices
-            for skill in task.required_skills:
-                pipe.sadd(f"acn:tasks:by_skill:{skill}", task.task_id)
-            if existing:
-                for old_skill in existing.required_skills:
-                    if old_skill not in task.required_skills:
-                        pipe.srem(f"acn:tasks:by_skill:{old_skill}", task.task_id)
-
-            # 5. Creator index
-            pipe.sadd(f"acn:tasks:by_creator:{task.creator_id}", task.task_id)
-
-            # 6. Assignee index
-            if task.assignee_id:
-                pipe.sadd(f"acn:tasks:by_assignee:{task.assignee_id}", task.task_id)
-            if existing and existing.assignee_id and existing.assignee_id != task.assignee_id:
-                pipe.srem(f"acn:tasks:by_assignee:{existing.assignee_id}", task.task_id)
+    async def save_many(self, tasks: list[Task]) -> None:
+        """Save or update several tasks: one read pipeline + one write pipeline"""
+        if not tasks:
+            return
+
+        existing = await self.find_by_ids([task.task_id for task in tasks])
 
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for task in tasks:
+                self._queue_save(pipe, task, existing.get(task.task_id))
             await pipe.execute()
 
-    async def find_by_id(self, task_id: str) -> Task | None:
-        """Find task by ID"""
-        task_key = f"acn:task:{task_id}"
-        task_dict = await self.redis.hgetall(task_key)
+        for task in tasks:
+            self._invalidate(task.task_id)
+
+    @staticmethod
+    def _queue_save(pipe: Any, task: Task, existing: Task | None) -> None:
+        """Queue the hash write and every index update for one task on a pipeline"""
+        task_key = f"acn:task:{task.task_id}"
+        data = task.to_dict()
+
+        # Save to Redis hash. None values are not stored, so fields that were
+        # cleared (e.g. a reopened task's assignee) are deleted, not left stale.
+        pipe.hset(task_key, mapping=_to_hash_fields(data))
+        cleared = [k for k, v in data.items() if v is None]
+        if cleared:
+            pipe.hdel(task_key, *cleared)
+
+        pipe.publish(f"{task_key}:updates", "save")
+
+        # 1. Open tasks index (sorted by created_at)
+        if task.status == TaskStatus.OPEN:
+            timestamp = task.created_at.timestamp()
+            pipe.zadd("acn:tasks:open", {task.task_id: timestamp})
+        else:
+            pipe.zrem("acn:tasks:open", task.task_id)
+
+        # 2. Mode index
+        pipe.sadd(f"acn:tasks:by_mode:{task.mode}", task.task_id)
+        if existing and existing.mode != task.mode:
+            pipe.srem(f"acn:tasks:by_mode:{existing.mode}", task.task_id)
+
+        # 3. Status index
+        pipe.sadd(f"acn:tasks:by_status:{task.status}", task.task_id)
+        if existing and existing.status != task.status:
+            pipe.srem(f"acn:tasks:by_status:{existing.status}", task.task_id)
+
+        # 4. Skill indices
+        for skill in task.required_skills:
+            pipe.sadd(f"acn:tasks:by_skill:{skill}", task.task_id)
+        if existing:
+            for old_skill in existing.required_skills:
+                if old_skill not in task.required_skills:
+                    pipe.srem(f"acn:tasks:by_skill:{old_skill}", task.task_id)
 
+        # 5. Creator index
+        pipe.sadd(f"acn:tasks:by_creator:{task.creator_id}", task.task_id)
+
+        # 6. Assignee index
+        if task.assignee_id:
+            pipe.sadd(f"acn:tasks:by_assignee:{task.assignee_id}", task.task_id)
+        if existing and existing.assignee_id and existing.assignee_id != task.assignee_id:
+            pipe.srem(f"acn:tasks:by_assignee:{existing.assignee_id}", task.task_id)
+
+    async def find_by_id(self, task_id: str) -> Task | None:
+        """Find task by ID (served from the in-process cache when enabled)"""
+        if not self._cache_ttl:
+            return await self._fetch_task(task_id)
+
+        now = time.monotonic()
+        entry = self._cache.get(task_id)
+        if entry is not None and entry[0] > now:
+            self._cache.move_to_end(task_id)
+            self._cache_hits += 1
+            return self._dict_to_task(entry[1])
+
+        self._cache_misses += 1
+        task_dict = await self.redis.hgetall(f"acn:task:{task_id}")
         if not task_dict:
+            self._cache.pop(task_id, None)
             return None
 
+        self._cache[task_id] = (now + self._cache_ttl, task_dict)
+        self._cache.move_to_end(task_id)
+        if len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
         return self._dict_to_task(task_dict)
 
+    def cache_stats(self) -> dict[str, Any]:
+        """find_by_id cache counters for observability"""
+        lookups = self._cache_hits + self._cache_misses
+        return {
+            "enabled": bool(self._cache_ttl),
+            "size": len(self._cache),
+            "hits": self._cache_hits,
+            "misses": self._cache_misses,
+            "hit_ratio": self._cache_hits / lookups if lookups else 0.0,
+        }
+
+    async def find_by_ids(self, task_ids: list[str]) -> dict[str, Task]:
+        """Find several tasks by ID (PIPELINE)"""
+        return {task.task_id: task for task in await self._load_tasks(task_ids)}
+
     async def find_open_tasks(
         self,
         mode: TaskMode | None = None,
@@ -279,20 +452,27 @@ class RedisTaskRepository(ITaskRepository):
         offset: int = 0,
     ) -> list[Task]:
         """Find open tasks with optional filters"""
-        # Get open task IDs (sorted by created_at, newest first)
-        task_ids = await self.redis.zrevrange("acn:tasks:open", offset, offset + limit - 1)
+        if mode:
+            # Intersect server-side so the page holds only tasks of this mode.
+            # The set's weight is 0, so members keep their created_at score;
+            # MULTI keeps the shared scratch key private to this call.
+            scratch_key = f"acn:tasks:open:by_mode:{mode}"
+            async with self.redis.pipeline(transaction=True) as pipe:
+                pipe.zinterstore(scratch_key, {"acn:tasks:open": 1, f"acn:tasks:by_mode:{mode}": 0})
+                pipe.zrevrange(scratch_key, offset, offset + limit - 1)
+                pipe.delete(scratch_key)
+                _, task_ids, _ = await pipe.execute()
+        else:
+            # Get open task IDs (sorted by created_at, newest first)
+            task_ids = await self.redis.zrevrange("acn:tasks:open", offset, offset + limit - 1)
 
-        tasks = []
-        for task_id in task_ids:
-            task_id = task_id.decode() if isinstance(task_id, bytes) else task_id
-            task = await self.find_by_id(task_id)
-            if not task:
-                continue
+        skill_set = frozenset(skills) if skills else None
 
-            # Apply filters
-            if mode and task.mode != mode:
-                continue
-            if skills and not task.matches_skills(skills):
+        tasks = []
+        for task in await self._load_tasks(task_ids):
+            # Skill coverage (required ⊆ agent skills) is not a set
+            # intersection, so it stays a per-task check
+            if skill_set and not task.matches_skills_set(skill_set):
                 continue
             if task_type and task.task_type != task_type:
                 continue
@@ -301,48 +481,71 @@ class RedisTaskRepository(ITaskRepository):
 
         return tasks
 
+    async def scan_open_tasks(
+        self,
+        cursor: str | None = None,
+        mode: TaskMode | None = None,
+        skills: list[str] | None = None,
+        task_type: str | None = None,
+        limit: int = 50,
+    ) -> tuple[list[Task], str | None]:
+        """Keyset-paginate acn:tasks:open by score: O(log N + limit) at any depth"""
+        # Cursor is "{score}:{n}": resume at score, skipping the n entries
+        # sharing that score which earlier pages already returned
+        max_score, skip = "+inf", 0
+        if cursor:
+            max_score, _, seen = cursor.partition(":")
+            skip = int(seen)
+
+        entries = await self.redis.zrevrangebyscore(
+            "acn:tasks:open", max_score, "-inf", start=skip, num=limit, withscores=True
+        )
+        if not entries:
+            return [], None
+
+        last_score = entries[-1][1]
+        tied = sum(1 for _, score in entries if score == last_score)
+        if cursor and last_score == float(max_score):
+            tied += skip
+        next_cursor = f"{last_score!r}:{tied}" if len(entries) == limit else None
+
+        skill_set = frozenset(skills) if skills else None
+        tasks = [
+            task
+            for task in await self._load_tasks([task_id for task_id, _ in entries])
+            if (not mode or task.mode == mode)
+            and (not skill_set or task.matches_skills_set(skill_set))
+            and (not task_type or task.task_type == task_type)
+        ]
+        return tasks, next_cursor
+
     async def find_by_creator(self, creator_id: str, limit: int = 50) -> list[Task]:
         """Find tasks created by a specific user/agent"""
         task_ids = await self.redis.smembers(f"acn:tasks:by_creator:{creator_id}")
-        tasks = []
-
-        for task_id in list(task_ids)[:limit]:
-            task_id = task_id.decode() if isinstance(task_id, bytes) else task_id
-            task = await self.find_by_id(task_id)
-            if task:
-                tasks.append(task)
-
-        return tasks
+        return await self._load_tasks(list(task_ids)[:limit])
 
     async def find_by_assignee(self, assignee_id: str, limit: int = 50) -> list[Task]:
         """Find tasks assigned to a specific agent"""
         task_ids = await self.redis.smembers(f"acn:tasks:by_assignee:{assignee_id}")
-        tasks = []
-
-        for task_id in list(task_ids)[:limit]:
-            task_id = task_id.decode() if isinstance(task_id, bytes) else task_id
-            task = await self.find_by_id(task_id)
-            if task:
-                tasks.append(task)
-
-        return tasks
+        return await self._load_tasks(list(task_ids)[:limit])
 
     async def find_by_status(self, status: TaskStatus, limit: int = 50) -> list[Task]:
         """Find tasks by status"""
-        task_ids = await self.redis.smembers(f"acn:tasks:by_status:{status.value}")
-        tasks = []
-
-        for task_id in list(task_ids)[:limit]:
-            task_id = task_id.decode() if isinstance(task_id, bytes) else task_id
-            task = await self.find_by_id(task_id)
-            if task:
-                tasks.append(task)
+        task_ids = await self.redis.smembers(f"acn:tasks:by_status:{status}")
+        return await self._load_tasks(list(task_ids)[:limit])
 
-        return tasks
+    async def find_by_creator_and_status(
+        self, creator_id: str, status: TaskStatus, limit: int = 50
+    ) -> list[Task]:
+        """Find a creator's tasks in a status (server-side SINTER of both indices)"""
+        task_ids = await self.redis.sinter(
+            f"acn:tasks:by_creator:{creator_id}", f"acn:tasks:by_status:{status}"
+        )
+        return await self._load_tasks(list(task_ids)[:limit])
 
     async def delete(self, task_id: str) -> bool:
         """Delete a task"""
-        task = await self.find_by_id(task_id)
+        task = await self._fetch_task(task_id)
         if not task:
             return False
 
@@ -352,8 +555,8 @@ class RedisTaskRepository(ITaskRepository):
 
         # Remove from indices
         await self.redis.zrem("acn:tasks:open", task_id)
-        await self.redis.srem(f"acn:tasks:by_mode:{task.mode.value}", task_id)
-        await self.redis.srem(f"acn:tasks:by_status:{task.status.value}", task_id)
+        await self.redis.srem(f"acn:tasks:by_mode:{task.mode}", task_id)
+        await self.redis.srem(f"acn:tasks:by_status:{task.status}", task_id)
         await self.redis.srem(f"acn:tasks:by_creator:{task.creator_id}", task_id)
 
         if task.assignee_id:
@@ -365,14 +568,33 @@ class RedisTaskRepository(ITaskRepository):
         # Remove completions
         await self.redis.delete(f"acn:task:completions:{task_id}")
 
+        await self.redis.publish(f"{task_key}:updates", "delete")
+        self._invalidate(task_id)
         return True
 
+    async def subscribe_task_updates(self, task_id: str) -> AsyncIterator[Task]:
+        """Yield the task after every write to it; ends when the task is deleted"""
+        channel = f"acn:task:{task_id}:updates"
+        pubsub = self.redis.pubsub()
+        await pubsub.subscribe(channel)
+        try:
+            async for message in pubsub.listen():
+                if message["type"] != "message":
+                    continue
+                task = await self._fetch_task(task_id)
+                if task is None:
+                    return
+                yield task
+        finally:
+            await pubsub.unsubscribe(channel)
+            await pubsub.aclose()
+
     async def exists(self, task_id: str) -> bool:
         """Check if task exists"""
         return await self.redis.exists(f"acn:task:{task_id}") > 0
 
     async def count_open_tasks(self) -> int:
-        """Count total open tasks"""
+        """Count total open tasks (ZCARD: O(1), the sorted set tracks its size)"""
         return await self.redis.zcard("acn:tasks:open")
 
     async def record_completion(self, task_id: str, agent_id: str) -> None:
@@ -380,43 +602,36 @@ class RedisTaskRepository(ITaskRepository):
         await self.redis.sadd(f"acn:task:completions:{task_id}", agent_id)
 
     async def has_completed(self, task_id: str, agent_id: str) -> bool:
-        """Check if agent has already completed this task"""
-        return await self.redis.sismember(f"acn:task:completions:{task_id}", agent_id)
+        """Check if agent has already completed this task (O(1) SISMEMBER)"""
+        return bool(await self.redis.sismember(f"acn:task:completions:{task_id}", agent_id))
 
     # ========== Participation CRUD ==========
 
     async def save_participation(self, participation: Participation) -> None:
         """Save or update a participation in Redis"""
         key = f"acn:participation:{participation.participation_id}"
-        p_dict = participation.to_dict()
-
-        # Convert lists to JSON strings
-        p_dict["submission_artifacts"] = json.dumps(p_dict.get("submission_artifacts", []))
-
-        # Filter None values and convert booleans
-        clean = {}
-        for k, v in p_dict.items():
-            if v is None:
-                continue
-            elif isinstance(v, bool):
-                clean[k] = "true" if v else "false"
-            else:
-                clean[k] = v
+        clean = _to_hash_fields(participation.to_dict())
 
         await self.redis.hset(key, mapping=clean)  # type: ignore[arg-type]
 
     async def add_application(self, task_id: str, participation: Participation) -> None:
         """Add an application (participation with status APPLIED) for an assigned task."""
-        await self.save_participation(participation)
-        participations_key = f"acn:task:{task_id}:participations"
-        await self.redis.zadd(
-            participations_key,
-            {participation.participation_id: participation.joined_at.timestamp()},
-        )
-        user_task_key = f"acn:user:{participation.participant_id}:task:{task_id}:participations"
-        await self.redis.sadd(user_task_key, participation.participation_id)
-        user_index_key = f"acn:user:{participation.participant_id}:all_participations"
-        await self.redis.lpush(user_index_key, participation.participation_id)
+        pid = participation.participation_id
+        user_id = participation.participant_id
+
+        # Independent writes: one MULTI/EXEC round trip, no script needed
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.hset(
+                f"acn:participation:{pid}",
+                mapping=_to_hash_fields(participation.to_dict()),  # type: ignore[arg-type]
+            )
+            pipe.zadd(
+                f"acn:task:{task_id}:participations",
+                {pid: participation.joined_at.timestamp()},
+            )
+            pipe.sadd(f"acn:user:{user_id}:task:{task_id}:participations", pid)
+            pipe.lpush(f"acn:user:{user_id}:all_participations", pid)
+            await pipe.execute()
 
     async def find_participation_by_id(self, participation_id: str) -> Participation | None:
         """Find participation by ID"""
@@ -437,15 +652,29 @@ class RedisTaskRepository(ITaskRepository):
         key = f"acn:task:{task_id}:participations"
         pids = await self.redis.zrevrange(key, offset, offset + limit - 1)
 
-        results = []
-        for pid in pids:
-            pid_str = pid.decode() if isinstance(pid, bytes) else pid
-            p = await self.find_participation_by_id(pid_str)
-            if p and (status is None or p.status.value == status):
-                results.append(p)
-
+        results = await self._load_participations(pids)
+        if status is not None:
+            results = [p for p in results if p.status == status]
         return results
 
+    async def iter_participations_by_task(
+        self,
+        task_id: str,
+        status: str | None = None,
+        batch_size: int = 100,
+    ) -> AsyncIterator[Participation]:
+        """Stream participations in joined_at order, one ZRANGE + pipeline per batch"""
+        key = f"acn:task:{task_id}:participations"
+        start = 0
+        while True:
+            pids = await self.redis.zrange(key, start, start + batch_size - 1)
+            for p in await self._load_participations(pids):
+                if status is None or p.status == status:
+                    yield p
+            if len(pids) < batch_size:
+                return
+            start += batch_size
+
     async def find_participation_by_user_and_task(
         self,
         task_id: str,
@@ -457,16 +686,8 @@ class RedisTaskRepository(ITaskRepository):
         pids = await self.redis.smembers(user_task_key)
 
         latest: Participation | None = None
-        for pid in pids:
-            pid_str = pid.decode() if isinstance(pid, bytes) else pid
-            p = await self.find_participation_by_id(pid_str)
-            if not p:
-                continue
-            if active_only and p.status not in (
-                ParticipationStatus.APPLIED,
-                ParticipationStatus.ACTIVE,
-                ParticipationStatus.SUBMITTED,
-            ):
+        for p in await self._load_participations(list(pids)):
+            if active_only and p.status not in _UNSETTLED_PARTICIPATION_STATUSES:
                 continue
             if latest is None or p.joined_at > latest.joined_at:
                 latest = p
@@ -485,14 +706,7 @@ class RedisTaskRepository(ITaskRepository):
         """
         index_key = f"acn:user:{participant_id}:all_participations"
         participation_ids = await self.redis.lrange(index_key, 0, limit - 1)
-
-        results: list[Participation] = []
-        for pid_raw in participation_ids:
-            pid = pid_raw.decode() if isinstance(pid_raw, bytes) else pid_raw
-            p = await self.find_participation_by_id(pid)
-            if p is not None:
-                results.append(p)
-        return results
+        return await self._load_participations(participation_ids)
 
     async def atomic_join_task(
         self,
@@ -509,14 +723,18 @@ class RedisTaskRepository(ITaskRepository):
         participations_key = f"acn:task:{task_id}:participations"
         user_task_key = f"acn:user:{participation.participant_id}:task:{task_id}:participations"
         participation_key = f"acn:participation:{participation.participation_id}"
+        user_index_key = f"acn:user:{participation.participant_id}:all_participations"
 
         # Serialize participation data for Lua
-        p_dict = participation.to_dict()
-        p_dict["submission_artifacts"] = json.dumps(p_dict.get("submission_artifacts", []))
-        # Remove None values
-        clean = {k: str(v) for k, v in p_dict.items() if v is not None}
+        p_dict = participation.to_dict(exclude_none=True)
+        p_dict["submission_artifacts"] = orjson.dumps(
+            p_dict.get("submission_artifacts", []), option=orjson.OPT_NON_STR_KEYS
+        ).decode()
+        clean = {k: str(v) for k, v in p_dict.items()}
 
         try:
+            # One EVALSHA covers the checks, the participation write and every
+            # index, including the per-user list read by find_participations_by_user
             result = await script(
                 keys=[
                     task_key,
@@ -524,6 +742,7 @@ class RedisTaskRepository(ITaskRepository):
                     participations_key,
                     user_task_key,
                     participation_key,
+                    user_index_key,
                 ],
                 args=[
                     max_completions if max_completions is not None else -1,
@@ -531,14 +750,11 @@ class RedisTaskRepository(ITaskRepository):
                     participation.participation_id,
                     participation.participant_id,
                     str(participation.joined_at.timestamp()),
-                    json.dumps(clean),
+                    orjson.dumps(clean),
                 ],
             )
-            pid = result.decode() if isinstance(result, bytes) else result
-            # Maintain global user participation index for find_participations_by_user
-            user_index_key = f"acn:user:{participation.participant_id}:all_participations"
-            await self.redis.lpush(user_index_key, pid)
-            return pid
+            self._invalidate(task_id)
+            return result.decode() if isinstance(result, bytes) else result
         except redis.ResponseError as e:
             err = str(e)
             if "TASK_NOT_OPEN" in err:
@@ -566,6 +782,7 @@ class RedisTaskRepository(ITaskRepository):
                 keys=[participation_key, active_count_key, task_key],
                 args=[datetime.now(UTC).isoformat()],
             )
+            self._invalidate(task_id)
         except redis.ResponseError as e:
             err = str(e)
             if "NOT_FOUND" in err:
@@ -599,6 +816,7 @@ class RedisTaskRepository(ITaskRepository):
                     notes or "",
                 ],
             )
+            self._invalidate(task_id)
             return int(result)
         except redis.ResponseError as e:
             if "NOT_SUBMITTED" in str(e):
@@ -607,14 +825,10 @@ class RedisTaskRepository(ITaskRepository):
 
     async def decrement_active_count(self, task_id: str) -> int:
         """Decrement active participant count for a task; floors at 0. Returns new count."""
-        active_key = f"acn:task:{task_id}:active_count"
-        task_key = f"acn:task:{task_id}"
-        new_count = await self.redis.decr(active_key)
-        if new_count < 0:
-            await self.redis.set(active_key, 0)
-            new_count = 0
-        await self.redis.hset(task_key, "active_participants_count", str(new_count))
-        return new_count
+        script = self._get_decrement_script()
+        result = await script(keys=[f"acn:task:{task_id}:active_count", f"acn:task:{task_id}"])
+        self._invalidate(task_id)
+        return int(result)
 
     async def count_active_participations(self, task_id: str) -> int:
         """Count active participations for a task"""
@@ -623,34 +837,71 @@ class RedisTaskRepository(ITaskRepository):
         return int(count) if count else 0
 
     async def batch_cancel_participations(self, task_id: str) -> int:
-        """Cancel all active/submitted participations for a task"""
-        participations_key = f"acn:task:{task_id}:participations"
-        pids = await self.redis.zrange(participations_key, 0, -1)
+        """Cancel all active/submitted participations for a task in one script call"""
+        script = self._get_batch_cancel_script()
+        result = await script(
+            keys=[
+                f"acn:task:{task_id}:participations",
+                f"acn:task:{task_id}:active_count",
+                f"acn:task:{task_id}",
+            ],
+            args=[datetime.now(UTC).isoformat()],
+        )
+        self._invalidate(task_id)
+        return int(result)
 
-        cancelled = 0
-        for pid in pids:
-            pid_str = pid.decode() if isinstance(pid, bytes) else pid
-            p = await self.find_participation_by_id(pid_str)
-            if p and p.status in (ParticipationStatus.ACTIVE, ParticipationStatus.SUBMITTED):
-                try:
-                    await self.atomic_cancel_participation(pid_str, task_id)
-                    cancelled += 1
-                except ValueError:
-                    pass  # Already cancelled/completed — skip
+    # ========== Helpers ==========
 
-        return cancelled
+    async def _fetch_task(self, task_id: str) -> Task | None:
+        """Read a task straight from Redis, bypassing the find_by_id cache"""
+        task_dict = await self.redis.hgetall(f"acn:task:{task_id}")
+        if not task_dict:
+            return None
+        return self._dict_to_task(task_dict)
 
-    # ========== Helpers ==========
+    def _invalidate(self, task_id: str) -> None:
+        """Drop a task from the find_by_id cache after a write touching its hash"""
+        self._cache.pop(task_id, None)
 
-    def _dict_to_participation(self, data: dict) -> Participation:
-        """Convert Redis hash dict to Participation entity"""
+    @staticmethod
+    def _decode_hash(data: dict) -> dict:
+        """Decode a Redis hash reply (bytes keys/values) to str"""
         decoded = {}
         for k, v in data.items():
             key = k.decode() if isinstance(k, bytes) else k
             val = v.decode() if isinstance(v, bytes) else v
             decoded[key] = val
+        return decoded
+
+    def _dict_to_participation(self, data: dict) -> Participation:
+        """Convert Redis hash dict to Participation entity"""
+        return Participation.from_dict(self._decode_hash(data))
 
-        return Participation.from_dict(decoded)
+    async def _load_participations(self, pids: list) -> list[Participation]:
+        """Fetch participation hashes in one pipelined round-trip, preserving order"""
+        if not pids:
+            return []
+
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for pid in pids:
+                pid_str = pid.decode() if isinstance(pid, bytes) else pid
+                pipe.hgetall(f"acn:participation:{pid_str}")
+            rows = await pipe.execute()
+
+        return Participation.from_dict_many(self._decode_hash(row) for row in rows if row)
+
+    async def _load_tasks(self, task_ids: list) -> list[Task]:
+        """Fetch task hashes in one pipelined round-trip, preserving order"""
+        if not task_ids:
+            return []
+
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for task_id in task_ids:
+                task_id = task_id.decode() if isinstance(task_id, bytes) else task_id
+                pipe.hgetall(f"acn:task:{task_id}")
+            rows = await pipe.execute()
+
+        return [self._dict_to_task(row) for row in rows if row]
 
     def _dict_to_task(self, task_dict: dict) -> Task:
         """Convert Redis dict to Task entity"""
@@ -663,9 +914,16 @@ class RedisTaskRepository(ITaskRepository):
 
         # Parse JSON fields — guard against corrupted Redis values
         def _safe_loads(raw: str, default: Any) -> Any:
+            if not raw:
+                return default
+            # Empty containers are the common case; skip the decoder
+            if raw == "[]":
+                return []
+            if raw == "{}":
+                return {}
             try:
-                return json.loads(raw) if raw else default
-            except (json.JSONDecodeError, TypeError):
+                return orjson.loads(raw)
+            except (orjson.JSONDecodeError, TypeError):
                 import logging as _logging
 
                 _logging.getLogger(__name__).warning(
@@ -718,4 +976,6 @@ class RedisTaskRepository(ITaskRepository):
             else:
                 data.pop(field_name, None)
 
-        return Task(**data)
+        # Stored tasks were validated on creation; from_dict skips __init__ and
+        # ignores hash fields that are not Task fields
+        return Task.from_dict(data)
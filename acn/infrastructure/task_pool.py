@@ -4,9 +4,11 @@ High-level abstraction for the ACN Task Pool.
 Provides simplified interface for agents to discover and work on tasks.
 """
 
+from collections.abc import Collection, Mapping
+
 import structlog
 
-from ..core.entities import Participation, Task, TaskMode
+from ..core.entities import Participation, Task, TaskMode, filter_tasks_for_agent
 from ..core.interfaces import ITaskRepository
 
 logger = structlog.get_logger()
@@ -128,10 +130,31 @@ class TaskPool:
         tasks = await self.repository.find_open_tasks(limit=limit * 2)  # Get more to filter
 
         # Filter to tasks the agent can do
-        matching_tasks = [task for task in tasks if task.matches_skills(agent_skills)][:limit]
+        matching_tasks = filter_tasks_for_agent(tasks, agent_skills)[:limit]
 
         return matching_tasks
 
+    async def find_tasks_for_agents(
+        self,
+        agent_skills: Mapping[str, Collection[str]],
+        limit: int = 20,
+    ) -> dict[str, list[Task]]:
+        """
+        Find suitable tasks for several agents from a single open-task scan
+
+        Args:
+            agent_skills: Agent ID → that agent's skills
+            limit: Maximum number of tasks per agent
+
+        Returns:
+            Agent ID → list of matching tasks
+        """
+        tasks = await self.repository.find_open_tasks(limit=limit * 2)
+        return {
+            agent_id: filter_tasks_for_agent(tasks, skills)[:limit]
+            for agent_id, skills in agent_skills.items()
+        }
+
     async def count_open(self) -> int:
         """
         Count open tasks in the pool
@@ -32,6 +32,8 @@ from typing import Any
 
 from redis.asyncio import Redis
 
+from ..infrastructure.messaging import dlq_keys
+
 
 class Analytics:
     """
@@ -526,9 +528,12 @@ class Analytics:
     # =========================================================================
 
     async def _get_dlq_count(self) -> int:
-        """Get count of messages in dead letter queue"""
-        count = await self.redis.llen("acn:dlq")
-        return count
+        """Get count of messages in dead letter queue (all shards + pre-sharding list)"""
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for key in dlq_keys():
+                pipe.llen(key)
+            counts = await pipe.execute()
+        return sum(counts)
 
     async def _count_agents_in_subnet(self, subnet_id: str) -> int:
         """Count agents in a specific subnet"""
@@ -6,13 +6,13 @@ Clean Architecture implementation: Route → TaskService → Repository
 from typing import Annotated
 
 import structlog
-from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from fastapi import Request as _Request
 from pydantic import BaseModel, Field
 
 from ..auth.middleware import require_permission
 from ..config import get_settings
-from ..core.entities import TaskMode, TaskStatus
+from ..core.entities import ApprovalType, TaskMode, TaskStatus
 from ..services import TaskNotFoundException, TaskService
 from .dependencies import AgentApiKeyDep, InternalTokenDep, limiter  # type: ignore[import-untyped]
 
@@ -207,7 +207,7 @@ def _task_to_response(task) -> TaskResponse:
         active_participants_count=task.active_participants_count,
         completed_count=task.completed_count,
         max_completions=task.max_completions,
-        approval_type=task.approval_type,
+        approval_type=task.approval_type.value,
         validator_id=task.validator_id,
         created_at=task.created_at.isoformat(),
         deadline=task.deadline.isoformat() if task.deadline else None,
@@ -370,6 +370,13 @@ async def create_task(
     except ValueError:
         raise HTTPException(status_code=400, detail=f"Invalid mode: {body.mode}") from None
 
+    try:
+        approval_type = ApprovalType(body.approval_type)
+    except ValueError:
+        raise HTTPException(
+            status_code=400, detail=f"Invalid approval type: {body.approval_type}"
+        ) from None
+
     try:
         task = await task_service.create_task(
             creator_type=creator_type_header,
@@ -389,7 +396,7 @@ async def create_task(
             deadline_hours=body.deadline_hours,
             assignee_id=body.assignee_id,
             assignee_name=body.assignee_name,
-            approval_type=body.approval_type,
+            approval_type=approval_type,
             validator_id=body.validator_id,
             metadata=body.metadata,
         )
@@ -690,7 +697,8 @@ async def get_task_internal(
     """
     try:
         task = await task_service.get_task(task_id)
-        return task.to_dict()
+        # Pre-encoded body skips FastAPI's jsonable_encoder pass over the dict
+        return Response(content=task.to_bytes(), media_type="application/json")
     except TaskNotFoundException:
         raise HTTPException(status_code=404, detail="Task not found") from None
 
@@ -195,17 +195,14 @@ class ActivityService:
                 return await self._repository.find_by_agent(agent_id, limit=limit)
             return await self._repository.find_recent(limit=limit)
 
-        event_ids: list = []
-
-        # Handle multiple agent IDs - fetch and merge activities
+        # Handle multiple agent IDs - fetch all agent indexes in one round trip
         if agent_ids:
-            all_event_ids = set()
-            for aid in agent_ids:
-                list_key = f"{ACTIVITY_BY_AGENT}{aid}"
-                ids = await self.redis.lrange(list_key, 0, limit - 1)
-                for eid in ids:
-                    all_event_ids.add(eid.decode() if isinstance(eid, bytes) else eid)
-            event_ids = list(all_event_ids)[:limit]
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for aid in agent_ids:
+                    pipe.lrange(f"{ACTIVITY_BY_AGENT}{aid}", 0, limit - 1)
+                id_lists = await pipe.execute()
+            # dict.fromkeys dedupes while keeping first-seen order
+            event_ids = list(dict.fromkeys(eid for ids in id_lists for eid in ids))
         else:
             # Select the right list based on single filter
             if user_id:
@@ -220,11 +217,17 @@ class ActivityService:
             # Get event IDs
             event_ids = await self.redis.lrange(list_key, 0, limit - 1)
 
-        activities = []
-        for event_id in event_ids:
-            event_id = event_id.decode() if isinstance(event_id, bytes) else event_id
-            event_data = await self.redis.hgetall(f"{ACTIVITY_PREFIX}{event_id}")
+        if not event_ids:
+            return []
+
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for event_id in event_ids:
+                event_id = event_id.decode() if isinstance(event_id, bytes) else event_id
+                pipe.hgetall(f"{ACTIVITY_PREFIX}{event_id}")
+            rows = await pipe.execute()
 
+        activities = []
+        for event_data in rows:
             if event_data:
                 event_dict = {
                     k.decode() if isinstance(k, bytes) else k: v.decode()
@@ -242,6 +245,11 @@ class ActivityService:
 
                 activities.append(event_dict)
 
+        if agent_ids:
+            # Merge per-agent feeds: newest first across all agents
+            activities.sort(key=lambda a: a.get("timestamp", ""), reverse=True)
+            del activities[limit:]
+
         return activities
 
     # ========== Convenience Methods ==========
@@ -17,7 +17,7 @@ from __future__ import annotations
 import json
 import uuid
 from datetime import UTC, datetime
-from decimal import Decimal
+from decimal import ROUND_HALF_UP, Decimal
 from enum import StrEnum
 from typing import TYPE_CHECKING
 
@@ -59,6 +59,20 @@ class BillingConfig:
     # Maximum single transaction (in credits) - safety limit
     MAX_TRANSACTION_CREDITS: float = 100000.0
 
+    # Network fee ledger unit: totals are kept as integer micro-credits
+    MICROS_PER_CREDIT: int = 1_000_000
+
+
+def to_micros(amount: float | Decimal) -> int:
+    """Convert a credit amount to integer micro-credits (fees are quantized to 0.0001)"""
+    scaled = Decimal(str(amount)) * BillingConfig.MICROS_PER_CREDIT
+    return int(scaled.to_integral_value(rounding=ROUND_HALF_UP))
+
+
+def from_micros(micros: int) -> float:
+    """Convert integer micro-credits back to a credit amount"""
+    return micros / BillingConfig.MICROS_PER_CREDIT
+
 
 # =============================================================================
 # Billing Models
@@ -509,16 +523,17 @@ class BillingService:
     async def get_network_fee_stats(self) -> dict:
         """Get network fee statistics (for platform admin)"""
         if self._repository:
-            total = await self._repository.get_total_network_fees()
-            return {
-                "total_network_fees_credits": total,
-                "fee_rate": BillingConfig.NETWORK_FEE_RATE,
-            }
-        key = f"{self._prefix}network_fees:total"
-        total = await self.redis.get(key)
+            total_micros = await self._repository.get_total_network_fees()
+        else:
+            # Totals recorded before the integer ledger live in the float key
+            legacy, micros = await self.redis.mget(
+                f"{self._prefix}network_fees:total",
+                f"{self._prefix}network_fees:total_micros",
+            )
+            total_micros = (to_micros(float(legacy)) if legacy else 0) + int(micros or 0)
 
         return {
-            "total_network_fees_credits": float(total) if total else 0.0,
+            "total_network_fees_credits": from_micros(total_micros),
             "fee_rate": BillingConfig.NETWORK_FEE_RATE,
         }
 
@@ -552,20 +567,20 @@ class BillingService:
     async def _record_network_fee(self, transaction_id: str, amount: float):
         """Record network fee for accounting"""
         if self._repository:
-            await self._repository.record_network_fee(transaction_id, amount)
+            await self._repository.record_network_fee(transaction_id, to_micros(amount))
             return
-        total_key = f"{self._prefix}network_fees:total"
-        await self.redis.incrbyfloat(total_key, amount)
+        total_key = f"{self._prefix}network_fees:total_micros"
+        await self.redis.incrby(total_key, to_micros(amount))
         fee_key = f"{self._prefix}network_fees:tx:{transaction_id}"
         await self.redis.set(fee_key, str(amount))
 
     async def _reverse_network_fee(self, transaction_id: str, amount: float):
         """Reverse network fee (for refunds)"""
         if self._repository:
-            await self._repository.reverse_network_fee(transaction_id, amount)
+            await self._repository.reverse_network_fee(transaction_id, to_micros(amount))
             return
-        total_key = f"{self._prefix}network_fees:total"
-        await self.redis.incrbyfloat(total_key, -amount)
+        total_key = f"{self._prefix}network_fees:total_micros"
+        await self.redis.decrby(total_key, to_micros(amount))
         fee_key = f"{self._prefix}network_fees:tx:{transaction_id}"
         await self.redis.set(fee_key, f"REVERSED:{amount}")
 
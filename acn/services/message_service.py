@@ -61,13 +61,12 @@ class MessageService:
         Raises:
             AgentNotFoundException: If sender or recipient not found
         """
-        # Verify sender exists
-        sender = await self.agent_repository.find_by_id(from_agent_id)
-        if not sender:
+        # Verify sender and recipient exist (single lookup)
+        agents = await self.agent_repository.find_by_ids([from_agent_id, to_agent_id])
+        if from_agent_id not in agents:
             raise AgentNotFoundException(f"Sender agent {from_agent_id} not found")
 
-        # Verify recipient exists
-        recipient = await self.agent_repository.find_by_id(to_agent_id)
+        recipient = agents.get(to_agent_id)
         if not recipient:
             raise AgentNotFoundException(f"Recipient agent {to_agent_id} not found")
 
@@ -8,7 +8,14 @@ from uuid import uuid4
 
 import structlog
 
-from ..core.entities import Participation, ParticipationStatus, Task, TaskMode, TaskStatus
+from ..core.entities import (
+    ApprovalType,
+    Participation,
+    ParticipationStatus,
+    Task,
+    TaskMode,
+    TaskStatus,
+)
 from ..core.interfaces import IAgentRepository, IEscrowProvider, ITaskRepository
 from ..infrastructure.task_pool import TaskPool
 from ..protocols.ap2 import PaymentTaskManager, WebhookEventType, WebhookService
@@ -84,7 +91,7 @@ class TaskService:
         deadline_hours: int | None = None,
         assignee_id: str | None = None,
         assignee_name: str | None = None,
-        approval_type: str = "manual",
+        approval_type: ApprovalType = ApprovalType.MANUAL,
         validator_id: str | None = None,
         metadata: dict | None = None,
     ) -> Task:
@@ -126,12 +133,13 @@ class TaskService:
         # - Single completion: budget = reward_amount
         reward_float = float(reward_amount) if reward_amount else 0
         if (is_repeatable or is_multi_participant) and max_completions:
-            total_budget = str(reward_float * max_completions)
+            budget_float = reward_float * max_completions
         else:
-            total_budget = str(reward_float)
+            budget_float = reward_float
             # For single-participant open tasks, enforce max_completions = 1
             if mode == TaskMode.OPEN and not is_repeatable and not is_multi_participant:
                 max_completions = 1
+        total_budget = str(budget_float)
 
         # Create task entity
         # Note: __post_init__ handles backward compat sync:
@@ -169,19 +177,19 @@ class TaskService:
             task.assigned_at = datetime.now(UTC)
 
         # 统一 escrow 锁定：human 和 agent 创建者都走 v2 escrow
-        if self.escrow and reward_currency.lower() in (AP_POINTS, "points") and float(total_budget) > 0:
+        if self.escrow and reward_currency.lower() in (AP_POINTS, "points") and budget_float > 0:
             logger.info(
                 "escrow_lock_attempt",
                 creator_type=creator_type,
                 creator_id=creator_id,
                 task_id=task_id,
-                amount=float(total_budget),
+                amount=budget_float,
             )
             result = await self.escrow.lock_v2(
                 task_id=task_id,
                 creator_id=creator_id,
                 creator_type=creator_type,
-                amount=float(total_budget),
+                amount=budget_float,
                 description=f"Escrow for task: {title}",
             )
             if not result.success:
@@ -451,7 +459,7 @@ class TaskService:
                 )
 
             # Auto-approval for participation
-            if task.approval_type == "auto":
+            if task.approval_type == ApprovalType.AUTO:
                 await self._auto_complete_participation(task, p)
 
             logger.info(
@@ -506,10 +514,10 @@ class TaskService:
             approval_type=task.approval_type,
         )
 
-        if task.approval_type == "auto":
+        if task.approval_type == ApprovalType.AUTO:
             logger.info("auto_approving_task", task_id=task_id)
             task = await self._auto_complete_task(task)
-        elif task.approval_type == "validator" and task.validator_id:
+        elif task.approval_type == ApprovalType.VALIDATOR and task.validator_id:
             logger.info(
                 "validator_approval_pending",
                 task_id=task_id,
@@ -753,7 +761,7 @@ class TaskService:
             )
         else:
             # Reject participation — set status to REJECTED and decrement active count
-            was_active = p.status in (ParticipationStatus.ACTIVE, ParticipationStatus.SUBMITTED)
+            was_active = p.is_active()
             p.reject(approver_id, notes)
             await self.repository.save_participation(p)
 
@@ -859,11 +867,10 @@ class TaskService:
             except Exception as e:
                 logger.warning("escrow_accept_failed", task_id=task_id, error=str(e))
 
-        # Cancel other applied participations
-        others = await self.repository.find_participations_by_task(
-            task_id, status=ParticipationStatus.APPLIED.value, limit=100
-        )
-        for other in others:
+        # Cancel other applied participations (all of them, however many applied)
+        async for other in self.repository.iter_participations_by_task(
+            task_id, status=ParticipationStatus.APPLIED.value
+        ):
             if other.participation_id != participation_id:
                 other.cancel()
                 await self.repository.save_participation(other)
@@ -1184,7 +1191,9 @@ class TaskService:
             List of tasks
         """
         # Use different repository methods based on filters
-        if creator_id:
+        if creator_id and status:
+            tasks = await self.repository.find_by_creator_and_status(creator_id, status, limit)
+        elif creator_id:
             tasks = await self.repository.find_by_creator(creator_id, limit)
         elif assignee_id:
             tasks = await self.repository.find_by_assignee(assignee_id, limit)
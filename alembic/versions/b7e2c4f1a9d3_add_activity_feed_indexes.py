@@ -0,0 +1,68 @@
+"""add composite activity feed indexes
+
+Revision ID: b7e2c4f1a9d3
+Revises: a1b2c3d4e5f6
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "b7e2c4f1a9d3"
+down_revision: str | None = "a1b2c3d4e5f6"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# (name, columns): each serves one feed filter + ORDER BY timestamp DESC
+_INDEXES = (
+    ("ix_activities_actor_id_timestamp", ["actor_id", "timestamp"]),
+    ("ix_activities_actor_type_actor_id_timestamp", ["actor_type", "actor_id", "timestamp"]),
+    ("ix_activities_task_id_timestamp", ["task_id", "timestamp"]),
+)
+# Single-column indexes that are now leading prefixes of the composites above
+_SUPERSEDED = (
+    ("ix_activities_actor_id", ["actor_id"]),
+    ("ix_activities_task_id", ["task_id"]),
+)
+
+
+def upgrade() -> None:
+    # CONCURRENTLY keeps the activities table writable while the indexes build;
+    # it cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        for name, columns in _INDEXES:
+            op.create_index(
+                name,
+                "activities",
+                columns,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+        for name, _ in _SUPERSEDED:
+            op.drop_index(
+                name,
+                table_name="activities",
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, columns in _SUPERSEDED:
+            op.create_index(
+                name,
+                "activities",
+                columns,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+        for name, _ in _INDEXES:
+            op.drop_index(
+                name,
+                table_name="activities",
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
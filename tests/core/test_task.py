@@ -4,16 +4,20 @@ Tests pure business logic for multi-participant task support,
 including Participation lifecycle, Task.can_join(), and backward compatibility.
 """
 
-from datetime import datetime
+import json
+from datetime import UTC, datetime, timedelta
 
 import pytest
 
 from acn.core.entities.task import (
+    ApprovalType,
     Participation,
     ParticipationStatus,
     Task,
     TaskMode,
     TaskStatus,
+    filter_past_deadline,
+    filter_tasks_for_agent,
 )
 
 # ============================================================================
@@ -174,6 +178,17 @@ class TestParticipation:
         assert p.rejected_at is None
         assert p.reviewed_by is None
 
+    def test_resubmit_without_artifacts_clears_previous(self):
+        """Resubmitting with no artifacts drops the earlier ones"""
+        p = _make_participation()
+        empty = p.submission_artifacts
+        p.submit("First", [{"url": "https://example.com/a"}])
+        p.reject(reason="Redo")
+        p.resubmit("Second")
+
+        assert p.submission_artifacts == []
+        assert empty == []
+
     def test_resubmit_from_wrong_status_raises(self):
         """Cannot resubmit when not REJECTED"""
         p = _make_participation(status=ParticipationStatus.ACTIVE)
@@ -214,6 +229,14 @@ class TestParticipation:
 
     # ── Serialization ──
 
+    def test_is_active(self):
+        p = _make_participation()
+        assert p.is_active() is True
+        p.submit("work")
+        assert p.is_active() is True
+        p.reject(reason="no")
+        assert p.is_active() is False
+
     def test_to_dict(self):
         """Test participation serialization"""
         p = _make_participation()
@@ -226,6 +249,24 @@ class TestParticipation:
         assert d["submission"] is None
         assert d["completed_at"] is None
 
+    def test_to_dict_status_serializes_as_plain_string(self):
+        """Enum members in to_dict() encode to their string value"""
+        d = _make_participation().to_dict()
+        assert json.dumps(d["status"]) == '"active"'
+
+    def test_to_dict_exclude_none(self):
+        """exclude_none drops unset optional fields but keeps populated ones"""
+        p = _make_participation()
+        d = p.to_dict(exclude_none=True)
+
+        assert "submission" not in d
+        assert "completed_at" not in d
+        assert d["status"] == "active"
+
+        restored = Participation.from_dict(d)
+        assert restored.submission is None
+        assert restored.completed_at is None
+
     def test_from_dict_round_trip(self):
         """Test dict → Participation → dict round trip"""
         original = _make_participation()
@@ -241,11 +282,61 @@ class TestParticipation:
         assert restored.reviewed_by == "r1"
         assert restored.completed_at is not None
 
+    def test_from_dict_does_not_mutate_input(self):
+        """from_dict parses values without touching the caller's dict"""
+        d = _make_participation().to_dict()
+        d["submission_artifacts"] = '[{"url": "https://example.com"}]'
+        snapshot = dict(d)
+
+        restored = Participation.from_dict(d)
+
+        assert d == snapshot
+        assert restored.submission_artifacts == [{"url": "https://example.com"}]
+        assert isinstance(restored.joined_at, datetime)
+
+    def test_from_dict_ignores_unknown_and_requires_ids(self):
+        """Unknown keys are dropped; missing required fields raise TypeError"""
+        d = _make_participation().to_dict()
+        d["legacy_field"] = "x"
+        assert Participation.from_dict(d).participation_id == "part-001"
+
+        del d["participant_id"]
+        with pytest.raises(TypeError, match="participant_id"):
+            Participation.from_dict(d)
+
+    def test_from_dict_many_matches_from_dict(self):
+        """Bulk hydration yields the same entities as per-row from_dict"""
+        rows = [_make_participation(participation_id=f"part-{i}").to_dict() for i in range(3)]
+        rows[1]["status"] = "submitted"
+
+        bulk = Participation.from_dict_many(rows)
+
+        assert bulk == [Participation.from_dict(r) for r in rows]
+        assert bulk[1].status == ParticipationStatus.SUBMITTED
+
+    def test_from_dict_rejects_unknown_status(self):
+        d = _make_participation().to_dict()
+        d["status"] = "bogus"
+        with pytest.raises(ValueError):
+            Participation.from_dict(d)
+
+    def test_to_bytes_round_trip(self):
+        original = _make_participation()
+        original.submit("work", [{"url": "https://example.com"}])
+
+        raw = original.to_bytes()
+        assert json.loads(raw) == json.loads(json.dumps(original.to_dict()))
+        assert Participation.from_bytes(raw) == original
+
     def test_new_id_is_unique(self):
         """Each call to new_id() returns a unique UUID"""
         ids = {Participation.new_id() for _ in range(100)}
         assert len(ids) == 100
 
+    def test_slotted(self):
+        """Instances carry no per-object __dict__"""
+        assert not hasattr(_make_participation(), "__dict__")
+
 
 # ============================================================================
 # Task Entity — Multi-Participant Tests
@@ -379,6 +470,13 @@ class TestTaskBasic:
         with pytest.raises(ValueError, match="creator_id cannot be empty"):
             _make_task(creator_id="")
 
+    def test_approval_type_coerced_from_string(self):
+        t = _make_task(approval_type="auto")
+        assert t.approval_type is ApprovalType.AUTO
+        assert Task.from_dict(t.to_dict()).approval_type is ApprovalType.AUTO
+        with pytest.raises(ValueError):
+            _make_task(approval_type="bogus")
+
     def test_accept_single_participant(self):
         """Single-participant accept flow"""
         t = _make_task()
@@ -397,6 +495,18 @@ class TestTaskBasic:
         assert t.status == TaskStatus.COMPLETED
         assert t.completed_count == 1
 
+    def test_repeatable_complete_resets_until_max(self):
+        t = _make_task(is_multi_participant=True, max_completions=2)
+        t.status = TaskStatus.SUBMITTED
+        t.complete(reviewer_id="r1", notes="ok")
+        assert t.status == TaskStatus.OPEN
+        assert t.reviewed_by is None and t.review_notes is None
+
+        t.status = TaskStatus.SUBMITTED
+        t.complete(reviewer_id="r2", notes="done")
+        assert t.status == TaskStatus.COMPLETED
+        assert (t.reviewed_by, t.review_notes, t.completed_count) == ("r2", "done", 2)
+
     def test_submit_then_reject(self):
         """Reject submission"""
         t = _make_task()
@@ -434,3 +544,113 @@ class TestTaskBasic:
         assert restored.is_multi_participant is True
         assert restored.allow_repeat_by_same is True
         assert restored.max_completions == 5
+
+    def test_to_dict_exclude_none_round_trip(self):
+        """Compact dict omits None fields and still round-trips"""
+        original = _make_task()
+        d = original.to_dict(exclude_none=True)
+
+        assert "assignee_id" not in d
+        assert "deadline" not in d
+        assert None not in d.values()
+
+        restored = Task.from_dict(d)
+        assert restored.assignee_id is None
+        assert restored.deadline is None
+        assert restored.title == original.title
+
+    def test_slotted(self):
+        """Instances carry no per-object __dict__"""
+        assert not hasattr(_make_task(), "__dict__")
+
+    def test_to_bytes_matches_to_dict_json(self):
+        """orjson's native datetime encoding matches isoformat()"""
+        t = _make_task(deadline=datetime(2025, 1, 2, 3, 4, 5, 678901, tzinfo=UTC))
+        t.accept("agent-1", "Agent One")
+
+        assert json.loads(t.to_bytes()) == json.loads(json.dumps(t.to_dict()))
+
+    def test_from_dict_syncs_compat_flags_without_validating(self):
+        """from_dict trusts stored data but still syncs is_repeatable"""
+        d = _make_task(is_repeatable=True).to_dict()
+        d["is_multi_participant"] = False
+        assert Task.from_dict(d).is_multi_participant is True
+
+        d["title"] = ""
+        assert Task.from_dict(d).title == ""
+
+    def test_matches_skills_accepts_list_or_set(self):
+        t = _make_task(required_skills=["python", "sql"])
+        assert t.matches_skills(["sql", "python", "go"]) is True
+        assert t.matches_skills({"python"}) is False
+        assert _make_task().matches_skills([]) is True
+
+    def test_matches_skills_set(self):
+        t = _make_task(required_skills=["python", "sql"])
+        assert t.matches_skills_set(frozenset({"sql", "python"})) is True
+        assert t.matches_skills_set({"python"}) is False
+        assert _make_task().matches_skills_set(frozenset()) is True
+
+    def test_filter_tasks_for_agent(self):
+        tasks = [
+            _make_task(task_id="t1", required_skills=["python"]),
+            _make_task(task_id="t2", required_skills=["rust"]),
+            _make_task(task_id="t3"),
+        ]
+        matched = filter_tasks_for_agent(tasks, ["python", "sql"])
+        assert [t.task_id for t in matched] == ["t1", "t3"]
+
+    def test_filter_past_deadline_uses_reference_time(self):
+        now = datetime(2025, 6, 1, tzinfo=UTC)
+        tasks = [
+            _make_task(task_id="late", deadline=now - timedelta(hours=1)),
+            _make_task(task_id="ok", deadline=now + timedelta(hours=1)),
+            _make_task(task_id="none"),
+        ]
+        assert [t.task_id for t in filter_past_deadline(tasks, now)] == ["late"]
+        assert tasks[2].is_past_deadline() is False
+
+    def test_complete_releases_reward_from_budget(self):
+        t = _make_task(reward_amount="10", total_budget="20")
+        t.accept("a1", "Bot")
+        t.submit("w")
+        t.complete()
+        assert t.released_amount == "10"
+        assert t.remaining_budget() == 10.0
+
+    def test_release_reward_is_exact_for_decimal_amounts(self):
+        t = _make_task(reward_amount="0.1", total_budget="0.3")
+        for _ in range(3):
+            assert t.can_release_reward() is True
+            t.release_reward()
+        assert t.released_amount == "0.3"
+        assert t.can_release_reward() is False
+
+    def test_complete_rejects_when_budget_exhausted(self):
+        t = _make_task(reward_amount="10", total_budget="20", released_amount="15")
+        t.accept("a1", "Bot")
+        t.submit("w")
+        with pytest.raises(ValueError, match="Insufficient budget"):
+            t.complete()
+        assert t.status == TaskStatus.SUBMITTED
+        assert t.completed_count == 0
+
+    def test_to_dict_reflects_reassigned_datetime(self):
+        """Memoized ISO strings never go stale when a datetime field changes"""
+        t = _make_task(deadline=datetime(2025, 1, 1, tzinfo=UTC))
+        assert t.to_dict()["deadline"] == "2025-01-01T00:00:00+00:00"
+
+        t.deadline = datetime(2025, 2, 1, tzinfo=UTC)
+        assert t.to_dict()["deadline"] == "2025-02-01T00:00:00+00:00"
+
+    def test_lifecycle_timestamps_use_clock(self, monkeypatch):
+        fixed = datetime(2025, 3, 1, 12, 0, tzinfo=UTC)
+        monkeypatch.setattr(Task, "_clock", staticmethod(lambda: fixed))
+
+        t = _make_task(deadline=fixed - timedelta(seconds=1))
+        t.accept("a1", "Bot")
+        t.submit("w")
+        t.complete()
+
+        assert t.assigned_at == t.submitted_at == t.completed_at == fixed
+        assert t.is_past_deadline() is True
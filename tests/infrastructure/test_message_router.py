@@ -0,0 +1,248 @@
+"""Tests for MessageRouter's Redis-backed message log and dead letter queue,
+and for incoming-message dispatch
+
+Runs against fakeredis; the A2A client (or, for most DLQ tests, route itself)
+is mocked so only the Redis bookkeeping is exercised.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import fakeredis.aioredis
+import orjson
+import pytest
+
+from acn.infrastructure.messaging import dlq_keys, message_router
+from acn.infrastructure.messaging.message_router import (
+    MessageRouter,
+    create_text_message,
+)
+from acn.infrastructure.persistence.redis.registry import AgentRegistry
+from acn.models import AgentInfo
+
+# ============================================================================
+# Fixtures & Helpers
+# ============================================================================
+
+
+@pytest.fixture
+async def redis_client():
+    client = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    yield client
+    await client.aclose()
+
+
+@pytest.fixture
+async def router(redis_client):
+    router = MessageRouter(AsyncMock(spec=AgentRegistry), redis_client)
+    router.route = AsyncMock()
+    yield router
+    await router.close()
+
+
+def _client_router(redis_client, send_message: AsyncMock) -> MessageRouter:
+    """Router that delivers to agent-b through a mocked A2A client"""
+    registry = AsyncMock(spec=AgentRegistry)
+    registry.get_agent.return_value = AgentInfo(
+        agent_id="agent-b", owner="system", name="B", endpoint="https://b.example.com"
+    )
+    router = MessageRouter(registry, redis_client)
+    client = MagicMock()
+    client.send_message = send_message
+    router._get_client = AsyncMock(return_value=client)
+    return router
+
+
+@pytest.fixture
+async def log_router(redis_client):
+    """Router whose deliveries succeed"""
+    router = _client_router(redis_client, AsyncMock(return_value=create_text_message("ok")))
+    yield router
+    await router.close()
+
+
+@pytest.fixture
+async def down_router(redis_client):
+    """Router whose deliveries always fail, with the real route()"""
+    router = _client_router(redis_client, AsyncMock(side_effect=ConnectionError("down")))
+    yield router
+    await router.close()
+
+
+async def _dlq_headers(redis_client) -> list[dict]:
+    headers = []
+    for key in dlq_keys():
+        headers.extend(orjson.loads(raw) for raw in await redis_client.lrange(key, 0, -1))
+    return headers
+
+
+async def _payload(redis_client, route_id: str) -> dict | None:
+    raw = await redis_client.get(f"acn:dlq:msg:{route_id}")
+    return orjson.loads(raw) if raw is not None else None
+
+
+# ============================================================================
+# Message log
+# ============================================================================
+
+
+class TestMessageLog:
+    async def test_close_flushes_routed_message(self, log_router, redis_client):
+        await log_router.route("agent-a", "agent-b", create_text_message("hi"))
+        await log_router.close()
+
+        [(_, fields)] = await redis_client.xrange("acn:messages:stream")
+        entry = orjson.loads(fields["entry"])
+        assert (entry["from_agent"], entry["to_agent"]) == ("agent-a", "agent-b")
+        assert entry["message"]["parts"][0]["text"] == "hi"
+        assert await redis_client.xlen("acn:messages:agent:agent-a:stream") == 1
+        assert await redis_client.xlen("acn:messages:agent:agent-b:stream") == 1
+        assert await redis_client.ttl(f"acn:messages:log:{entry['route_id']}") > 0
+
+        history = await log_router.get_message_history("agent-b")
+        assert [h["route_id"] for h in history] == [entry["route_id"]]
+
+    async def test_full_queue_drops_without_blocking(self, redis_client, monkeypatch):
+        monkeypatch.setattr(message_router, "_LOG_QUEUE_SIZE", 3)
+        router = MessageRouter(AsyncMock(spec=AgentRegistry), redis_client)
+
+        # _log_message is synchronous: it returns at once whether or not there is room
+        for i in range(5):
+            router._log_message(f"r{i}", "agent-a", "agent-b", {"n": i}, "outbound")
+
+        assert router._log_dropped == 2
+        await router.close()
+        assert await redis_client.xlen("acn:messages:stream") == 3
+
+
+# ============================================================================
+# Incoming message dispatch
+# ============================================================================
+
+
+class TestHandleIncoming:
+    async def test_failing_handlers_do_not_stop_others(self, router):
+        received = []
+
+        async def ok(from_agent, message):
+            received.append(from_agent)
+
+        async def fails(from_agent, message):
+            raise RuntimeError("boom")
+
+        def not_async(from_agent, message):
+            return None
+
+        def raises_on_call(from_agent, message):
+            raise RuntimeError("boom")
+
+        for handler in (raises_on_call, not_async, fails, ok):
+            await router.register_handler("*", handler)
+
+        await router.handle_incoming("agent-a", create_text_message("hi"))
+
+        assert received == ["agent-a"]
+
+
+# ============================================================================
+# Dead letter queue lifecycle
+# ============================================================================
+
+
+class TestDeadLetterQueue:
+    async def test_store_splits_header_and_payload(self, router, redis_client):
+        await router._store_dlq("r1", "agent-a", "agent-b", create_text_message("hi"), "boom")
+
+        assert await _dlq_headers(redis_client) == [{"route_id": "r1", "retry_count": 0}]
+        payload = await _payload(redis_client, "r1")
+        assert payload["to_agent"] == "agent-b"
+        assert payload["message"]["parts"][0]["text"] == "hi"
+
+    async def test_successful_retry_deletes_payload(self, router, redis_client):
+        await router._store_dlq("r1", "agent-a", "agent-b", create_text_message("hi"), "boom")
+
+        assert await router.retry_dlq() == 1
+
+        call = router.route.await_args.kwargs
+        assert (call["from_agent"], call["to_agent"]) == ("agent-a", "agent-b")
+        assert call["message"].parts[0].root.text == "hi"
+        assert await _dlq_headers(redis_client) == []
+        assert await _payload(redis_client, "r1") is None
+
+    async def test_failed_retry_requeues_header_only(self, router, redis_client):
+        await router._store_dlq("r1", "agent-a", "agent-b", create_text_message("hi"), "boom")
+        router.route.side_effect = ConnectionError("still down")
+
+        assert await router.retry_dlq() == 0
+
+        assert await _dlq_headers(redis_client) == [{"route_id": "r1", "retry_count": 1}]
+        assert (await _payload(redis_client, "r1"))["message"]["parts"][0]["text"] == "hi"
+
+    async def test_legacy_inline_entry_is_split_on_requeue(self, router, redis_client):
+        legacy = {
+            "route_id": "old1",
+            "from_agent": "agent-a",
+            "to_agent": "agent-b",
+            "message": {"role": "user", "parts": [{"kind": "text", "text": "legacy"}]},
+            "error": "boom",
+            "retry_count": 0,
+        }
+        await redis_client.lpush("acn:dlq", orjson.dumps(legacy))
+        router.route.side_effect = ConnectionError("still down")
+
+        assert await router.retry_dlq() == 0
+
+        assert router.route.await_args.kwargs["message"].parts[0].root.text == "legacy"
+        assert await redis_client.llen("acn:dlq") == 0
+        assert await _dlq_headers(redis_client) == [{"route_id": "old1", "retry_count": 1}]
+        payload = await _payload(redis_client, "old1")
+        assert payload["message"] == legacy["message"]
+        assert "retry_count" not in payload
+
+    async def test_max_retries_discards_entry(self, router, redis_client):
+        await router._store_dlq("r1", "agent-a", "agent-b", create_text_message("hi"), "boom")
+        router.route.side_effect = ConnectionError("still down")
+
+        for _ in range(3):
+            await router.retry_dlq(max_retries=3)
+        assert await _dlq_headers(redis_client) == [{"route_id": "r1", "retry_count": 3}]
+
+        assert await router.retry_dlq(max_retries=3) == 0
+        assert router.route.await_count == 3
+        assert await _dlq_headers(redis_client) == []
+        assert await _payload(redis_client, "r1") is None
+
+    async def test_expired_payload_discards_header(self, router, redis_client):
+        await router._store_dlq("r1", "agent-a", "agent-b", create_text_message("hi"), "boom")
+        await redis_client.delete("acn:dlq:msg:r1")
+
+        assert await router.retry_dlq() == 0
+
+        router.route.assert_not_awaited()
+        assert await _dlq_headers(redis_client) == []
+
+    async def test_batch_limit_leaves_rest_queued(self, router, redis_client):
+        for i in range(5):
+            await router._store_dlq(f"r{i}", "agent-a", "agent-b", create_text_message("x"), "e")
+
+        assert await router.retry_dlq(batch_limit=3) == 3
+
+        assert len(await _dlq_headers(redis_client)) == 2
+        assert await router.retry_dlq() == 2
+        assert await _dlq_headers(redis_client) == []
+
+    async def test_failed_retry_through_route_adds_no_entry(self, down_router, redis_client):
+        with pytest.raises(ConnectionError):
+            await down_router.route("agent-a", "agent-b", create_text_message("hi"))
+        await asyncio.gather(*down_router._bg_tasks)
+        [header] = await _dlq_headers(redis_client)
+
+        for _ in range(3):
+            assert await down_router.retry_dlq(max_retries=3) == 0
+        await asyncio.gather(*down_router._bg_tasks)
+        assert await _dlq_headers(redis_client) == [
+            {"route_id": header["route_id"], "retry_count": 3}
+        ]
+
+        await down_router.retry_dlq(max_retries=3)
+        assert await _dlq_headers(redis_client) == []
@@ -0,0 +1,76 @@
+"""Tests for open-task filtering in the task repositories
+
+Both backends must agree on what a skills filter means: a task matches when
+every skill it requires is in the given list (required ⊆ skills). Redis runs
+on fakeredis; the PostgreSQL statement is checked in compiled form.
+"""
+
+import fakeredis.aioredis
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from acn.core.entities.task import Task, TaskMode
+from acn.infrastructure.persistence.postgres.task_repository import PostgresTaskRepository
+from acn.infrastructure.persistence.redis.task_repository import RedisTaskRepository
+
+# ============================================================================
+# Helpers
+# ============================================================================
+
+
+def _make_task(task_id: str, required_skills: list[str]) -> Task:
+    return Task(
+        task_id=task_id,
+        mode=TaskMode.OPEN,
+        creator_type="human",
+        creator_id="creator-001",
+        creator_name="Alice",
+        title=f"Task {task_id}",
+        description="Open task",
+        required_skills=required_skills,
+    )
+
+
+@pytest.fixture
+async def redis_repo():
+    client = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    repo = RedisTaskRepository(client)
+    for task in (
+        _make_task("no-skills", []),
+        _make_task("needs-a", ["a"]),
+        _make_task("needs-a-b", ["a", "b"]),
+        _make_task("needs-a-c", ["a", "c"]),
+    ):
+        await repo.save(task)
+    yield repo
+    await client.aclose()
+
+
+# ============================================================================
+# Skills filter semantics
+# ============================================================================
+
+
+class TestOpenTaskSkillsFilter:
+    async def test_scan_returns_tasks_covered_by_skills(self, redis_repo):
+        tasks, _ = await redis_repo.scan_open_tasks(skills=["a", "b"])
+
+        assert {t.task_id for t in tasks} == {"no-skills", "needs-a", "needs-a-b"}
+
+    async def test_find_matches_scan(self, redis_repo):
+        tasks = await redis_repo.find_open_tasks(skills=["a", "b"])
+
+        assert {t.task_id for t in tasks} == {"no-skills", "needs-a", "needs-a-b"}
+
+    async def test_no_skills_filter_returns_all(self, redis_repo):
+        tasks, _ = await redis_repo.scan_open_tasks()
+
+        assert len(tasks) == 4
+
+    def test_postgres_filter_is_contained_by(self):
+        stmt = PostgresTaskRepository._open_tasks_stmt(None, ["a", "b"], None)
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+
+        # required_skills <@ skills, with NULL (no required skills) matching too
+        assert "tasks.required_skills IS NULL OR (tasks.required_skills <@" in sql
+        assert "@>" not in sql
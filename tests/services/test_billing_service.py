@@ -0,0 +1,79 @@
+"""Unit Tests for BillingService — Network Fee Ledger
+
+Tests the integer micro-credit fee ledger on the Redis fallback (fakeredis)
+and its hand-off to a mocked billing repository.
+"""
+
+from unittest.mock import AsyncMock
+
+import fakeredis.aioredis
+import pytest
+
+from acn.core.interfaces.billing_repository import IBillingRepository
+from acn.services.billing_service import BillingService, from_micros, to_micros
+
+
+@pytest.fixture
+async def redis_client():
+    client = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    yield client
+    await client.aclose()
+
+
+class TestMicroCredits:
+    """Test credit <-> micro-credit conversion"""
+
+    def test_to_micros_absorbs_float_error(self):
+        """0.1 + 0.2 is 0.30000000000000004 as a float, but exactly 300000 micros"""
+        assert to_micros(0.1 + 0.2) == 300000
+
+    def test_round_trip(self):
+        assert to_micros(1.5) == 1_500_000
+        assert from_micros(to_micros(0.0125)) == 0.0125
+
+
+class TestNetworkFeeLedger:
+    """Test network fee recording, reversal and totals"""
+
+    @pytest.mark.asyncio
+    async def test_record_then_reverse_nets_to_zero(self, redis_client):
+        service = BillingService(redis_client)
+
+        await service._record_network_fee("tx-1", 0.1)
+        await service._record_network_fee("tx-2", 0.2)
+        await service._reverse_network_fee("tx-1", 0.1)
+        await service._reverse_network_fee("tx-2", 0.2)
+
+        assert await redis_client.get("acn:billing:network_fees:total_micros") == "0"
+        stats = await service.get_network_fee_stats()
+        assert stats["total_network_fees_credits"] == 0
+
+    @pytest.mark.asyncio
+    async def test_stats_sum_legacy_float_and_micros(self, redis_client):
+        """Totals recorded before the integer ledger are still counted"""
+        await redis_client.set("acn:billing:network_fees:total", "1.5")
+        await redis_client.set("acn:billing:network_fees:total_micros", "250000")
+
+        stats = await BillingService(redis_client).get_network_fee_stats()
+
+        assert stats["total_network_fees_credits"] == 1.75
+
+    @pytest.mark.asyncio
+    async def test_stats_empty_ledger(self, redis_client):
+        stats = await BillingService(redis_client).get_network_fee_stats()
+
+        assert stats["total_network_fees_credits"] == 0
+
+    @pytest.mark.asyncio
+    async def test_repository_receives_micros(self, redis_client):
+        repository = AsyncMock(spec=IBillingRepository)
+        repository.get_total_network_fees.return_value = 250000
+        service = BillingService(redis_client, repository=repository)
+
+        await service._record_network_fee("tx-1", 0.1 + 0.2)
+        await service._reverse_network_fee("tx-1", 0.1 + 0.2)
+
+        repository.record_network_fee.assert_awaited_once_with("tx-1", 300000)
+        repository.reverse_network_fee.assert_awaited_once_with("tx-1", 300000)
+        stats = await service.get_network_fee_stats()
+        assert stats["total_network_fees_credits"] == 0.25
@@ -425,3 +425,34 @@ class TestResolveParticipation:
 
         with pytest.raises(PermissionError, match="belongs to another"):
             await service._resolve_participation("task-001", "agent-001", "part-001")
+
+
+# ============================================================================
+# list_tasks
+# ============================================================================
+
+
+class TestListTasks:
+    """Test list_tasks repository dispatch"""
+
+    async def test_creator_and_status_uses_combined_lookup(self, service, mock_repo):
+        """Creator + status filters are intersected by the repository"""
+        task = _make_task(status=TaskStatus.COMPLETED)
+        mock_repo.find_by_creator_and_status.return_value = [task]
+
+        result = await service.list_tasks(creator_id="creator-001", status=TaskStatus.COMPLETED)
+
+        assert result == [task]
+        mock_repo.find_by_creator_and_status.assert_awaited_once_with(
+            "creator-001", TaskStatus.COMPLETED, 50
+        )
+        mock_repo.find_by_creator.assert_not_awaited()
+
+    async def test_creator_only_uses_creator_index(self, service, mock_repo):
+        """Without a status filter the creator index is used directly"""
+        mock_repo.find_by_creator.return_value = []
+
+        await service.list_tasks(creator_id="creator-001")
+
+        mock_repo.find_by_creator.assert_awaited_once_with("creator-001", 50)
+        mock_repo.find_by_creator_and_status.assert_not_awaited()